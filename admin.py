@@ -926,9 +926,15 @@ def _render_room_viewer_metrics(visible_rooms, room_model):
     # 지연 import — websocket_handler 는 streamlit 환경 변수 등 부수효과가
     # 있으므로 모듈 import-time 비용을 admin 페이지 진입 시로 미룬다.
     try:
-        from websocket_handler import get_broadcast_manager
+        from realtime_service import RemoteViewerMetrics, use_external_service
 
-        manager = get_broadcast_manager()
+        if use_external_service():
+            # 데이터 플레인이 별도 프로세스 — control API 로 조회한다.
+            manager = RemoteViewerMetrics()
+        else:
+            from websocket_handler import get_broadcast_manager
+
+            manager = get_broadcast_manager()
     except Exception as e:
         # RL-006: 내부 예외는 server-side 만 로그, 사용자에게는 generic.
         print(f"[Admin] BroadcastManager 로딩 실패: {e!r}")
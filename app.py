@@ -22,6 +22,7 @@ from auth import (
     init_session_state,
     is_authenticated,
 )
+from broadcast_hub import use_hub_backend
 from database import get_room_model
 from operator_ui import (
     build_bootstrap_payload,
@@ -30,6 +31,7 @@ from operator_ui import (
     select_default_room,
 )
 from qr_generator import build_view_url, make_qr_data_url
+from realtime_service import fetch_health, use_external_service
 from services import (
     create_openai_session,
     get_aws_access_key_id,
@@ -246,17 +248,26 @@ with st.sidebar:
         st.markdown("---")
         st.subheader("연결 정보")
         st.code(f"WebSocket: ws://localhost:{ws_port}")
-        if (
-            st.session_state.get("websocket_thread")
-            and st.session_state["websocket_thread"].is_alive()
-        ):
+        if use_external_service():
+            ws_running = fetch_health() is not None
+        else:
+            ws_running = bool(
+                st.session_state.get("websocket_thread")
+                and st.session_state["websocket_thread"].is_alive()
+            )
+        if ws_running:
             st.success("WebSocket 서버 실행 중")
         else:
             st.warning("WebSocket 서버 대기 중")
 
 
 # === WebSocket 서버 스레드 ===
-if (
+# REALTIME_SERVICE_URL 이 설정되면 ``python -m realtime_service`` 가 별도
+# 프로세스에서 WebSocket/SSE 서버를 구동한다 — 여기서는 스레드를 띄우지 않고
+# 포트만 기록한다 (상태/지표는 control API 로 조회).
+if use_external_service():
+    st.session_state["websocket_port_ref"]["port"] = int(os.getenv("WS_PORT", "8765"))
+elif (
     "websocket_thread" not in st.session_state
     or not st.session_state["websocket_thread"].is_alive()
 ):
@@ -280,7 +291,13 @@ if (
 # === SSE 뷰어 브로드캐스트 서버 (ISSUE-30) ===
 # 별도 daemon thread 로 aiohttp 기반 viewer SSE 엔드포인트를 구동한다.
 # 포트는 SSE_PORT 환경변수, 기본 8766.
-if (
+# SSE_BROADCAST_BACKEND=unix 이면 SSE 는 별도 워커 프로세스
+# (``python -m broadcast_hub``) 가 맡고, 여기서는 띄우지 않는다.
+if use_external_service():
+    pass  # 독립 서비스가 metrics_repo 연결까지 맡는다.
+elif use_hub_backend():
+    attach_broadcast_metrics_repo(get_room_model())
+elif (
     "sse_thread" not in st.session_state
     or not st.session_state["sse_thread"].is_alive()
 ):
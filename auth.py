@@ -18,6 +18,8 @@ import streamlit as st
 from extra_streamlit_components import CookieManager
 
 from database import get_user_model
+from quota_ledger import get_quota_ledger
+from usage_writer import get_usage_writer, use_write_behind
 
 
 def _get_session_secret() -> str:
@@ -232,17 +234,44 @@ def get_user_remaining_seconds() -> int | None:
     return user_model.get_remaining_seconds(user["id"])
 
 
+def load_remaining_snapshot(user_id: int) -> tuple[int | None, int | None]:
+    """quota ledger 적재용 ``(남은 시간, 반영된 마지막 write-behind 기록 번호)``.
+
+    남은 시간은 DB 값에서 아직 커밋되지 않은 사용량을 뺀 값이다. 동기 기록
+    이면 기록 번호는 None 이다.
+    """
+    user_model = get_user_model()
+    if not use_write_behind():
+        return user_model.get_remaining_seconds(user_id), None
+    remaining, pending, upto = get_usage_writer().snapshot(
+        user_id, user_model.get_remaining_seconds
+    )
+    return (None if remaining is None else remaining - pending), upto
+
+
+def load_remaining_seconds(user_id: int) -> int | None:
+    """DB 의 남은 시간에서 아직 커밋되지 않은(write-behind) 사용량을 뺀 값."""
+    return load_remaining_snapshot(user_id)[0]
+
+
+def get_ledger_remaining_seconds(user_id: int) -> int | None:
+    """WebSocket 경로의 남은 시간 — quota ledger 에서 O(1) 조회.
+
+    항목이 없거나 reconcile 주기가 지났으면 :func:`load_remaining_snapshot`
+    으로 다시 읽는다.
+    """
+    return get_quota_ledger().remaining(user_id, load_remaining_snapshot)
+
+
 def check_usage_limit(duration_seconds: int, user_info: dict = None) -> bool:
     """사용량 제한 확인 (사용 가능한지 체크)"""
     # WebSocket에서 사용자 정보가 직접 전달된 경우
     if user_info:
-        user_model = get_user_model()
-        remaining = user_model.get_remaining_seconds(user_info["id"])
-
         # 관리자는 사용량 제한 없음
         if user_info.get("role") == "admin":
             return True
 
+        remaining = get_ledger_remaining_seconds(user_info["id"])
         return remaining is not None and remaining >= duration_seconds
 
     # Streamlit context에서 사용자 정보 가져오기 (기존 방식)
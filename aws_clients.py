@@ -0,0 +1,168 @@
+"""
+AWS boto3 클라이언트 풀 모듈
+프로세스 전역에서 translate / bedrock-runtime 클라이언트를 재사용한다.
+
+설계 요약
+---------
+- boto3 클라이언트 생성은 자격 증명/엔드포인트 해석과 botocore 서비스 모델
+  로딩 때문에 수백 ms 가 걸린다. 오퍼레이터 WS 연결마다 새로 만들면 재접속이
+  매번 멈칫하므로, (service, region, 자격 증명) 키로 한 번만 만들고 공유한다.
+- boto3 클라이언트 자체는 thread-safe 하지만 기본 세션을 통한 *생성* 은
+  그렇지 않다 — 생성 경로만 lock 으로 직렬화한다.
+- 커넥션 풀 크기는 ``AWS_MAX_POOL_CONNECTIONS`` (기본 50) 로 조절한다.
+  botocore 기본값 10 은 여러 룸이 동시에 번역할 때 커넥션 대기를 만든다.
+- 연결 계층 오류(엔드포인트 연결 실패, 타임아웃 등)가 연속
+  ``failure_threshold`` 회 보고되면 해당 클라이언트를 풀에서 내려 다음
+  ``get`` 때 재생성한다 (health check). 서비스 레벨 오류(Throttling,
+  ValidationException)는 클라이언트 문제가 아니므로 세지 않는다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from typing import Any
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import (
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    ReadTimeoutError,
+)
+
+# 서비스별 HTTP 커넥션 풀 크기 (botocore 기본 10).
+AWS_MAX_POOL_CONNECTIONS = int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "50"))
+
+# 이 횟수만큼 연속으로 연결 오류가 보고되면 클라이언트를 재생성한다.
+_DEFAULT_FAILURE_THRESHOLD = 3
+
+# 클라이언트 교체가 필요한 연결 계층 오류들.
+_CONNECTION_ERRORS = (
+    EndpointConnectionError,
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    ReadTimeoutError,
+)
+
+
+def _credential_fingerprint(secret_key: str | None) -> str:
+    """풀 키에 비밀 키 원문을 남기지 않기 위한 짧은 지문."""
+    if not secret_key:
+        return ""
+    return hashlib.sha256(secret_key.encode("utf-8")).hexdigest()[:16]
+
+
+class AwsClientPool:
+    """(service, region, 자격 증명) 키 기준 boto3 클라이언트 레지스트리.
+
+    자격 증명이 바뀌면(키 로테이션) 키가 달라지므로 자연스럽게 새 클라이언트가
+    만들어진다. ``report_failure`` / ``report_success`` 로 연결 상태를
+    보고받아 unhealthy 클라이언트를 교체한다.
+    """
+
+    def __init__(
+        self,
+        max_pool_connections: int | None = None,
+        *,
+        failure_threshold: int = _DEFAULT_FAILURE_THRESHOLD,
+    ) -> None:
+        self._max_pool_connections = max_pool_connections or AWS_MAX_POOL_CONNECTIONS
+        self._failure_threshold = failure_threshold
+        self._lock = threading.Lock()
+        # pool key -> client
+        self._clients: dict[tuple[str, str, str, str], Any] = {}
+        # id(client) -> pool key (report_failure 가 클라이언트만 받아도 되도록)
+        self._keys_by_client: dict[int, tuple[str, str, str, str]] = {}
+        # pool key -> 연속 연결 오류 수
+        self._failures: dict[tuple[str, str, str, str], int] = {}
+
+    def get(
+        self,
+        service: str,
+        *,
+        region: str,
+        access_key: str | None,
+        secret_key: str | None,
+    ) -> Any:
+        """캐시된 클라이언트를 반환하고, 없으면 만들어 등록한다.
+
+        생성 실패(잘못된 리전 등)는 호출자에게 그대로 전파한다 — 실패한
+        클라이언트는 풀에 들어가지 않는다.
+        """
+        key = (service, region, access_key or "", _credential_fingerprint(secret_key))
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            # Double-checked: 다른 스레드가 lock 대기 중 먼저 만들었을 수 있다.
+            client = self._clients.get(key)
+            if client is None:
+                client = boto3.client(
+                    service,
+                    aws_access_key_id=access_key,
+                    aws_secret_access_key=secret_key,
+                    region_name=region,
+                    config=Config(max_pool_connections=self._max_pool_connections),
+                )
+                self._clients[key] = client
+                self._keys_by_client[id(client)] = key
+                self._failures.pop(key, None)
+        return client
+
+    def report_failure(self, client: Any, error: BaseException) -> bool:
+        """클라이언트 호출 실패를 보고한다. 교체(evict)했으면 True.
+
+        연결 계층 오류만 센다. 임계치에 도달하면 풀에서 제거해 다음 ``get``
+        이 새 커넥션 풀을 가진 클라이언트를 만들게 한다.
+        """
+        if client is None or not isinstance(error, _CONNECTION_ERRORS):
+            return False
+        with self._lock:
+            key = self._keys_by_client.get(id(client))
+            if key is None:
+                return False
+            count = self._failures.get(key, 0) + 1
+            if count < self._failure_threshold:
+                self._failures[key] = count
+                return False
+            self._evict_locked(key)
+        print(f"[AWS] {key[0]} 클라이언트 연결 오류 누적 — 재생성 예정")
+        return True
+
+    def report_success(self, client: Any) -> None:
+        """호출 성공 시 연속 실패 카운터를 초기화한다."""
+        if client is None:
+            return
+        with self._lock:
+            key = self._keys_by_client.get(id(client))
+            if key is not None:
+                self._failures.pop(key, None)
+
+    def clear(self) -> None:
+        """풀 전체를 비운다 (테스트 / 자격 증명 전면 교체용)."""
+        with self._lock:
+            self._clients.clear()
+            self._keys_by_client.clear()
+            self._failures.clear()
+
+    def size(self) -> int:
+        """현재 캐시된 클라이언트 수."""
+        return len(self._clients)
+
+    def _evict_locked(self, key: tuple[str, str, str, str]) -> None:
+        client = self._clients.pop(key, None)
+        if client is not None:
+            self._keys_by_client.pop(id(client), None)
+        self._failures.pop(key, None)
+
+
+# 프로세스 전역 풀 싱글턴.
+_client_pool = AwsClientPool()
+
+
+def get_client_pool() -> AwsClientPool:
+    """프로세스 전역 AwsClientPool 싱글턴을 반환한다."""
+    return _client_pool
@@ -0,0 +1,278 @@
+"""
+asyncio 네이티브 Bedrock 스트리밍 클라이언트
+``invoke_model_with_response_stream`` 을 스레드 없이 이벤트 루프에서 호출한다.
+
+설계 요약
+---------
+- boto3 스트림은 블로킹 이터레이터라 발화 하나당 워커 스레드 하나를 생성
+  시간 내내 붙잡는다. 여기서는 aiohttp 로 같은 REST 엔드포인트를 직접
+  호출한다 — 동시 스트림 수백 개가 스레드 없이 이벤트 루프 위에서 돈다.
+- 자격 증명은 boto3 동기 경로와 같은 규칙으로 고른다 — 명시 키가 있으면
+  그대로, 없으면 botocore 기본 체인(env / 공유 설정 / SSO / 인스턴스 프로파일
+  등)에서 찾고, 만료가 가까운 임시 자격 증명은 서명 직전에 갱신한다.
+- 요청 서명은 botocore 의 SigV4Auth 를, 응답의 AWS event-stream 바이너리
+  프레이밍(prelude / 헤더 / CRC32) 파싱은 botocore 의 EventStreamBuffer 를
+  그대로 쓴다 — 새 의존성 없이 boto3 와 같은 구현을 공유한다.
+- ``endpoint_url`` 로 로컬 fake event-stream 서버를 가리켜 테스트할 수 있다.
+- ``BEDROCK_ASYNC_STREAMING`` 이 켜져 있을 때만 websocket_handler 가 이
+  경로를 쓴다 (기본 off — 기존 boto3 스레드 경로가 기본값).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import os
+import threading
+from collections.abc import AsyncIterator, Awaitable
+from typing import Any
+from urllib.parse import quote
+
+import aiohttp
+import botocore.session
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
+from botocore.eventstream import EventStreamBuffer
+from yarl import URL
+
+import fastpath
+
+# 네이티브 async 스트리밍 경로 사용 여부 (기본 off).
+BEDROCK_ASYNC_STREAMING = os.getenv("BEDROCK_ASYNC_STREAMING", "0").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+# 연결 / 청크 간 읽기 타임아웃 (초).
+BEDROCK_ASYNC_CONNECT_TIMEOUT = float(os.getenv("BEDROCK_ASYNC_CONNECT_TIMEOUT", "5"))
+BEDROCK_ASYNC_READ_TIMEOUT = float(os.getenv("BEDROCK_ASYNC_READ_TIMEOUT", "30"))
+
+# SigV4 서명 서비스 이름 (bedrock-runtime 엔드포인트도 "bedrock" 으로 서명한다).
+_SIGNING_NAME = "bedrock"
+
+
+class BedrockStreamError(Exception):
+    """HTTP 오류 응답 또는 스트림 내 exception 이벤트."""
+
+    def __init__(self, message: str, status: int | None = None, code: str = ""):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+
+
+class AsyncBedrockClient:
+    """aiohttp + SigV4 기반 Bedrock Runtime 스트리밍 클라이언트.
+
+    ClientSession 은 처음 호출한 이벤트 루프에 묶여 생성되고, 다른 루프에서
+    호출되면 이전 세션을 닫고 새로 만든다 (WS 서버는 전용 스레드의 루프에서
+    돈다). 서버 종료 시 :func:`close_async_bedrock_clients` 로 닫는다.
+
+    ``access_key`` / ``secret_key`` 가 없으면 botocore 기본 자격 증명 체인을
+    쓴다 — 첫 요청 때 한 번 찾고, 갱신 가능한 자격 증명은 서명마다
+    ``get_frozen_credentials`` 로 만료 전에 갱신된 값을 받는다.
+    """
+
+    def __init__(
+        self,
+        region: str,
+        access_key: str | None,
+        secret_key: str | None,
+        *,
+        session_token: str | None = None,
+        endpoint_url: str | None = None,
+    ) -> None:
+        self._region = region
+        self._credentials: Credentials | None = (
+            Credentials(access_key, secret_key, session_token)
+            if access_key and secret_key
+            else None
+        )
+        self._endpoint = (
+            endpoint_url or f"https://bedrock-runtime.{region}.amazonaws.com"
+        ).rstrip("/")
+        self._session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+
+    # ------------------------------------------------------------------
+    # Session / signing
+    # ------------------------------------------------------------------
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            # 다른 루프의 세션은 여기서 쓸 수 없다 — 커넥터가 새지 않게 닫는다.
+            self._release_session()
+            timeout = aiohttp.ClientTimeout(
+                total=None,
+                sock_connect=BEDROCK_ASYNC_CONNECT_TIMEOUT,
+                sock_read=BEDROCK_ASYNC_READ_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(timeout=timeout)
+            self._session_loop = loop
+        return self._session
+
+    def _release_session(self) -> Awaitable[None] | None:
+        """현재 세션을 떼어 내고 소유 루프에서 닫는다.
+
+        소유 루프가 지금 루프면 await 할 ``close()`` 코루틴을, 다른 스레드에서
+        돌고 있으면 그 루프로 예약한 뒤 None 을 돌려준다. 이미 닫힌 루프의
+        소켓은 루프 종료 때 함께 정리됐으므로 참조만 버린다.
+        """
+        session, loop = self._session, self._session_loop
+        self._session = None
+        self._session_loop = None
+        if session is None or session.closed or loop is None:
+            return None
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if loop is running:
+            return session.close()
+        if not loop.is_closed():
+            try:
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
+            except RuntimeError:
+                pass  # 예약 직전에 루프가 닫혔다.
+        return None
+
+    async def _frozen_credentials(self):
+        """서명에 쓸 (필요하면 갱신된) 자격 증명 스냅샷."""
+        credentials = self._credentials
+        if credentials is None:
+            # 기본 체인 조회는 IMDS / SSO 캐시 등 블로킹 I/O 일 수 있다.
+            credentials = await asyncio.to_thread(_default_credentials)
+            if credentials is None:
+                raise BedrockStreamError("AWS 자격 증명을 찾을 수 없습니다")
+            self._credentials = credentials
+        refresh_needed = getattr(credentials, "refresh_needed", None)
+        if refresh_needed is not None and refresh_needed():
+            return await asyncio.to_thread(credentials.get_frozen_credentials)
+        return credentials.get_frozen_credentials()
+
+    def _signed_headers(self, url: str, body: bytes, credentials) -> dict[str, str]:
+        request = AWSRequest(
+            method="POST",
+            url=url,
+            data=body,
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/vnd.amazon.eventstream",
+                "X-Amz-Content-Sha256": hashlib.sha256(body).hexdigest(),
+            },
+        )
+        SigV4Auth(credentials, _SIGNING_NAME, self._region).add_auth(request)
+        return dict(request.headers.items())
+
+    async def close(self) -> None:
+        closing = self._release_session()
+        if closing is not None:
+            await closing
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+    async def invoke_model_with_response_stream(
+        self, model_id: str, body: str | bytes
+    ) -> AsyncIterator[dict[str, Any]]:
+        """모델 출력 청크를 디코딩된 JSON dict 로 하나씩 yield 한다.
+
+        boto3 의 ``event["chunk"]["bytes"]`` 를 ``json.loads`` 한 값과 같다.
+        HTTP 오류 / exception 이벤트는 ``BedrockStreamError`` 로 올린다.
+        """
+        payload = body.encode() if isinstance(body, str) else body
+        # modelId 의 ':' 등은 boto3 와 같이 percent-encode 한다 (SigV4 정규
+        # 경로는 SigV4Auth 가 한 번 더 인코딩한다).
+        url = (
+            f"{self._endpoint}/model/{quote(model_id, safe='')}"
+            "/invoke-with-response-stream"
+        )
+        credentials = await self._frozen_credentials()
+        headers = self._signed_headers(url, payload, credentials)
+        session = self._get_session()
+        async with session.post(
+            URL(url, encoded=True), data=payload, headers=headers
+        ) as resp:
+            if resp.status != 200:
+                text = await resp.text()
+                raise BedrockStreamError(
+                    f"Bedrock HTTP {resp.status}: {text[:200]}",
+                    status=resp.status,
+                    code=resp.headers.get("x-amzn-ErrorType", ""),
+                )
+            buffer = EventStreamBuffer()
+            async for data in resp.content.iter_any():
+                buffer.add_data(data)
+                for message in buffer:
+                    chunk = _decode_event(message.headers, message.payload)
+                    if chunk is not None:
+                        yield chunk
+
+
+def _default_credentials():
+    """boto3 기본 체인과 같은 순서로 자격 증명을 찾는다 (없으면 None)."""
+    return botocore.session.get_session().get_credentials()
+
+
+def _decode_event(headers: dict[str, Any], payload: bytes) -> dict[str, Any] | None:
+    """event-stream 메시지 하나를 모델 청크 dict 로 변환 (chunk 외 이벤트는 None)."""
+    message_type = headers.get(":message-type")
+    if message_type in ("exception", "error"):
+        code = headers.get(":exception-type") or headers.get(":error-code") or ""
+        try:
+            detail = fastpath.loads(payload or b"{}").get("message", "")
+        except ValueError:
+            detail = payload.decode("utf-8", "replace")
+        raise BedrockStreamError(f"Bedrock stream {code}: {detail}", code=code)
+    if headers.get(":event-type") != "chunk":
+        return None
+    encoded = fastpath.loads(payload).get("bytes")
+    if not encoded:
+        return None
+    return fastpath.loads(base64.b64decode(encoded))
+
+
+# ----------------------------------------------------------------------
+# 프로세스 전역 클라이언트 캐시 (자격 증명별 1개)
+# ----------------------------------------------------------------------
+_clients: dict[tuple, AsyncBedrockClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_async_bedrock_client(
+    *,
+    region: str,
+    access_key: str | None,
+    secret_key: str | None,
+    endpoint_url: str | None = None,
+) -> AsyncBedrockClient:
+    """(region, 자격 증명, endpoint) 별 AsyncBedrockClient 를 재사용한다."""
+    secret_digest = hashlib.sha256((secret_key or "").encode()).hexdigest()[:16]
+    key = (region, access_key, secret_digest, endpoint_url)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = AsyncBedrockClient(
+                region, access_key, secret_key, endpoint_url=endpoint_url
+            )
+            _clients[key] = client
+        return client
+
+
+async def close_async_bedrock_clients() -> None:
+    """캐시된 모든 클라이언트의 HTTP 세션을 닫는다 (서버 종료 시 호출).
+
+    지금 루프에 묶인 세션은 기다려서 닫고, 다른 루프의 세션은 그 루프로
+    close 를 예약한다. 클라이언트 자체는 캐시에 남아 다음 호출에서 세션을
+    다시 연다.
+    """
+    with _clients_lock:
+        clients = list(_clients.values())
+    for client in clients:
+        await client.close()
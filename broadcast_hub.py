@@ -0,0 +1,406 @@
+"""
+프로세스 간 SSE 브로드캐스트 백엔드 (Unix domain socket pub/sub)
+
+기본 구성(``SSE_BROADCAST_BACKEND=local``)은 WebSocket 서버와 SSE 서버가 한
+프로세스에서 ``BroadcastManager`` 하나를 공유한다 — viewer 수용량이 이벤트
+루프 하나, 코어 하나에 묶인다. ``SSE_BROADCAST_BACKEND=unix`` 이면 SSE 를
+별도 워커 프로세스 N 개로 띄우고, WebSocket 프로세스가 Unix domain socket
+hub 로 자막을 워커들에 fan-out 한다.
+
+설계 요약
+---------
+- WebSocket 프로세스: :class:`HubPublisher` 가 ``BroadcastManager`` 자리를
+  대신한다 (``publish`` / ``has_viewers`` / ``get_metrics`` 동일 인터페이스).
+  ``broadcast_translation_for_room`` 의 lazy 번역 게이트는 모든 워커의 관심
+  채널 합계로 동작한다.
+- SSE 워커: 평범한 ``BroadcastManager`` + aiohttp 앱을 ``SO_REUSEPORT`` 로
+  같은 포트에 띄운다 (커널이 연결을 워커들에 분산). :class:`HubSubscriber`
+  가 채널별 viewer 수를 hub 에 알리고, 받은 메시지를 로컬 manager 에
+  publish 한다 — 프레임 인코딩/ring buffer/heartbeat 는 워커마다 그대로다.
+- 와이어 포맷은 줄 단위 JSON 이다. 워커 → hub ``viewers`` (채널의 현재
+  viewer 수 + 신규 입장 수), hub → 워커 ``publish``. hub 는 해당 채널에
+  viewer 가 있는 워커에만 보낸다.
+- 워커 재접속 시 현재 채널 상태를 다시 보내므로 hub 재시작에도 관심 채널이
+  복구된다. hub 쪽 쓰기 버퍼가 ``_HUB_MAX_PENDING_BYTES`` 를 넘은 워커에는
+  메시지를 버린다 (자막 도메인 — 약간의 손실은 허용, hub 메모리 증가는 불가).
+- ISSUE-33 누적/peak viewer 는 전체 워커 합계를 아는 hub 가 영속화한다
+  (``attach_broadcast_metrics_repo`` 가 붙인 ``_metrics_repo``).
+- hub socket 은 기본적으로 사용자 전용 런타임 디렉터리(``$XDG_RUNTIME_DIR``,
+  없으면 ``/tmp/realtime-translator-<uid>/`` 0700)에 만들고, bind 후
+  0600 으로 제한한다 — 같은 호스트의 다른 사용자가 자막을 주입하거나 구독할
+  수 없다. 남은 socket 파일은 현재 사용자 소유의 socket 일 때만 지운다.
+- Last-Event-ID 의 epoch 는 워커마다 다르다. 다른 워커로 재접속하면 replay
+  없이 head 부터 받는다 (gap 처리와 같은 graceful 저하).
+
+실행: ``python -m broadcast_hub --workers 4 --port 8766``
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import stat
+import tempfile
+from typing import Any
+
+from aiohttp import web
+
+import fastpath
+from sse_broadcast import BroadcastManager, build_sse_app
+
+
+def _default_hub_socket() -> str:
+    """사용자 전용 런타임 디렉터리 안의 hub socket 경로."""
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "realtime-translator-sse.sock")
+    return os.path.join(
+        tempfile.gettempdir(), f"realtime-translator-{os.geteuid()}", "sse.sock"
+    )
+
+
+# hub Unix domain socket 경로.
+SSE_HUB_SOCKET = os.getenv("SSE_HUB_SOCKET") or _default_hub_socket()
+
+# SSE 워커 프로세스 수 (기본: CPU 코어 수).
+SSE_WORKERS = int(os.getenv("SSE_WORKERS", str(os.cpu_count() or 1)))
+
+# 워커 하나에 쌓아 둘 수 있는 미전송 바이트 상한. 넘으면 그 워커 몫은 버린다.
+_HUB_MAX_PENDING_BYTES = 1 << 20
+
+# 한 줄 메시지 최대 크기 (긴 자막 payload 대비).
+_LINE_LIMIT = 1 << 20
+
+# 워커가 hub 재접속을 시도하는 간격(초).
+_RECONNECT_DELAY_SECONDS = 1.0
+
+
+def _encode(message: dict[str, Any]) -> bytes:
+    return fastpath.dumps_bytes(message) + b"\n"
+
+
+def _prepare_socket_path(path: str, uid: int | None = None) -> None:
+    """bind 전에 socket 경로를 정리한다.
+
+    상위 디렉터리가 없으면 0700 으로 만든다. 상위 디렉터리가 현재 사용자나
+    root 소유가 아니거나, 남은 파일이 다른 사용자 소유이거나 socket 이
+    아니면 지우지 않고 ``PermissionError`` / ``FileExistsError`` 를 올린다.
+    """
+    uid = os.geteuid() if uid is None else uid
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, mode=0o700, exist_ok=True)
+    if os.stat(parent).st_uid not in (uid, 0):
+        raise PermissionError(f"hub socket 디렉터리가 다른 사용자 소유: {parent}")
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if st.st_uid != uid:
+        raise PermissionError(f"다른 사용자 소유의 hub socket 경로: {path}")
+    if not stat.S_ISSOCK(st.st_mode):
+        raise FileExistsError(f"hub socket 경로에 socket 이 아닌 파일: {path}")
+    # 이전 프로세스가 남긴 socket 파일은 bind 를 막는다.
+    os.unlink(path)
+
+
+def use_hub_backend() -> bool:
+    """SSE 를 워커 프로세스로 분리하는 구성인지.
+
+    ``SSE_BROADCAST_BACKEND``: "local" (단일 프로세스, 기본) | "unix" (hub +
+    SSE 워커 프로세스). app.py 의 load_dotenv() 이후 값을 읽도록 함수로 둔다.
+    """
+    return os.getenv("SSE_BROADCAST_BACKEND", "local").lower() == "unix"
+
+
+# ----------------------------------------------------------------------
+# WebSocket 프로세스 쪽
+# ----------------------------------------------------------------------
+class HubPublisher:
+    """워커들에 자막을 fan-out 하는 hub. ``BroadcastManager`` 와 같은 publish 면.
+
+    이벤트 루프 스레드(WebSocket 서버 루프)에서만 사용한다.
+    """
+
+    def __init__(self, path: str = SSE_HUB_SOCKET) -> None:
+        self._path = path
+        self._server: asyncio.AbstractServer | None = None
+        # 워커 연결 -> {(room_id, lang): viewer 수}
+        self._workers: dict[asyncio.StreamWriter, dict[tuple[str, str], int]] = {}
+        # room_id -> {lang: 전체 워커 합계}
+        self._by_room: dict[str, dict[str, int]] = {}
+        # database.Room 호환 — attach_broadcast_metrics_repo 가 설정한다.
+        self._metrics_repo: Any | None = None
+
+    async def start(self) -> None:
+        _prepare_socket_path(self._path)
+        self._server = await asyncio.start_unix_server(
+            self._handle_worker, path=self._path
+        )
+        # 같은 사용자(워커 프로세스)만 연결할 수 있게 한다.
+        os.chmod(self._path, 0o600)
+        print(f"[Hub] SSE broadcast hub: {self._path}")
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for writer in list(self._workers):
+            writer.close()
+
+    def worker_count(self) -> int:
+        return len(self._workers)
+
+    def has_viewers(self, room_id: str, lang: str) -> bool:
+        return self._by_room.get(room_id, {}).get(lang, 0) > 0
+
+    def get_metrics(self, room_id: str) -> dict[str, Any]:
+        by_lang = dict(self._by_room.get(room_id) or {})
+        return {"current": sum(by_lang.values()), "by_lang": by_lang}
+
+    def channel_count(self) -> int:
+        return sum(len(langs) for langs in self._by_room.values())
+
+    async def publish(self, room_id: str, lang: str, payload: dict[str, Any]) -> None:
+        """관심 있는 워커에만 한 번 인코딩한 줄을 쓴다 (drain 대기 없음)."""
+        if not self.has_viewers(room_id, lang):
+            return
+        line: bytes | None = None
+        key = (room_id, lang)
+        for writer, channels in self._workers.items():
+            if not channels.get(key):
+                continue
+            if writer.transport.get_write_buffer_size() > _HUB_MAX_PENDING_BYTES:
+                print(f"[Hub] 워커 적체 — 메시지 버림 (room={room_id} lang={lang})")
+                continue
+            if line is None:
+                line = _encode(
+                    {"op": "publish", "room": room_id, "lang": lang, "payload": payload}
+                )
+            writer.write(line)
+
+    async def _handle_worker(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        channels: dict[tuple[str, str], int] = {}
+        self._workers[writer] = channels
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = fastpath.loads(line)
+                    if message.get("op") == "viewers":
+                        self._set_viewers(
+                            channels,
+                            str(message["room"]),
+                            str(message["lang"]),
+                            int(message["count"]),
+                            int(message.get("joined") or 0),
+                        )
+                except (ValueError, KeyError, TypeError) as e:
+                    print(f"[Hub] 잘못된 워커 메시지: {e!r}")
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            print(f"[Hub] 워커 연결 끊김: {e!r}")
+        finally:
+            for (room_id, lang), count in list(channels.items()):
+                self._adjust(room_id, lang, -count)
+            self._workers.pop(writer, None)
+            writer.close()
+
+    def _set_viewers(
+        self,
+        channels: dict[tuple[str, str], int],
+        room_id: str,
+        lang: str,
+        count: int,
+        joined: int,
+    ) -> None:
+        count = max(0, count)
+        previous = channels.get((room_id, lang), 0)
+        if count:
+            channels[(room_id, lang)] = count
+        else:
+            channels.pop((room_id, lang), None)
+        self._adjust(room_id, lang, count - previous)
+        if joined > 0:
+            self._persist_joins(room_id, joined)
+
+    def _adjust(self, room_id: str, lang: str, delta: int) -> None:
+        if not delta:
+            return
+        langs = self._by_room.setdefault(room_id, {})
+        total = langs.get(lang, 0) + delta
+        if total > 0:
+            langs[lang] = total
+        else:
+            langs.pop(lang, None)
+        if not langs:
+            self._by_room.pop(room_id, None)
+
+    def _persist_joins(self, room_id: str, joined: int) -> None:
+        """ISSUE-33: 전체 워커 합계 기준으로 누적/peak 를 기록한다."""
+        if self._metrics_repo is None:
+            return
+        try:
+            self._metrics_repo.update_viewer_metrics(
+                room_id,
+                total_delta=joined,
+                current=self.get_metrics(room_id)["current"],
+            )
+        except Exception as e:
+            # RL-006: 로그만 남기고 브로드캐스트는 계속한다.
+            print(f"[Hub] update_viewer_metrics 실패 (room={room_id}): {e!r}")
+
+
+# ----------------------------------------------------------------------
+# SSE 워커 프로세스 쪽
+# ----------------------------------------------------------------------
+class HubSubscriber:
+    """워커의 ``BroadcastManager`` 를 hub 에 연결한다.
+
+    ``notify`` 를 ``BroadcastManager(on_viewer_change=...)`` 로 넘기면 채널
+    viewer 수 변화가 hub 로 전달되고, ``run`` 은 hub 메시지를 로컬 manager
+    에 publish 한다. hub 연결이 끊기면 재접속 후 현재 상태를 다시 보낸다.
+    """
+
+    def __init__(self, path: str = SSE_HUB_SOCKET) -> None:
+        self._path = path
+        self._counts: dict[tuple[str, str], int] = {}
+        # hub 연결 전/끊긴 동안 입장한 신규 viewer 수 — 재접속 시 전달한다.
+        self._pending_joins: dict[tuple[str, str], int] = {}
+        self._writer: asyncio.StreamWriter | None = None
+        self.connected = asyncio.Event()
+
+    def notify(self, room_id: str, lang: str, count: int, joined: bool) -> None:
+        if count:
+            self._counts[(room_id, lang)] = count
+        else:
+            self._counts.pop((room_id, lang), None)
+        if self._writer is not None:
+            self._send(room_id, lang, count, int(joined))
+        elif joined:
+            key = (room_id, lang)
+            self._pending_joins[key] = self._pending_joins.get(key, 0) + 1
+
+    def _send(self, room_id: str, lang: str, count: int, joined: int) -> None:
+        message = {
+            "op": "viewers",
+            "room": room_id,
+            "lang": lang,
+            "count": count,
+            "joined": joined,
+        }
+        self._writer.write(_encode(message))
+
+    async def run(self, manager: BroadcastManager) -> None:
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(
+                    self._path, limit=_LINE_LIMIT
+                )
+            except OSError as e:
+                print(f"[Hub] 연결 실패, 재시도: {e!r}")
+                await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+                continue
+            self._writer = writer
+            pending, self._pending_joins = self._pending_joins, {}
+            # 끊긴 동안 들어왔다 나간 viewer 도 누적 수에는 반영한다.
+            for room_id, lang in self._counts.keys() | pending.keys():
+                count = self._counts.get((room_id, lang), 0)
+                self._send(room_id, lang, count, pending.get((room_id, lang), 0))
+            self.connected.set()
+            try:
+                await self._consume(reader, manager)
+            except (ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+                print(f"[Hub] 연결 끊김: {e!r}")
+            finally:
+                self.connected.clear()
+                self._writer = None
+                writer.close()
+            await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+
+    async def _consume(
+        self, reader: asyncio.StreamReader, manager: BroadcastManager
+    ) -> None:
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            try:
+                message = fastpath.loads(line)
+            except ValueError as e:
+                print(f"[Hub] 잘못된 hub 메시지: {e!r}")
+                continue
+            if message.get("op") == "publish":
+                await manager.publish(
+                    message["room"], message["lang"], message["payload"]
+                )
+
+
+def run_sse_worker(
+    *,
+    host: str = "0.0.0.0",
+    port: int,
+    hub_path: str = SSE_HUB_SOCKET,
+) -> None:
+    """SSE 워커 프로세스 진입점 — SO_REUSEPORT 로 같은 포트를 공유한다."""
+    from database import get_room_model
+
+    async def _serve() -> None:
+        subscriber = HubSubscriber(hub_path)
+        manager = BroadcastManager(on_viewer_change=subscriber.notify)
+        app = build_sse_app(broadcast_manager=manager, room_repo=get_room_model())
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, host, port, reuse_port=True)
+        await site.start()
+        print(f"[SSE] worker pid={os.getpid()}: http://{host}:{port}")
+        try:
+            await subscriber.run(manager)
+        finally:
+            await runner.cleanup()
+
+    try:
+        fastpath.run(_serve())
+    except KeyboardInterrupt:
+        pass
+
+
+def run_sse_workers(
+    workers: int = SSE_WORKERS,
+    *,
+    host: str = "0.0.0.0",
+    port: int,
+    hub_path: str = SSE_HUB_SOCKET,
+) -> None:
+    """SSE 워커 ``workers`` 개를 띄우고 모두 끝날 때까지 기다린다."""
+    processes = [
+        multiprocessing.Process(
+            target=run_sse_worker,
+            kwargs={"host": host, "port": port, "hub_path": hub_path},
+            name=f"sse-worker-{i}",
+        )
+        for i in range(max(1, workers))
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SSE worker processes")
+    parser.add_argument("--workers", type=int, default=SSE_WORKERS)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.getenv("SSE_PORT", "8766")))
+    parser.add_argument("--socket", default=SSE_HUB_SOCKET)
+    args = parser.parse_args()
+    run_sse_workers(args.workers, host=args.host, port=args.port, hub_path=args.socket)
@@ -6,12 +6,16 @@
 import json
 import os
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import datetime
 from typing import Any
 
 import bcrypt
 
+from quota_ledger import get_quota_ledger
+from room_cache import get_room_cache
+
 
 class InvalidRoomTransition(ValueError):
     """Raised when a room status transition violates the lifecycle diagram.
@@ -35,25 +39,135 @@ _ROOM_TRANSITIONS: dict[str, set[str]] = {
 }
 
 
+# 유휴 연결을 보관하는 최대 개수. 0 이면 풀 없이 호출마다 새로 연결한다.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "8"))
+
+# 연결마다 sqlite3 가 캐시하는 prepared statement 수.
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "256"))
+
+# 연결별 PRAGMA synchronous. 비워 두면 SQLite 기본값(FULL)을 그대로 쓴다.
+# NORMAL 은 opt-in: WAL 에서 앱 크래시에는 안전하지만 전원 장애 시 마지막
+# 커밋 일부를 잃을 수 있다.
+DB_SYNCHRONOUS = os.getenv("DB_SYNCHRONOUS", "").strip().upper()
+DB_BUSY_TIMEOUT_MS = int(os.getenv("DB_BUSY_TIMEOUT_MS", "5000"))
+
+_SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
+class ConnectionPool:
+    """SQLite 연결 풀 (thread-safe).
+
+    연결을 만들 때 한 번만 PRAGMA(foreign_keys / busy_timeout, 지정 시
+    synchronous) 를 설정하고 row_factory 를 붙인다. 연결은 한 번에 한 스레드만 쓰며
+    (``check_same_thread=False`` 로 스레드 간에 넘겨 재사용), 반납 시 열린
+    트랜잭션은 rollback 한다. 연결마다 sqlite3 의 statement 캐시가 유지되므로
+    같은 SQL 은 다시 prepare 하지 않는다.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_idle: int | None = None,
+        statement_cache_size: int | None = None,
+        synchronous: str | None = None,
+        busy_timeout_ms: int | None = None,
+    ):
+        self.db_path = db_path
+        self._max_idle = DB_POOL_SIZE if max_idle is None else max_idle
+        self._statement_cache_size = (
+            DB_STATEMENT_CACHE_SIZE
+            if statement_cache_size is None
+            else statement_cache_size
+        )
+        synchronous = (synchronous or DB_SYNCHRONOUS).upper() or None
+        if synchronous is not None and synchronous not in _SYNCHRONOUS_MODES:
+            print(f"[DB] 알 수 없는 DB_SYNCHRONOUS '{synchronous}' — 기본값 사용")
+            synchronous = None
+        self._synchronous = synchronous
+        self._busy_timeout_ms = (
+            DB_BUSY_TIMEOUT_MS if busy_timeout_ms is None else busy_timeout_ms
+        )
+        self._idle: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self._busy_timeout_ms / 1000,
+            check_same_thread=False,
+            cached_statements=self._statement_cache_size,
+        )
+        conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 결과 반환
+        conn.execute("PRAGMA foreign_keys = ON")
+        if self._synchronous is not None:
+            conn.execute(f"PRAGMA synchronous = {self._synchronous}")
+        conn.execute(f"PRAGMA busy_timeout = {self._busy_timeout_ms}")
+        with self._lock:
+            self.created += 1
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._idle:
+                self.reused += 1
+                return self._idle.pop()
+        return self._connect()
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        try:
+            if conn.in_transaction:
+                # 커밋되지 않은 변경은 다음 사용자에게 넘기지 않는다.
+                conn.rollback()
+        except sqlite3.Error:
+            conn.close()
+            return
+        with self._lock:
+            if len(self._idle) < self._max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """유휴 연결을 모두 닫는다 (사용 중인 연결은 반납 시 다시 풀에 들어간다)."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "idle": len(self._idle),
+                "max_idle": self._max_idle,
+                "created": self.created,
+                "reused": self.reused,
+            }
+
+
 class DatabaseManager:
     """데이터베이스 연결 및 스키마 관리"""
 
-    def __init__(self, db_path: str = "data/app.db"):
+    def __init__(self, db_path: str = "data/app.db", pool_size: int | None = None):
         self.db_path = db_path
         # data 디렉토리가 없으면 생성
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.pool = ConnectionPool(db_path, max_idle=pool_size)
         self.init_database()
 
     @contextmanager
     def get_connection(self):
-        """컨텍스트 매니저로 DB 연결 관리"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 결과 반환
-        conn.execute("PRAGMA foreign_keys = ON")
+        """컨텍스트 매니저로 DB 연결 관리 (풀에서 빌려 쓰고 반납)"""
+        conn = self.pool.acquire()
         try:
             yield conn
         finally:
-            conn.close()
+            self.pool.release(conn)
+
+    def close(self):
+        """풀의 유휴 연결을 닫는다."""
+        self.pool.close()
 
     def init_database(self):
         """데이터베이스 스키마 초기화"""
@@ -463,7 +577,9 @@ class User:
             )
             conn.commit()
 
-            return cursor.rowcount > 0
+        # 한도 변경은 WebSocket 경로의 quota ledger 에 즉시 반영한다.
+        get_quota_ledger().invalidate(user_id)
+        return cursor.rowcount > 0
 
     def add_usage(self, user_id: int, duration_seconds: int) -> bool:
         """사용자 사용량 추가"""
@@ -477,7 +593,8 @@ class User:
             )
             conn.commit()
 
-            return cursor.rowcount > 0
+        get_quota_ledger().invalidate(user_id)
+        return cursor.rowcount > 0
 
     def get_remaining_seconds(self, user_id: int) -> int | None:
         """사용자의 남은 사용 가능 시간 조회"""
@@ -527,7 +644,8 @@ class User:
             cursor = conn.execute("DELETE FROM users WHERE id = ?", (user_id,))
             conn.commit()
 
-            return cursor.rowcount > 0
+        get_quota_ledger().invalidate(user_id)
+        return cursor.rowcount > 0
 
 
 class UsageLog:
@@ -577,6 +695,106 @@ class UsageLog:
 
             return cursor.lastrowid
 
+    def record_utterance(
+        self,
+        user_id: int,
+        duration_seconds: int,
+        action: str = "transcribe",
+        source_language: str | None = None,
+        target_language: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        room_id: str | None = None,
+    ) -> int | None:
+        """발화 하나의 사용량 누적 + 로그 기록을 한 트랜잭션으로 처리한다.
+
+        ``users.total_usage_seconds`` UPDATE 와 ``usage_logs`` INSERT 를 한
+        번에 커밋하고(fsync 1회), 갱신된 남은 시간을 RETURNING 으로 함께
+        돌려준다 — 호출자가 ``User.get_remaining_seconds`` 를 다시 조회할
+        필요가 없다. 사용자가 없으면 아무것도 기록하지 않고 None.
+        """
+        metadata_json = json.dumps(metadata) if metadata else None
+
+        with self.db.get_connection() as conn:
+            row = conn.execute(
+                """
+                UPDATE users SET total_usage_seconds = total_usage_seconds + ?
+                WHERE id = ?
+                RETURNING usage_limit_seconds - total_usage_seconds AS remaining
+            """,
+                (duration_seconds, user_id),
+            ).fetchone()
+            if row is None:
+                conn.rollback()
+                return None
+            conn.execute(
+                """
+                INSERT INTO usage_logs (
+                    user_id, action, duration_seconds, source_language,
+                    target_language, metadata, room_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    user_id,
+                    action,
+                    duration_seconds,
+                    source_language,
+                    target_language,
+                    metadata_json,
+                    room_id,
+                ),
+            )
+            conn.commit()
+
+            return row["remaining"]
+
+    def record_utterances(self, rows: list[dict[str, Any]]) -> int:
+        """여러 발화의 사용량을 한 트랜잭션으로 기록한다 (group commit).
+
+        ``rows`` 의 각 항목은 :meth:`record_utterance` 의 키워드 인자와 같다.
+        사용자별 사용량은 합산해 UPDATE 한 번으로, 로그는 executemany 로
+        INSERT 한 뒤 한 번만 커밋한다. 기록한 로그 수를 반환한다. 오류가
+        나면 전체를 rollback 하고 예외를 올린다.
+        """
+        if not rows:
+            return 0
+        totals: dict[int, int] = {}
+        for row in rows:
+            totals[row["user_id"]] = (
+                totals.get(row["user_id"], 0) + row["duration_seconds"]
+            )
+
+        with self.db.get_connection() as conn:
+            conn.executemany(
+                """
+                UPDATE users SET total_usage_seconds = total_usage_seconds + ?
+                WHERE id = ?
+            """,
+                [(seconds, user_id) for user_id, seconds in totals.items()],
+            )
+            conn.executemany(
+                """
+                INSERT INTO usage_logs (
+                    user_id, action, duration_seconds, source_language,
+                    target_language, metadata, room_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+                [
+                    (
+                        row["user_id"],
+                        row.get("action", "transcribe"),
+                        row["duration_seconds"],
+                        row.get("source_language"),
+                        row.get("target_language"),
+                        json.dumps(row["metadata"]) if row.get("metadata") else None,
+                        row.get("room_id"),
+                    )
+                    for row in rows
+                ],
+            )
+            conn.commit()
+
+        return len(rows)
+
     def get_user_logs(
         self, user_id: int, limit: int = 100, offset: int = 0
     ) -> list[dict[str, Any]]:
@@ -832,6 +1050,7 @@ class Room:
                 return None
             raise
 
+        get_room_cache().invalidate(room_id)
         return self.get_by_id(room_id)
 
     def get_by_id(self, room_id: str) -> dict[str, Any] | None:
@@ -869,7 +1088,8 @@ class Room:
                 (operator_id, room_id),
             )
             conn.commit()
-            return cursor.rowcount > 0
+        get_room_cache().invalidate(room_id)
+        return cursor.rowcount > 0
 
     def force_close(self, room_id: str) -> bool:
         """Admin-driven force-close (ISSUE-29).
@@ -953,6 +1173,8 @@ class Room:
                     (target_status, room_id),
                 )
             conn.commit()
+        # force_close 도 이 경로를 거친다.
+        get_room_cache().invalidate(room_id)
         return True
 
     # ------------------------------------------------------------------
@@ -0,0 +1,158 @@
+"""
+실시간 서버용 선택적 fast path (orjson JSON 직렬화 / uvloop 이벤트 루프)
+
+WebSocket 핸들러의 ``transcription_result`` / ``translation_partial``, SSE
+프레임, broadcast hub 메시지, Bedrock 스트리밍 청크 파싱이 모두 메시지마다
+JSON 을 인코딩/디코딩한다. orjson / uvloop 이 설치돼 있으면 그것을 쓰고,
+없으면 표준 라이브러리로 그대로 동작한다 (필수 의존성이 아니다).
+
+설계 요약
+---------
+- JSON 출력은 두 백엔드 모두 compact (``{"a":1}``) + 비ASCII 그대로(UTF-8)
+  로 통일한다 — 백엔드에 따라 wire format 이 달라지지 않는다.
+- orjson 이 거부하는 입력(64bit 초과 정수, 비문자열 key, NaN 리터럴, lone
+  surrogate 등)은 표준 json 으로 재시도한다. 기존 동작과의 호환이 우선이고,
+  이런 입력은 hot path 가 아니다.
+- 디코드 실패는 항상 ``json.JSONDecodeError`` (orjson 의 예외도 이를 상속)
+  이므로 호출부의 기존 ``except json.JSONDecodeError`` / ``ValueError`` 가
+  그대로 동작한다.
+- 백엔드는 ``REALTIME_JSON_BACKEND`` / ``REALTIME_EVENT_LOOP`` (auto | stdlib
+  | orjson / uvloop) 로 고를 수 있다. JSON 백엔드는 import 시점에 한 번
+  정해지며(hot path 에서 env 를 읽지 않는다) :func:`set_json_backend` 로
+  바꿀 수 있다. 루프 정책은 루프를 만들 때마다 읽는다.
+
+벤치마크: ``python scripts/bench_fastpath.py``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택적 의존성
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - 선택적 의존성
+    uvloop = None
+
+_T = TypeVar("_T")
+
+JSONDecodeError = json.JSONDecodeError
+
+_STDLIB_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+# ----------------------------------------------------------------------
+# JSON
+# ----------------------------------------------------------------------
+def _stdlib_dumps(obj: Any) -> str:
+    return _STDLIB_ENCODER.encode(obj)
+
+
+def _stdlib_dumps_bytes(obj: Any) -> bytes:
+    return _STDLIB_ENCODER.encode(obj).encode()
+
+
+def _orjson_dumps_bytes(obj: Any) -> bytes:
+    try:
+        return orjson.dumps(obj)
+    except orjson.JSONEncodeError:
+        return _stdlib_dumps_bytes(obj)
+
+
+def _orjson_dumps(obj: Any) -> str:
+    return _orjson_dumps_bytes(obj).decode()
+
+
+def _orjson_loads(data: str | bytes | bytearray) -> Any:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # 표준 json 만 허용하는 입력 — 정말 잘못된 JSON 이면 여기서 다시 실패한다.
+        return json.loads(data)
+
+
+_BACKENDS: dict[str, tuple[Callable, Callable, Callable]] = {
+    "stdlib": (_stdlib_dumps, _stdlib_dumps_bytes, json.loads),
+}
+if orjson is not None:
+    _BACKENDS["orjson"] = (_orjson_dumps, _orjson_dumps_bytes, _orjson_loads)
+
+_json_backend = "stdlib"
+_dumps, _dumps_bytes, _loads = _BACKENDS["stdlib"]
+
+
+def set_json_backend(name: str = "auto") -> str:
+    """JSON 백엔드를 고르고 실제로 선택된 이름을 돌려준다.
+
+    ``auto`` 는 orjson 이 있으면 orjson, 없으면 stdlib. 설치되지 않은
+    백엔드를 요청하면 stdlib 으로 폴백한다.
+    """
+    global _json_backend, _dumps, _dumps_bytes, _loads
+    name = (name or "auto").strip().lower()
+    if name == "auto":
+        name = "orjson" if "orjson" in _BACKENDS else "stdlib"
+    if name not in _BACKENDS:
+        print(f"[Fastpath] JSON 백엔드 '{name}' 사용 불가 — stdlib 으로 폴백")
+        name = "stdlib"
+    _json_backend = name
+    _dumps, _dumps_bytes, _loads = _BACKENDS[name]
+    return name
+
+
+def json_backend() -> str:
+    """현재 JSON 백엔드 이름 ("orjson" | "stdlib")."""
+    return _json_backend
+
+
+def dumps(obj: Any) -> str:
+    """compact JSON 문자열 (WebSocket text frame 용)."""
+    return _dumps(obj)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """compact JSON UTF-8 바이트 (SSE 프레임 / hub 라인 용)."""
+    return _dumps_bytes(obj)
+
+
+def loads(data: str | bytes | bytearray) -> Any:
+    """JSON 디코드. 실패 시 ``json.JSONDecodeError``."""
+    return _loads(data)
+
+
+set_json_backend(os.getenv("REALTIME_JSON_BACKEND", "auto"))
+
+
+# ----------------------------------------------------------------------
+# 이벤트 루프
+# ----------------------------------------------------------------------
+def event_loop_backend() -> str:
+    """새 루프에 쓸 구현 ("uvloop" | "asyncio").
+
+    ``REALTIME_EVENT_LOOP``: auto(기본) | uvloop | asyncio. 함수로 읽어야
+    load_dotenv() 이후 값을 가져올 수 있다.
+    """
+    requested = os.getenv("REALTIME_EVENT_LOOP", "auto").strip().lower()
+    if requested in ("auto", "uvloop") and uvloop is not None:
+        return "uvloop"
+    return "asyncio"
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """daemon thread 등에서 직접 루프를 만들 때 ``asyncio.new_event_loop`` 대신."""
+    if event_loop_backend() == "uvloop":
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def run(main: Coroutine[Any, Any, _T]) -> _T:
+    """``asyncio.run`` 대체 — 가능하면 uvloop 루프에서 실행한다."""
+    with asyncio.Runner(loop_factory=new_event_loop) as runner:
+        return runner.run(main)
@@ -0,0 +1,321 @@
+"""
+Bedrock 모델 라우터 (지연 시간 기반 순서 + 모델별 circuit breaker)
+
+``BEDROCK_MODEL_IDS`` 를 항상 같은 순서로 시도하면, 첫 모델(Haiku)이
+throttling 이거나 장애일 때 자막마다 실패 호출 한 번을 먼저 치르고 나서야
+다음 모델로 넘어간다. 라우터는 모델별 최근 호출 결과를 기억해 시도 순서를
+정한다.
+
+설계 요약
+---------
+- 모델마다 최근 ``MODEL_ROUTER_WINDOW`` 건의 성공 여부와, 호출 종류별
+  지연 시간 창을 따로 둔다 — 스트리밍은 첫 청크까지(``LATENCY_FIRST_TOKEN``),
+  비스트리밍은 전체 응답까지(``LATENCY_RESPONSE``). 두 값은 비교할 수 없으므로
+  섞지 않고, 순서도 같은 종류의 p50 으로 정한다. :meth:`ModelRouter.stats`
+  가 종류별 p50/p95 지연과 오류율을 보여준다.
+- circuit 은 모델 쪽 장애만 센다 (:func:`is_model_fault` — throttling,
+  타임아웃 / 연결 오류, 5xx). ValidationException 같은 요청 오류는 다음
+  모델로 넘어가되 실패로 기록하지 않는다 (:meth:`ModelRouter.record_error`).
+- 연속 실패가 ``MODEL_ROUTER_FAILURE_THRESHOLD`` 회이거나, 표본이
+  ``MODEL_ROUTER_MIN_SAMPLES`` 이상일 때 오류율이 ``MODEL_ROUTER_ERROR_RATE``
+  이상이면 circuit 을 연다. 열린 모델은 ``MODEL_ROUTER_OPEN_SECONDS`` 동안
+  후보에서 빠진다 — 자막마다 실패 호출을 치르지 않는다.
+- 대기 시간이 지나면 half-open: 요청 하나만 그 모델을 먼저 시도(probe)한다.
+  성공하면 닫고 표본을 비우며, 실패하면 다시 연다.
+- 닫힌 모델은 p50 지연이 짧은 순서로 시도한다. 표본이 없는 모델은 설정
+  순서를 유지한 채 뒤에 둔다 — 기동 직후에는 ``BEDROCK_MODEL_IDS`` 순서다.
+- 시도할 모델이 하나도 없으면 :meth:`ModelRouter.candidates` 가 빈 목록을
+  돌려준다. 호출부는 네트워크 호출 없이 곧바로 Amazon Translate 로 폴백한다.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import aiohttp
+from botocore.exceptions import ConnectionError as BotocoreConnectionError
+from botocore.exceptions import HTTPClientError
+
+# 모델별로 기억하는 최근 호출 수.
+MODEL_ROUTER_WINDOW = int(os.getenv("MODEL_ROUTER_WINDOW", "50"))
+
+# 이 횟수만큼 연속 실패하면 circuit 을 연다.
+MODEL_ROUTER_FAILURE_THRESHOLD = int(os.getenv("MODEL_ROUTER_FAILURE_THRESHOLD", "3"))
+
+# 창 안의 오류율이 이 값 이상이면 circuit 을 연다 (표본이 충분할 때만).
+MODEL_ROUTER_ERROR_RATE = float(os.getenv("MODEL_ROUTER_ERROR_RATE", "0.5"))
+MODEL_ROUTER_MIN_SAMPLES = int(os.getenv("MODEL_ROUTER_MIN_SAMPLES", "10"))
+
+# 열린 circuit 을 half-open 으로 바꾸기까지의 시간(초).
+MODEL_ROUTER_OPEN_SECONDS = float(os.getenv("MODEL_ROUTER_OPEN_SECONDS", "30"))
+
+# 지연 시간 종류 — 종류마다 창이 따로다.
+LATENCY_FIRST_TOKEN = "first_token"
+LATENCY_RESPONSE = "response"
+_LATENCY_KINDS = (LATENCY_FIRST_TOKEN, LATENCY_RESPONSE)
+
+# circuit 을 여는 AWS 오류 코드 (소문자) — throttling / 타임아웃 / 서버 측 오류.
+# 스트림 내 exception 이벤트는 camelCase(throttlingException) 로 온다.
+_FAULT_CODES = frozenset(
+    code.lower()
+    for code in (
+        "ThrottlingException",
+        "TooManyRequestsException",
+        "ServiceQuotaExceededException",
+        "ServiceUnavailableException",
+        "InternalServerException",
+        "InternalFailure",
+        "ModelTimeoutException",
+        "ModelNotReadyException",
+        "ModelStreamErrorException",
+        "RequestTimeout",
+        "RequestTimeoutException",
+    )
+)
+
+# 응답 코드 없이 끝난 전송 계층 오류 (연결 실패 / 타임아웃 / 끊긴 스트림).
+_TRANSPORT_FAULTS = (
+    TimeoutError,
+    ConnectionError,
+    HTTPClientError,
+    BotocoreConnectionError,
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    index = min(len(sorted_values) - 1, int(q * len(sorted_values)))
+    return sorted_values[index]
+
+
+def is_model_fault(error: BaseException) -> bool:
+    """circuit 에 실패로 셀 오류인지 — throttling / 타임아웃 / 5xx 만 True.
+
+    botocore ``ClientError`` (``EventStreamError`` 포함) 는 ``response`` 의
+    오류 코드와 HTTP 상태로, ``bedrock_stream.BedrockStreamError`` 는
+    ``code`` / ``status`` 속성으로 판별한다.
+    """
+    if isinstance(error, _TRANSPORT_FAULTS):
+        return True
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        code = (response.get("Error") or {}).get("Code") or ""
+        status = (response.get("ResponseMetadata") or {}).get("HTTPStatusCode")
+    else:
+        code = getattr(error, "code", "") or ""
+        status = getattr(error, "status", None)
+    if isinstance(code, str) and code.lower() in _FAULT_CODES:
+        return True
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+class _ModelHealth:
+    __slots__ = (
+        "outcomes",
+        "latencies",
+        "consecutive_failures",
+        "state",
+        "opened_at",
+        "probing",
+    )
+
+    def __init__(self, window: int) -> None:
+        # 성공 여부 (오류율) — 호출 종류와 무관하게 하나의 창.
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        # 종류 -> 성공 호출의 지연(초)
+        self.latencies: dict[str, deque[float]] = {
+            kind: deque(maxlen=window) for kind in _LATENCY_KINDS
+        }
+        self.consecutive_failures = 0
+        self.state = STATE_CLOSED
+        self.opened_at = 0.0
+        self.probing = False
+
+    def p50(self, kind: str) -> float | None:
+        latencies = sorted(self.latencies[kind])
+        return _percentile(latencies, 0.5) if latencies else None
+
+    def clear_samples(self) -> None:
+        self.outcomes.clear()
+        for window in self.latencies.values():
+            window.clear()
+
+
+class ModelRouter:
+    """모델별 지연/오류를 추적해 시도 순서와 circuit 상태를 정한다 (thread-safe).
+
+    호출부는 :meth:`candidates` 순서대로 시도하고 결과를 :meth:`record_success`
+    / :meth:`record_error` 로 알린다. 두 메서드와 :meth:`candidates` 의
+    ``kind`` 는 지연 시간 종류(``LATENCY_FIRST_TOKEN`` / ``LATENCY_RESPONSE``)다.
+    """
+
+    def __init__(
+        self,
+        models: Iterable[str],
+        *,
+        window: int | None = None,
+        failure_threshold: int | None = None,
+        error_rate: float | None = None,
+        min_samples: int | None = None,
+        open_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._models = list(models)
+        self._window = MODEL_ROUTER_WINDOW if window is None else window
+        self._failure_threshold = (
+            MODEL_ROUTER_FAILURE_THRESHOLD
+            if failure_threshold is None
+            else failure_threshold
+        )
+        self._error_rate = MODEL_ROUTER_ERROR_RATE if error_rate is None else error_rate
+        self._min_samples = (
+            MODEL_ROUTER_MIN_SAMPLES if min_samples is None else min_samples
+        )
+        self._open_seconds = (
+            MODEL_ROUTER_OPEN_SECONDS if open_seconds is None else open_seconds
+        )
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._health = {model: _ModelHealth(self._window) for model in self._models}
+
+    def candidates(self, kind: str = LATENCY_RESPONSE) -> list[str]:
+        """이번 요청에서 시도할 모델 순서. 비어 있으면 LLM 을 건너뛴다.
+
+        닫힌 모델은 ``kind`` 지연 창의 p50 순서로 정렬한다.
+        """
+        now = self._clock()
+        probes: list[str] = []
+        closed: list[tuple[float, int, str]] = []
+        with self._lock:
+            for index, model in enumerate(self._models):
+                health = self._health[model]
+                if health.state == STATE_OPEN:
+                    if now - health.opened_at < self._open_seconds:
+                        continue
+                    health.state = STATE_HALF_OPEN
+                if health.state == STATE_HALF_OPEN:
+                    # 한 번에 요청 하나만, 요청당 모델 하나만 probe 한다 —
+                    # probe 는 맨 앞이라 반드시 시도되고 결과가 기록된다.
+                    if not health.probing and not probes:
+                        health.probing = True
+                        probes.append(model)
+                    continue
+                p50 = health.p50(kind)
+                closed.append((float("inf") if p50 is None else p50, index, model))
+        closed.sort()
+        return probes + [model for _, _, model in closed]
+
+    def record_success(
+        self, model: str, latency: float, kind: str = LATENCY_RESPONSE
+    ) -> None:
+        with self._lock:
+            health = self._health.get(model)
+            if health is None:
+                return
+            if health.state != STATE_CLOSED:
+                print(f"[ModelRouter] {model} circuit 닫힘 (probe 성공)")
+                health.state = STATE_CLOSED
+                health.clear_samples()
+            health.probing = False
+            health.consecutive_failures = 0
+            health.outcomes.append(True)
+            health.latencies[kind].append(latency)
+
+    def record_error(self, model: str, error: BaseException) -> bool:
+        """시도 실패를 알린다. circuit 에 센 오류(:func:`is_model_fault`)면 True.
+
+        요청 자체의 오류(ValidationException 등)는 모델 상태와 무관하므로
+        실패로 세지 않고 probe 예약만 푼다.
+        """
+        if not is_model_fault(error):
+            self.release(model)
+            return False
+        self.record_failure(model)
+        return True
+
+    def record_failure(self, model: str) -> None:
+        with self._lock:
+            health = self._health.get(model)
+            if health is None:
+                return
+            health.probing = False
+            health.consecutive_failures += 1
+            health.outcomes.append(False)
+            if health.state == STATE_HALF_OPEN or self._should_open(health):
+                if health.state != STATE_OPEN:
+                    print(
+                        f"[ModelRouter] {model} circuit 열림 — "
+                        f"{self._open_seconds:.0f}초 동안 건너뜀"
+                    )
+                health.state = STATE_OPEN
+                health.opened_at = self._clock()
+
+    def release(self, model: str) -> None:
+        """결과 없이 끝난 시도(취소 등)의 probe 예약을 푼다."""
+        with self._lock:
+            health = self._health.get(model)
+            if health is not None:
+                health.probing = False
+
+    def _should_open(self, health: _ModelHealth) -> bool:
+        if health.consecutive_failures >= self._failure_threshold:
+            return True
+        if len(health.outcomes) < self._min_samples:
+            return False
+        failures = health.outcomes.count(False)
+        return failures / len(health.outcomes) >= self._error_rate
+
+    def reset(self) -> None:
+        """모든 모델을 닫힌 상태로 되돌리고 표본을 비운다."""
+        with self._lock:
+            self._health = {model: _ModelHealth(self._window) for model in self._models}
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """모델별 상태 / 오류율 / 지연 종류별 p50·p95(ms) 스냅샷."""
+        with self._lock:
+            snapshot = {
+                model: (
+                    health.state,
+                    list(health.outcomes),
+                    {kind: sorted(w) for kind, w in health.latencies.items()},
+                )
+                for model, health in self._health.items()
+            }
+        result = {}
+        for model, (state, outcomes, latencies) in snapshot.items():
+            failures = outcomes.count(False)
+            result[model] = {
+                "state": state,
+                "samples": len(outcomes),
+                "error_rate": failures / len(outcomes) if outcomes else 0.0,
+                **{
+                    kind: {
+                        "p50_ms": (
+                            round(_percentile(values, 0.5) * 1000, 1)
+                            if values
+                            else None
+                        ),
+                        "p95_ms": (
+                            round(_percentile(values, 0.95) * 1000, 1)
+                            if values
+                            else None
+                        ),
+                    }
+                    for kind, values in latencies.items()
+                },
+            }
+        return result
+
+
+class ModelsUnavailableError(RuntimeError):
+    """모든 모델의 circuit 이 열려 있어 Bedrock 호출을 건너뛰었다."""
@@ -0,0 +1,117 @@
+"""
+스트리밍 부분 번역(translation_partial) 코얼레싱 / append-delta 인코딩
+
+Bedrock 은 토큰 단위로 누적 텍스트를 흘려보낸다. 이를 그대로 오퍼레이터 WS 와
+뷰어 SSE 로 보내면 발화 하나에 누적 텍스트 전체가 토큰 수만큼 반복되어
+(O(n²) 바이트) 뷰어 수만큼 곱해진다. 뷰어의 타자기 스무딩(viewer.html)이
+클라이언트 쪽에서 일정 속도로 글자를 드러내므로, 서버는 그보다 촘촘하게 보낼
+필요가 없다.
+
+- :class:`PartialCoalescer` — 최소 간격(``PARTIAL_MIN_INTERVAL_MS``)과 최소
+  글자 증가(``PARTIAL_MIN_CHARS``)를 넘을 때만 부분 결과를 내보낸다. 발화의
+  첫 조각, 앞부분이 바뀐 경우(재작성), 단어/문장 경계에서 끝난 조각은 글자
+  기준을 기다리지 않는다. 생략된 중간 조각은 다음 조각(누적)이나 최종 번역이
+  덮으므로 잃는 텍스트가 없다.
+- :class:`PartialDeltaEncoder` — ``PARTIAL_WIRE_FORMAT=delta`` 이면 뷰어 SSE
+  부분 payload 를 ``{"offset": n, "delta": "..."}`` (앞 ``n`` 글자 유지 후
+  이어 붙이기)로 보낸다. 공통 접두가 없으면 ``{"text": ...}`` 전체를 보낸다.
+  ``offset`` 은 브라우저 ``String.length`` 와 같은 UTF-16 코드 유닛 단위다.
+  delta 형식의 부분 payload 는 발화마다 1 부터 늘어나는 ``seq`` 를 함께
+  싣는다 — 뷰어는 직전에 적용한 ``seq`` 의 바로 다음 delta 만 적용하고,
+  어긋나면(중간 합류, 유실된 프레임) 다음 전체 ``text`` payload 까지 delta 를
+  버린다.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+# 부분 결과 사이 최소 간격(초). 0 이면 간격 제한 없음.
+PARTIAL_MIN_INTERVAL_SECONDS = int(os.getenv("PARTIAL_MIN_INTERVAL_MS", "60")) / 1000
+
+# 간격을 넘겼을 때 내보내기 위한 최소 글자 증가량 (경계에서 끝나면 무시).
+PARTIAL_MIN_CHARS = int(os.getenv("PARTIAL_MIN_CHARS", "4"))
+
+# 뷰어 SSE 부분 payload 형식: "full"(누적 텍스트, 기본) | "delta"(append-delta).
+PARTIAL_WIRE_FORMAT = os.getenv("PARTIAL_WIRE_FORMAT", "full").strip().lower()
+
+# 이 글자로 끝나는 조각은 글자 수 기준 없이 내보낸다 (단어/문장 경계).
+_BOUNDARY_CHARS = frozenset(".,!?;:)]」』。、，！？…·")
+
+
+def _utf16_len(text: str) -> int:
+    return len(text.encode("utf-16-le")) // 2
+
+
+class PartialCoalescer:
+    """발화 하나의 누적 부분 결과 중 실제로 보낼 것만 고른다."""
+
+    def __init__(
+        self,
+        min_interval: float | None = None,
+        min_chars: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._min_interval = (
+            PARTIAL_MIN_INTERVAL_SECONDS if min_interval is None else min_interval
+        )
+        self._min_chars = PARTIAL_MIN_CHARS if min_chars is None else min_chars
+        self._clock = clock
+        self._last_text: str | None = None
+        self._last_at = 0.0
+
+    def offer(self, text: str) -> bool:
+        """``text`` (누적) 를 지금 보내야 하면 True — 보낸 것으로 기록한다."""
+        if not text or text == self._last_text:
+            return False
+        now = self._clock()
+        last = self._last_text
+        if last is not None and text.startswith(last):
+            if now - self._last_at < self._min_interval:
+                return False
+            at_boundary = text[-1].isspace() or text[-1] in _BOUNDARY_CHARS
+            if len(text) - len(last) < self._min_chars and not at_boundary:
+                return False
+        self._last_text = text
+        self._last_at = now
+        return True
+
+
+class PartialDeltaEncoder:
+    """채널별로 마지막으로 보낸 부분 텍스트를 기억해 append-delta 를 만든다."""
+
+    def __init__(self, wire_format: str | None = None):
+        self._delta = (wire_format or PARTIAL_WIRE_FORMAT) == "delta"
+        # channel -> (마지막으로 보낸 텍스트, 그 payload 의 seq)
+        self._sent: dict[Hashable, tuple[str, int]] = {}
+
+    def encode(self, channel: Hashable, text: str) -> dict[str, Any]:
+        """``text`` 를 보낼 payload 필드.
+
+        full 형식이면 ``text`` 만, delta 형식이면 ``text`` 또는
+        ``offset``/``delta`` 에 ``seq`` 를 더한다.
+        """
+        if not self._delta:
+            return {"text": text}
+        previous, seq = self._sent.get(channel, ("", 0))
+        seq += 1
+        self._sent[channel] = (text, seq)
+        common = 0
+        for a, b in zip(previous, text, strict=False):
+            if a != b:
+                break
+            common += 1
+        if common == 0:
+            return {"text": text, "seq": seq}
+        return {
+            "offset": _utf16_len(text[:common]),
+            "delta": text[common:],
+            "seq": seq,
+        }
+
+    def reset(self, channel: Hashable) -> None:
+        """발화가 확정되면 호출 — 다음 부분 결과는 전체 텍스트(seq 1)로 시작한다."""
+        self._sent.pop(channel, None)
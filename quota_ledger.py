@@ -0,0 +1,144 @@
+"""
+사용자별 남은 사용 시간 in-memory ledger
+
+``check_usage_limit`` 와 ``transcription_result`` 의 ``remaining_seconds`` 가
+transcript 마다 ``users`` 테이블을 조회하던 것을 메모리 조회로 바꾼다.
+
+설계 요약
+---------
+- WebSocket 인증 시 사용자의 남은 시간을 한 번 읽어 둔다 (:meth:`prime`).
+- 발화가 기록될 때마다 lock 아래에서 :meth:`charge` 로 차감한다 — DB 에는
+  usage writer 가 따로 (write-behind) 쓴다.
+- ``QUOTA_RECONCILE_SECONDS`` 가 지난 항목은 다음 조회 때 DB 값(아직 커밋
+  되지 않은 write-behind 사용량 제외)으로 다시 맞춘다. 관리자 화면이 다른
+  프로세스에서 한도를 바꿔도 이 주기 안에 반영된다.
+- 차감은 usage writer 의 기록 번호로 구분한다. 적재 값은 자신이 반영한
+  마지막 기록 번호(``upto``)를 함께 가지므로, 적재와 차감이 어떤 순서로
+  엇갈려도 같은 기록이 두 번 빠지거나 빠지지 않는 일이 없다.
+- 같은 프로세스의 ``User.update_user`` / ``add_usage`` / ``delete_user`` 는
+  :meth:`invalidate` 로 항목을 즉시 버린다.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable
+
+# ledger 항목을 DB 와 다시 맞추는 주기(초).
+QUOTA_RECONCILE_SECONDS = float(os.getenv("QUOTA_RECONCILE_SECONDS", "30"))
+
+
+class _Entry:
+    __slots__ = ("remaining", "loaded_at", "upto", "charges")
+
+    def __init__(self, remaining: int, loaded_at: float, upto: int | None) -> None:
+        self.remaining = remaining
+        self.loaded_at = loaded_at
+        # 적재 값에 반영된 마지막 기록 번호 (None 이면 알 수 없음).
+        self.upto = upto
+        # 적재 이후 차감한 기록 번호 -> 초 (다음 적재 때 다시 반영한다).
+        self.charges: dict[int, int] = {}
+
+
+class QuotaLedger:
+    """user_id → 남은 시간(초) 캐시 (thread-safe).
+
+    DB 조회는 호출자가 넘기는 ``load(user_id)`` 로 한다 — 항목이 없거나
+    reconcile 주기가 지났을 때만 부른다. ``load`` 는 ``(남은 시간, upto)`` 를
+    반환한다 (:meth:`prime` 참고).
+    """
+
+    def __init__(
+        self,
+        reconcile_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._reconcile_seconds = (
+            QUOTA_RECONCILE_SECONDS if reconcile_seconds is None else reconcile_seconds
+        )
+        self._clock = clock
+        self._entries: dict[int, _Entry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+
+    def remaining(
+        self,
+        user_id: int,
+        load: Callable[[int], tuple[int | None, int | None]],
+    ) -> int | None:
+        """남은 시간(초). 없는 사용자면 None."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and now - entry.loaded_at < self._reconcile_seconds:
+                self.hits += 1
+                return entry.remaining
+        return self.prime(user_id, *load(user_id))
+
+    def prime(
+        self, user_id: int, remaining: int | None, upto: int | None = None
+    ) -> int | None:
+        """DB 에서 읽은 값으로 항목을 (다시) 채우고 남은 시간을 돌려준다.
+
+        ``upto`` 는 ``remaining`` 에 반영된 마지막 기록 번호다. 그보다 뒤의
+        차감은 새 값에 다시 적용하고, 현재 항목보다 오래된 적재는 버린다.
+        ``upto`` 가 None 이면 (동기 기록) 값을 그대로 쓴다. ``remaining`` 이
+        None 이면 항목을 버린다.
+        """
+        with self._lock:
+            self.loads += 1
+            if remaining is None:
+                self._entries.pop(user_id, None)
+                return None
+            old = self._entries.get(user_id)
+            if old is not None and upto is not None:
+                if old.upto is not None and upto < old.upto:
+                    return old.remaining
+                later = {rid: s for rid, s in old.charges.items() if rid > upto}
+            else:
+                later = {}
+            entry = _Entry(remaining - sum(later.values()), self._clock(), upto)
+            entry.charges = later
+            self._entries[user_id] = entry
+            return entry.remaining
+
+    def charge(
+        self, user_id: int, seconds: int, record_id: int | None = None
+    ) -> int | None:
+        """사용량을 차감하고 새 남은 시간을 돌려준다. 항목이 없으면 None.
+
+        ``record_id`` 가 이미 적재 값에 반영된 기록이면 차감하지 않는다.
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            if record_id is not None:
+                if entry.upto is not None and record_id <= entry.upto:
+                    return entry.remaining
+                entry.charges[record_id] = seconds
+            entry.remaining -= seconds
+            return entry.remaining
+
+    def invalidate(self, user_id: int | None = None) -> None:
+        """항목을 버린다 (``user_id`` 가 None 이면 전체)."""
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"users": len(self._entries), "hits": self.hits, "loads": self.loads}
+
+
+_quota_ledger = QuotaLedger()
+
+
+def get_quota_ledger() -> QuotaLedger:
+    """프로세스 전역 QuotaLedger 싱글턴을 반환한다."""
+    return _quota_ledger
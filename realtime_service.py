@@ -0,0 +1,301 @@
+"""
+실시간 데이터 플레인 독립 서비스 (WebSocket + SSE)
+
+Streamlit 프로세스 안의 daemon thread 대신 별도 프로세스에서 WebSocket 번역
+서버와 SSE 뷰어 서버를 한 이벤트 루프로 구동한다. Streamlit 스크립트 rerun,
+admin 대시보드의 pandas 처리, bcrypt 해싱과 GIL/CPU 를 나눠 쓰지 않으므로
+자막 지연이 대시보드 트래픽과 분리된다.
+
+설계 요약
+---------
+- ``python -m realtime_service`` 로 실행한다. WebSocket(WS_PORT), SSE
+  (SSE_PORT), 로컬 control API(REALTIME_CONTROL_PORT, 127.0.0.1 전용) 세
+  리스너가 같은 루프에서 돈다 — WS 의 publish 와 SSE viewer 가 같은 루프의
+  ``BroadcastManager`` 를 공유한다.
+- ``SSE_BROADCAST_BACKEND=unix`` 이면 SSE 는 ``python -m broadcast_hub`` 워커가
+  맡고, 이 서비스는 hub 만 연다 (``serve_websocket`` 이 시작).
+- SIGINT/SIGTERM 에서 graceful shutdown: 리스너를 닫고 진행 중인 WS 연결을
+  정리한 뒤 번역 executor 를 멈춘다. 두 번째 신호는 기본 동작(즉시 종료).
+- Streamlit 은 ``REALTIME_SERVICE_URL`` 이 설정되면 서버 스레드를 띄우지
+  않고, 이 모듈의 :func:`fetch_viewer_metrics` / :func:`fetch_health` 로
+  control API 를 조회한다.
+
+Control API (읽기 전용, 비인증 — loopback 에만 바인딩)
+------------------------------------------------------
+- ``GET /health`` → ``{"status": "ok", "ws_port": int, "sse_port": int | None}``
+- ``GET /rooms/{room_id}/viewers`` → ``BroadcastManager.get_metrics`` 결과
+- ``GET /llm/usage`` → ``translation.LlmTokenUsage.stats`` (번역 input /
+  output 토큰 사용량)
+- ``GET /translation/executor`` → ``FairTranslationExecutor.stats`` (번역
+  executor 우선순위별 대기 깊이 / 평균·최대 대기 시간)
+- ``GET /translation/cache`` → ``translation.TranslationCache.stats`` (번역
+  결과 캐시 hit/miss/eviction / 크기)
+- ``GET /llm/models`` → ``model_router.ModelRouter.stats`` (모델별 circuit
+  상태 / 첫 토큰·전체 응답 p50·p95 지연 / 오류율)
+- ``GET /usage/writer`` → ``usage_writer.UsageLogWriter.stats`` (사용량 로그
+  write-behind 큐 깊이 / 배치 지표)
+- ``GET /usage/quota`` → ``quota_ledger.QuotaLedger.stats`` (남은 시간
+  ledger 적재 사용자 수 / 적중·적재 횟수)
+- ``GET /rooms/cache`` → ``room_cache.RoomCache.stats`` (룸 메타데이터 캐시
+  항목 수 / 적중·적재 횟수)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+from typing import Any
+
+import httpx
+from aiohttp import web
+
+import fastpath
+
+# control API 포트 (loopback 전용).
+REALTIME_CONTROL_PORT = int(os.getenv("REALTIME_CONTROL_PORT", "8767"))
+
+# Streamlit → control API 요청 타임아웃(초). 대시보드 rerun 을 막지 않도록 짧게.
+_CONTROL_TIMEOUT_SECONDS = 1.0
+
+# graceful shutdown 시 WS 연결 정리를 기다리는 최대 시간(초).
+_SHUTDOWN_GRACE_SECONDS = 5.0
+
+
+def get_service_url() -> str:
+    """control API base URL (``REALTIME_SERVICE_URL``, 예: http://127.0.0.1:8767).
+
+    비어 있으면 Streamlit 이 기존처럼 daemon thread 로 서버를 구동한다.
+    함수로 읽어야 load_dotenv() 이후 값을 가져올 수 있다.
+    """
+    return os.getenv("REALTIME_SERVICE_URL", "").rstrip("/")
+
+
+def use_external_service() -> bool:
+    """Streamlit 이 데이터 플레인을 별도 프로세스로 쓰는 구성인지."""
+    return bool(get_service_url())
+
+
+# ----------------------------------------------------------------------
+# Control API (서비스 쪽)
+# ----------------------------------------------------------------------
+def build_control_app(
+    *, broadcast_manager: Any, ws_port: int, sse_port: int | None
+) -> web.Application:
+    """Streamlit 이 조회하는 로컬 control API 앱."""
+    app = web.Application()
+    app["broadcast_manager"] = broadcast_manager
+    app["ports"] = {"ws_port": ws_port, "sse_port": sse_port}
+    app.router.add_get("/health", _handle_health)
+    app.router.add_get("/rooms/{room_id}/viewers", _handle_viewers)
+    app.router.add_get("/llm/usage", _handle_llm_usage)
+    app.router.add_get("/translation/cache", _handle_translation_cache)
+    app.router.add_get("/llm/models", _handle_llm_models)
+    app.router.add_get("/translation/executor", _handle_translation_executor)
+    app.router.add_get("/usage/writer", _handle_usage_writer)
+    app.router.add_get("/usage/quota", _handle_usage_quota)
+    app.router.add_get("/rooms/cache", _handle_room_cache)
+    return app
+
+
+async def _handle_health(request: web.Request) -> web.Response:
+    return web.json_response({"status": "ok", **request.app["ports"]})
+
+
+async def _handle_viewers(request: web.Request) -> web.Response:
+    room_id = request.match_info["room_id"]
+    try:
+        metrics = request.app["broadcast_manager"].get_metrics(room_id)
+    except Exception as e:
+        # RL-006: 내부 예외는 서버 로그로만.
+        print(f"[Control] viewer metrics 조회 실패 (room={room_id}): {e!r}")
+        return web.json_response({"error": "unavailable"}, status=500)
+    return web.json_response(metrics)
+
+
+async def _handle_llm_usage(request: web.Request) -> web.Response:
+    from translation import get_llm_token_usage
+
+    return web.json_response(get_llm_token_usage().stats())
+
+
+async def _handle_translation_cache(request: web.Request) -> web.Response:
+    from translation import get_translation_cache
+
+    return web.json_response(get_translation_cache().stats())
+
+
+async def _handle_llm_models(request: web.Request) -> web.Response:
+    from translation import get_model_router
+
+    return web.json_response(get_model_router().stats())
+
+
+async def _handle_translation_executor(request: web.Request) -> web.Response:
+    from translation_executor import get_translation_executor
+
+    return web.json_response(get_translation_executor().stats())
+
+
+async def _handle_usage_writer(request: web.Request) -> web.Response:
+    from usage_writer import get_usage_writer
+
+    return web.json_response(get_usage_writer().stats())
+
+
+async def _handle_usage_quota(request: web.Request) -> web.Response:
+    from quota_ledger import get_quota_ledger
+
+    return web.json_response(get_quota_ledger().stats())
+
+
+async def _handle_room_cache(request: web.Request) -> web.Response:
+    from room_cache import get_room_cache
+
+    return web.json_response(get_room_cache().stats())
+
+
+# ----------------------------------------------------------------------
+# Control API 클라이언트 (Streamlit 쪽)
+# ----------------------------------------------------------------------
+def _control_get(path: str) -> dict[str, Any]:
+    response = httpx.get(f"{get_service_url()}{path}", timeout=_CONTROL_TIMEOUT_SECONDS)
+    response.raise_for_status()
+    return response.json()
+
+
+def fetch_health() -> dict[str, Any] | None:
+    """서비스 상태. 응답이 없으면 None (예외를 올리지 않는다)."""
+    try:
+        return _control_get("/health")
+    except Exception as e:
+        print(f"[Control] health 조회 실패: {e!r}")
+        return None
+
+
+def fetch_viewer_metrics(room_id: str) -> dict[str, Any]:
+    """``BroadcastManager.get_metrics`` 와 같은 모양. 실패 시 예외를 올린다."""
+    return _control_get(f"/rooms/{room_id}/viewers")
+
+
+class RemoteViewerMetrics:
+    """admin 의 ``manager.get_metrics(room_id)`` 호출을 control API 로 잇는다."""
+
+    def get_metrics(self, room_id: str) -> dict[str, Any]:
+        return fetch_viewer_metrics(room_id)
+
+
+# ----------------------------------------------------------------------
+# 서비스 본체
+# ----------------------------------------------------------------------
+async def _start_site(app: web.Application, host: str, port: int) -> web.AppRunner:
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
+
+
+async def serve(
+    *,
+    host: str = "0.0.0.0",
+    ws_port: int,
+    sse_port: int | None,
+    control_port: int = REALTIME_CONTROL_PORT,
+    stop: asyncio.Event | None = None,
+) -> None:
+    """WS + SSE + control API 를 띄우고 ``stop`` 이 set 될 때까지 서비스한다.
+
+    ``sse_port`` 가 None 이면 SSE 는 띄우지 않는다 (broadcast hub 구성).
+    """
+    from bedrock_stream import close_async_bedrock_clients
+    from broadcast_hub import HubPublisher
+    from database import get_room_model
+    from sse_broadcast import build_sse_app
+    from translation_executor import get_translation_executor
+    from usage_writer import close_usage_writer
+    from websocket_handler import (
+        attach_broadcast_metrics_repo,
+        get_broadcast_manager,
+        serve_websocket,
+    )
+
+    stop = stop or asyncio.Event()
+    manager = get_broadcast_manager()
+    room_repo = get_room_model()
+    # ISSUE-33: 누적/peak viewer 영속화 (app.py 의 daemon thread 구성과 동일).
+    attach_broadcast_metrics_repo(room_repo)
+
+    runners: list[web.AppRunner] = []
+    ws_server = await serve_websocket(host, ws_port)
+    try:
+        if sse_port is not None:
+            sse_app = build_sse_app(broadcast_manager=manager, room_repo=room_repo)
+            runners.append(await _start_site(sse_app, host, sse_port))
+            print(f"[SSE] viewer broadcast server: http://{host}:{sse_port}")
+        control_app = build_control_app(
+            broadcast_manager=manager, ws_port=ws_port, sse_port=sse_port
+        )
+        runners.append(await _start_site(control_app, "127.0.0.1", control_port))
+        print(f"[Control] control API: http://127.0.0.1:{control_port}")
+
+        await stop.wait()
+        print("[Realtime] 종료 신호 수신 — graceful shutdown")
+    finally:
+        # 새 연결부터 막고, 진행 중인 WS 세션은 close handshake 로 정리한다.
+        ws_server.close()
+        try:
+            await asyncio.wait_for(ws_server.wait_closed(), _SHUTDOWN_GRACE_SECONDS)
+        except TimeoutError:
+            print("[Realtime] WS 연결 정리 시간 초과 — 강제 종료")
+        for runner in reversed(runners):
+            await runner.cleanup()
+        if isinstance(manager, HubPublisher):
+            await manager.close()
+        await close_async_bedrock_clients()
+        get_translation_executor().shutdown(wait=False)
+        # 큐에 남은 사용량 로그를 커밋한 뒤 종료한다 (블로킹 — 스레드에서).
+        await asyncio.to_thread(close_usage_writer)
+
+
+def _install_signal_handlers(stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+
+    def _on_signal(signum: int) -> None:
+        print(f"[Realtime] signal {signal.Signals(signum).name}")
+        stop.set()
+        # 두 번째 신호는 기본 동작으로 — 정리가 멈춰도 강제 종료할 수 있다.
+        loop.remove_signal_handler(signum)
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, _on_signal, signum)
+        except (NotImplementedError, RuntimeError):
+            # Windows / 메인 스레드가 아닌 경우 — Ctrl+C 는 KeyboardInterrupt.
+            pass
+
+
+async def _main() -> None:
+    from broadcast_hub import use_hub_backend
+
+    stop = asyncio.Event()
+    _install_signal_handlers(stop)
+    await serve(
+        ws_port=int(os.getenv("WS_PORT", "8765")),
+        control_port=int(os.getenv("REALTIME_CONTROL_PORT", "8767")),
+        sse_port=None if use_hub_backend() else int(os.getenv("SSE_PORT", "8766")),
+        stop=stop,
+    )
+
+
+def main() -> None:
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    try:
+        fastpath.run(_main())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
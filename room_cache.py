@@ -0,0 +1,100 @@
+"""
+룸 메타데이터 read-through 캐시
+
+``_publish_to_viewers`` 는 transcript 마다, SSE ``/stream`` · ``/view`` 는
+viewer 연결/재연결마다 ``Room.get_by_id`` 로 SQLite 를 읽었다. QR 코드를
+수백 명이 동시에 스캔하면 SSE 이벤트 루프에서 같은 룸 행을 수백 번 동기
+조회한다. 이 모듈은 룸 행을 메모리에 두고 같은 룸의 조회를 한 번으로 줄인다.
+
+설계 요약
+---------
+- :meth:`RoomCache.get` 은 캐시에 있으면 O(1) 로 돌려주고, 없거나
+  ``ROOM_CACHE_TTL_SECONDS`` 가 지났으면 호출자가 넘긴 ``load(room_id)``
+  (보통 ``Room.get_by_id``) 로 다시 읽는다.
+- ``Room.create`` / ``assign_operator`` / ``transition_status`` (와 이를
+  거치는 ``force_close``) 는 :meth:`RoomCache.invalidate` 로 항목을 즉시
+  버린다 — 같은 프로세스의 상태 변경은 다음 조회에 바로 보인다.
+- 다른 프로세스(Streamlit 관리자 화면)의 변경은 TTL 안에 반영된다.
+- 없는 룸(None)과 조회 예외는 캐시하지 않는다 — 방금 만든 룸은 바로 보인다.
+- ``last_activity`` / viewer 지표 컬럼은 캐시 소비자가 쓰지 않으므로
+  ``touch`` / ``update_viewer_metrics`` 는 무효화하지 않는다. 캐시된 행의
+  이 컬럼들은 최대 TTL 만큼 오래됐을 수 있다.
+- 반환된 dict 는 캐시와 공유된다 — 호출자는 수정하지 않는다.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+# 캐시된 룸 행을 DB 와 다시 맞추는 주기(초).
+ROOM_CACHE_TTL_SECONDS = float(os.getenv("ROOM_CACHE_TTL_SECONDS", "5"))
+
+
+class RoomCache:
+    """room_id → 룸 행 캐시 (thread-safe).
+
+    DB 조회는 호출자가 넘기는 ``load(room_id)`` 로 한다 — 항목이 없거나
+    TTL 이 지났을 때만 부른다.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = (
+            ROOM_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        )
+        self._clock = clock
+        # room_id -> (expires_at, room row)
+        self._entries: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        # 조회 도중 invalidate 가 끼면 읽어 온(이전) 행을 저장하지 않는다.
+        self._generation = 0
+        self.hits = 0
+        self.loads = 0
+
+    def get(
+        self, room_id: str, load: Callable[[str], dict[str, Any] | None]
+    ) -> dict[str, Any] | None:
+        """룸 행. 없는 룸이면 None. ``load`` 의 예외는 그대로 전파된다."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(room_id)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+            generation = self._generation
+        room = load(room_id)
+        with self._lock:
+            self.loads += 1
+            if room is None:
+                self._entries.pop(room_id, None)
+            elif generation == self._generation:
+                self._entries[room_id] = (now + self._ttl_seconds, room)
+        return room
+
+    def invalidate(self, room_id: str | None = None) -> None:
+        """항목을 버린다 (``room_id`` 가 None 이면 전체)."""
+        with self._lock:
+            self._generation += 1
+            if room_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(room_id, None)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"rooms": len(self._entries), "hits": self.hits, "loads": self.loads}
+
+
+_room_cache = RoomCache()
+
+
+def get_room_cache() -> RoomCache:
+    """프로세스 전역 RoomCache 싱글턴을 반환한다."""
+    return _room_cache
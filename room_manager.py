@@ -25,6 +25,8 @@ import time
 from dataclasses import dataclass, field
 from typing import Any
 
+from translation import TranslationContext
+
 DEFAULT_ROOM_ID = "default"
 
 
@@ -44,6 +46,9 @@ class RoomState:
     Fields per Implementation Notes (ISSUE-25):
       room_id, connections, language_settings, translate_client,
       bedrock_client, created_at, last_activity
+
+    ``translation_context`` keeps the room's last few (source, translation)
+    pairs so LLM prompts can stay consistent across utterances.
     """
 
     room_id: str
@@ -56,6 +61,7 @@ class RoomState:
     bedrock_available: bool = False
     created_at: float = field(default_factory=time.time)
     last_activity: float = field(default_factory=time.time)
+    translation_context: TranslationContext = field(default_factory=TranslationContext)
 
     def touch(self) -> None:
         """Update last_activity to the current time."""
@@ -0,0 +1,118 @@
+"""
+SQLite 연결 풀 벤치마크 — transcript 당 DB 호출 묶음의 transcripts/sec
+
+    python scripts/bench_db_pool.py [--transcripts 2000] [--threads 1]
+
+transcript 하나가 WebSocket 핫 패스에서 치르는 DB 호출을 그대로 흉내 낸다:
+``check_usage_limit`` (get_remaining_seconds) → ``_record_usage``
+(get_user_by_id, UsageLog.record_utterance) → ``_publish_to_viewers``
+(Room.get_by_id).
+
+기준선은 풀 도입 전의 ``get_connection`` 그대로(호출마다 ``sqlite3.connect``
++ ``PRAGMA foreign_keys``, synchronous 는 SQLite 기본값 FULL)이고, 이를
+풀(기본 durability) 및 opt-in ``DB_SYNCHRONOUS=NORMAL`` 풀과 같은 DB 파일
+구성으로 비교한다. ``--threads`` 를 주면 여러 룸이 동시에 transcript
+를 처리하는 경우(번역 executor / to_thread)를 흉내 낸다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import (  # noqa: E402
+    ConnectionPool,
+    DatabaseManager,
+    Room,
+    UsageLog,
+    User,
+)
+
+
+class _BaselineManager(DatabaseManager):
+    """풀 도입 전 ``DatabaseManager.get_connection`` (호출마다 새 연결)."""
+
+    @contextmanager
+    def get_connection(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+def _setup(db_path: str, mode: str):
+    if mode == "baseline":
+        dbm = _BaselineManager(db_path)
+    else:
+        dbm = DatabaseManager(db_path)
+        if mode == "normal":
+            dbm.pool.close()
+            dbm.pool = ConnectionPool(db_path, synchronous="NORMAL")
+    users = User(dbm)
+    user_id = users.create_user(
+        "bench", "bench-password", usage_limit_seconds=10**9, role="user"
+    )
+    rooms = Room(dbm)
+    room_id = "bench-room"
+    rooms.create(room_id, "Bench", created_by=user_id)
+    return dbm, users, UsageLog(dbm), rooms, user_id, room_id
+
+
+def _transcript(users, logs, rooms, user_id, room_id) -> None:
+    users.get_remaining_seconds(user_id)
+    users.get_user_by_id(user_id)
+    logs.record_utterance(
+        user_id, 3, "transcribe", "en", "ko", {"text": "hello"}, room_id=room_id
+    )
+    rooms.get_by_id(room_id)
+
+
+def _run(mode: str, transcripts: int, threads: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        dbm, users, logs, rooms, user_id, room_id = _setup(
+            os.path.join(tmp, "bench.db"), mode
+        )
+        per_thread = transcripts // threads
+
+        def _worker() -> None:
+            for _ in range(per_thread):
+                _transcript(users, logs, rooms, user_id, room_id)
+
+        workers = [threading.Thread(target=_worker) for _ in range(threads)]
+        start = time.perf_counter()
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        elapsed = time.perf_counter() - start
+        dbm.close()
+        return per_thread * threads / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--transcripts", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+
+    baseline = _run("baseline", args.transcripts, args.threads)
+    print(f"{'':<16}{'transcripts/s':>16}")
+    print(f"{'baseline':<16}{baseline:>16,.0f}")
+    for label, mode in (("pool", "pool"), ("pool + NORMAL", "normal")):
+        rate = _run(mode, args.transcripts, args.threads)
+        print(f"{label:<16}{rate:>16,.0f}   ({rate / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+detect_language 마이크로 벤치마크 — 이전 다중 스캔 구현 대비 calls/sec
+
+    python scripts/bench_detect_language.py [--calls 200000]
+
+이전 구현(한글 → 한자 → 베트남어 순으로 ``any(...)`` 를 최대 세 번 훑는
+방식)을 여기 그대로 두고, 같은 발화 샘플로 현재 ``translation.detect_language``
+(한글 전용 fast path + 단일 패스 분류표)와 비교한다. 영어 발화처럼 앞선
+검사가 모두 빗나가는 경우가 이전 구현의 최악 경로다. 영어 용어가 섞인 한국어
+발화는 가중 다수결을 위해 글자 수를 세므로 이전 구현(첫 한글에서 종료)보다
+느리다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from collections.abc import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from translation import detect_language  # noqa: E402
+
+_SAMPLES = {
+    "en (worst case)": (
+        "Today we will talk about reducing latency in real-time captioning "
+        "for large conference halls with thousands of viewers."
+    ),
+    "ko": "오늘 발표에서는 실시간 자막 시스템의 지연 시간을 줄이는 방법을 소개합니다.",
+    "ko + en terms": "오늘은 AWS Lambda 와 Amazon Bedrock 으로 자막 파이프라인을 만듭니다.",
+    "zh": "今天我们将讨论如何降低实时字幕系统的延迟。",
+    "vi": "Hôm nay chúng ta sẽ nói về cách giảm độ trễ của phụ đề trực tiếp.",
+}
+
+
+_LEGACY_VIETNAMESE = set("ăơưđĂƠƯĐ")
+
+
+def _legacy_detect_language(text, output_lang="ko"):
+    if any(0xAC00 <= ord(c) <= 0xD7A3 for c in text):
+        detected = "ko"
+    elif any(0x4E00 <= ord(c) <= 0x9FFF for c in text):
+        detected = "zh"
+    elif any(c in _LEGACY_VIETNAMESE for c in text):
+        detected = "vi"
+    else:
+        detected = "en"
+    if detected == output_lang:
+        return detected, "ko" if detected == "en" else "en"
+    return detected, output_lang
+
+
+def _rate(fn: Callable[[str], object], text: str, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        fn(text)
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{'sample':<18}{'multi-scan':>16}{'current':>16}{'speedup':>10}")
+    for name, text in _SAMPLES.items():
+        legacy = _rate(_legacy_detect_language, text, args.calls)
+        current = _rate(detect_language, text, args.calls)
+        print(
+            f"{name:<18}{legacy:>14,.0f}/s{current:>14,.0f}/s{current / legacy:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
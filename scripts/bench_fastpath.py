@@ -0,0 +1,145 @@
+"""
+fastpath 벤치마크 — stdlib 대비 orjson / uvloop 의 messages/sec
+
+    python scripts/bench_fastpath.py [--messages 200000] [--viewers 200]
+
+JSON: WebSocket ``transcription_result`` / ``translation_partial`` 인코딩,
+SSE 프레임 인코딩(``encode_sse_frame``), Bedrock 스트리밍 청크 디코딩
+(``bedrock_stream._decode_event``) 을 백엔드별로 잰다.
+루프: ``BroadcastManager.publish`` → viewer cursor 수신 fan-out 을 루프
+구현별로 잰다 (viewer 당 전달된 프레임 수 기준).
+
+설치되지 않은 백엔드는 "n/a" 로 표시한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import os
+import sys
+import time
+from collections.abc import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fastpath  # noqa: E402
+from bedrock_stream import _decode_event  # noqa: E402
+from sse_broadcast import BroadcastManager, encode_sse_frame  # noqa: E402
+
+_TEXT_KO = "오늘 발표에서는 실시간 자막 시스템의 지연 시간을 줄이는 방법을 소개합니다."
+_TEXT_EN = "Today we will talk about reducing latency in real-time captioning."
+
+_CHUNK_HEADERS = {":message-type": "event", ":event-type": "chunk"}
+_CHUNK_PAYLOAD = fastpath.dumps_bytes(
+    {
+        "bytes": base64.b64encode(
+            fastpath.dumps_bytes(
+                {
+                    "type": "content_block_delta",
+                    "index": 0,
+                    "delta": {"type": "text_delta", "text": "실시간 자막"},
+                }
+            )
+        ).decode()
+    }
+)
+
+
+def _json_cases() -> dict[str, Callable[[], object]]:
+    return {
+        "ws transcription_result": lambda: fastpath.dumps(
+            {
+                "type": "transcription_result",
+                "original": _TEXT_EN,
+                "translated": _TEXT_KO,
+                "source_lang": "en",
+                "target_lang": "ko",
+                "timestamp": 1760000000.123,
+            }
+        ),
+        "ws translation_partial": lambda: fastpath.dumps(
+            {"type": "translation_partial", "text": _TEXT_KO}
+        ),
+        "sse frame": lambda: encode_sse_frame(
+            "message", {"text": _TEXT_KO, "lang": "ko", "is_final": True}, "42"
+        ),
+        "bedrock chunk decode": lambda: _decode_event(_CHUNK_HEADERS, _CHUNK_PAYLOAD),
+    }
+
+
+def _rate(fn: Callable[[], object], count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return count / (time.perf_counter() - start)
+
+
+async def _fan_out(messages: int, viewers: int) -> float:
+    manager = BroadcastManager()
+    cursors = [await manager.register_viewer("bench", "ko") for _ in range(viewers)]
+
+    async def _drain(cursor) -> None:
+        for _ in range(messages):
+            await cursor.get()
+
+    drains = [asyncio.create_task(_drain(c)) for c in cursors]
+    start = time.perf_counter()
+    for i in range(messages):
+        await manager.publish("bench", "ko", {"text": _TEXT_KO, "seq": i})
+        # 느린 viewer 가 ring buffer 밖으로 밀리지 않도록 한 번씩 양보한다.
+        await asyncio.sleep(0)
+    await asyncio.gather(*drains)
+    return messages * viewers / (time.perf_counter() - start)
+
+
+def _fmt(rate: float | None) -> str:
+    return "n/a" if rate is None else f"{rate:,.0f}/s"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--viewers", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'JSON':<26}{'stdlib':>16}{'orjson':>16}{'speedup':>10}")
+    for name, fn in _json_cases().items():
+        rates: dict[str, float | None] = {}
+        for backend in ("stdlib", "orjson"):
+            if fastpath.set_json_backend(backend) != backend:
+                rates[backend] = None
+                continue
+            rates[backend] = _rate(fn, args.messages)
+        speedup = (
+            f"{rates['orjson'] / rates['stdlib']:.2f}x" if rates["orjson"] else "-"
+        )
+        print(
+            f"{name:<26}{_fmt(rates['stdlib']):>16}"
+            f"{_fmt(rates['orjson']):>16}{speedup:>10}"
+        )
+    fastpath.set_json_backend("auto")
+
+    fan_out_messages = max(args.messages // 200, 100)
+    print(
+        f"\n{'SSE fan-out':<26}{'asyncio':>16}{'uvloop':>16}{'speedup':>10}"
+        f"   ({fan_out_messages} msgs x {args.viewers} viewers,"
+        f" JSON={fastpath.json_backend()})"
+    )
+    rates = {}
+    for backend in ("asyncio", "uvloop"):
+        os.environ["REALTIME_EVENT_LOOP"] = backend
+        if fastpath.event_loop_backend() != backend:
+            rates[backend] = None
+            continue
+        rates[backend] = fastpath.run(_fan_out(fan_out_messages, args.viewers))
+    speedup = f"{rates['uvloop'] / rates['asyncio']:.2f}x" if rates["uvloop"] else "-"
+    print(
+        f"{'publish → viewer':<26}{_fmt(rates['asyncio']):>16}"
+        f"{_fmt(rates['uvloop']):>16}{speedup:>10}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""
+진행 중 전사(delta)의 추측 번역 모듈
+
+오퍼레이터 브라우저는 OpenAI Realtime 의 전사 delta 를 ``transcript_delta``
+메시지로 누적 전달한다. 화자가 아직 말하는 동안 안정된 문장(뒤에 다음
+문장이 이미 시작된 문장)을 먼저 번역해 두고, VAD 턴이 닫혀 최종 transcript
+가 오면 그 결과와 맞춰(reconcile) 재사용한다.
+
+설계 요약
+---------
+- 안정 구간 판정은 ``translation.split_into_sentences`` 를 쓴다. 마지막
+  문장은 아직 자라는 중일 수 있으므로 항상 제외한다.
+- 발화(item_id)별로 문장 → 번역 task 를 보관한다. 최종 transcript 의 앞쪽
+  문장이 추측 문장과 (공백 정규화 기준) 일치하는 동안만 결과를 재사용하고,
+  첫 불일치부터 끝까지는 호출자가 다시 번역한다.
+- 언어 쌍이 바뀌면 (language_update) 기존 추측은 버린다.
+- 연결당 추적하는 발화 수에 상한을 둔다 — 최종 transcript 가 오지 않은
+  발화가 쌓여도 메모리가 늘지 않는다.
+- 긴 최종 transcript 는 ``translate_sentences_pipelined`` 로 문장별 동시
+  번역하고, 원문 순서대로 누적 prefix 를 흘려보낸다 (첫 자막까지의 시간이
+  문단 전체가 아니라 첫 문장 번역 시간으로 묶인다).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from translation import split_into_sentences
+
+# 연결당 동시에 추적하는 발화(item_id) 수 상한.
+MAX_TRACKED_ITEMS = 8
+
+# (sentence, source_lang, target_lang) -> (translated_text | None, used_llm)
+SentenceTranslateFn = Callable[[str, str, str], Awaitable[tuple[str | None, bool]]]
+
+# (item_id, cumulative_translated_prefix, target_lang) -> None
+PrefixReadyFn = Callable[[str, str, str], Awaitable[None]]
+
+# 문장 파이프라인을 쓰는 최소 원문 길이 (문자). 짧은 발화는 한 번에 번역하는
+# 편이 문맥 보존에 유리하고 스트리밍 부분 결과로 이미 충분히 빠르다.
+SENTENCE_PIPELINE_MIN_CHARS = int(os.getenv("SENTENCE_PIPELINE_MIN_CHARS", "160"))
+
+# 문장 사이를 공백 없이 잇는 출력 언어.
+_NO_SPACE_LANGS = frozenset({"zh", "ja"})
+
+
+def join_sentences(parts: list[str], lang: str) -> str:
+    """번역 문장들을 출력 언어 관례에 맞게 이어 붙인다."""
+    sep = "" if lang in _NO_SPACE_LANGS else " "
+    return sep.join(p.strip() for p in parts if p and p.strip())
+
+
+def stable_sentences(text: str, source_lang: str) -> list[str]:
+    """누적 전사에서 더 이상 바뀌지 않을 앞쪽 문장들 (마지막 문장 제외)."""
+    sentences = split_into_sentences(text, source_lang)
+    return sentences[:-1]
+
+
+def pipeline_sentences(text: str, source_lang: str) -> list[str]:
+    """문장 파이프라인 대상이면 문장 목록, 아니면 빈 리스트."""
+    if len(text) < SENTENCE_PIPELINE_MIN_CHARS:
+        return []
+    sentences = split_into_sentences(text, source_lang)
+    return sentences if len(sentences) >= 2 else []
+
+
+def _same(a: str, b: str) -> bool:
+    return " ".join(a.split()) == " ".join(b.split())
+
+
+@dataclass
+class _Speculation:
+    source_lang: str
+    target_lang: str
+    sentences: list[str] = field(default_factory=list)
+    tasks: list[asyncio.Task] = field(default_factory=list)
+    results: list[str | None] = field(default_factory=list)
+    # 앞에서부터 연속으로 완료되어 이미 알린 문장 수.
+    announced: int = 0
+
+
+@dataclass
+class SentenceTranslation:
+    """문장 단위 번역 결과 (reconcile / 파이프라인 공용).
+
+    ``translated`` 는 재사용한 앞쪽 번역 문장들, ``remainder`` 는 호출자가
+    새로 번역해야 하는 나머지 원문이다 (없으면 빈 문자열).
+    """
+
+    translated: list[str]
+    remainder: str
+    used_llm: bool = False
+
+
+class SpeculativeTranslator:
+    """연결 단위 추측 번역기. 이벤트 루프 스레드에서만 사용한다."""
+
+    def __init__(
+        self,
+        translate_sentence: SentenceTranslateFn,
+        on_prefix_ready: PrefixReadyFn | None = None,
+        *,
+        max_items: int = MAX_TRACKED_ITEMS,
+    ) -> None:
+        self._translate = translate_sentence
+        self._on_prefix_ready = on_prefix_ready
+        self._max_items = max_items
+        self._items: OrderedDict[str, _Speculation] = OrderedDict()
+
+    def on_delta(
+        self, item_id: str, text: str, source_lang: str, target_lang: str
+    ) -> int:
+        """누적 전사를 받아 새로 안정된 문장의 번역을 시작한다.
+
+        반환: 이번 호출에서 새로 시작한 문장 수.
+        """
+        spec = self._items.get(item_id)
+        if spec is not None and (
+            spec.source_lang != source_lang or spec.target_lang != target_lang
+        ):
+            self.discard(item_id)
+            spec = None
+        if spec is None:
+            spec = _Speculation(source_lang, target_lang)
+            self._items[item_id] = spec
+            while len(self._items) > self._max_items:
+                _, oldest = self._items.popitem(last=False)
+                _cancel(oldest)
+
+        stable = stable_sentences(text, source_lang)
+        # 이미 시작한 문장이 바뀌었다면 (전사 보정) 그 지점부터 다시 시작한다.
+        keep = 0
+        while (
+            keep < len(spec.sentences)
+            and keep < len(stable)
+            and _same(spec.sentences[keep], stable[keep])
+        ):
+            keep += 1
+        if keep < len(spec.sentences):
+            for task in spec.tasks[keep:]:
+                task.cancel()
+            del spec.sentences[keep:]
+            del spec.tasks[keep:]
+            del spec.results[keep:]
+            spec.announced = min(spec.announced, keep)
+
+        started = 0
+        for sentence in stable[len(spec.sentences) :]:
+            index = len(spec.sentences)
+            spec.sentences.append(sentence)
+            spec.results.append(None)
+            spec.tasks.append(
+                asyncio.create_task(self._run(item_id, spec, index, sentence))
+            )
+            started += 1
+        return started
+
+    async def reconcile(
+        self, item_id: str | None, final_text: str, source_lang: str, target_lang: str
+    ) -> SentenceTranslation:
+        """최종 transcript 와 추측 결과를 맞춘다. 호출 후 item 은 정리된다."""
+        spec = self._items.pop(item_id, None) if item_id else None
+        if spec is None:
+            return SentenceTranslation([], final_text)
+        if spec.source_lang != source_lang or spec.target_lang != target_lang:
+            _cancel(spec)
+            return SentenceTranslation([], final_text)
+
+        final_sentences = split_into_sentences(final_text, source_lang)
+        matched = 0
+        while (
+            matched < len(spec.sentences)
+            and matched < len(final_sentences)
+            and _same(spec.sentences[matched], final_sentences[matched])
+        ):
+            matched += 1
+        for task in spec.tasks[matched:]:
+            task.cancel()
+
+        translated: list[str] = []
+        used_llm = False
+        for task in spec.tasks[:matched]:
+            try:
+                text, llm = await task
+            except asyncio.CancelledError:
+                break
+            if not text:
+                break
+            translated.append(text)
+            used_llm = used_llm or llm
+        # 실패/빈 결과가 나온 문장부터는 남은 task 를 버리고 다시 번역한다.
+        for task in spec.tasks[len(translated) : matched]:
+            task.cancel()
+        remainder = " ".join(final_sentences[len(translated) :])
+        return SentenceTranslation(translated, remainder, used_llm)
+
+    def discard(self, item_id: str) -> None:
+        spec = self._items.pop(item_id, None)
+        if spec is not None:
+            _cancel(spec)
+
+    def close(self) -> None:
+        """연결 종료 시 진행 중인 추측 번역을 모두 취소한다."""
+        for spec in self._items.values():
+            _cancel(spec)
+        self._items.clear()
+
+    def tracked_items(self) -> int:
+        return len(self._items)
+
+    async def _run(
+        self, item_id: str, spec: _Speculation, index: int, sentence: str
+    ) -> tuple[str | None, bool]:
+        try:
+            result = await self._translate(sentence, spec.source_lang, spec.target_lang)
+        except Exception as e:
+            # reconcile 이 이 문장을 다시 번역한다 — 예외는 로그로만 남긴다.
+            print(f"[Speculative] 문장 번역 실패: {e!r}")
+            return None, False
+        # 전사 보정으로 이 문장이 교체됐다면 결과를 기록하지 않는다.
+        if index < len(spec.tasks) and spec.tasks[index] is asyncio.current_task():
+            spec.results[index] = result[0]
+            await self._announce(item_id, spec)
+        return result
+
+    async def _announce(self, item_id: str, spec: _Speculation) -> None:
+        """앞에서부터 연속으로 끝난 문장 번역을 누적 prefix 로 알린다."""
+        if self._on_prefix_ready is None:
+            return
+        done = 0
+        while done < len(spec.results) and spec.results[done]:
+            done += 1
+        if done <= spec.announced:
+            return
+        spec.announced = done
+        try:
+            await self._on_prefix_ready(
+                item_id,
+                join_sentences(spec.results[:done], spec.target_lang),
+                spec.target_lang,
+            )
+        except Exception as e:
+            # best-effort — 알림 실패가 추측 번역 결과에 영향을 주지 않는다.
+            print(f"[Speculative] prefix 전송 실패: {e!r}")
+
+
+def _cancel(spec: _Speculation) -> None:
+    for task in spec.tasks:
+        task.cancel()
+
+
+async def translate_sentences_pipelined(
+    sentences: list[str],
+    source_lang: str,
+    target_lang: str,
+    translate_sentence: SentenceTranslateFn,
+    on_prefix: Callable[[str], Awaitable[None]] | None = None,
+    *,
+    prefix: str = "",
+) -> SentenceTranslation:
+    """문장들을 동시에 번역하고 원문 순서대로 결과를 내보낸다.
+
+    모든 문장 번역을 한꺼번에 시작하고, 결과는 순서 버퍼(task 목록을 앞에서
+    부터 await)로 정렬한다 — 뒤 문장이 먼저 끝나도 앞 문장이 끝날 때까지
+    내보내지 않는다. 각 문장이 확정될 때마다 ``on_prefix`` 에
+    ``prefix + 지금까지의 번역`` 누적 텍스트를 넘긴다.
+
+    어떤 문장이 실패(예외/빈 결과)하면 나머지 task 를 취소하고, 그 문장부터의
+    원문을 ``remainder`` 로 돌려 호출자가 기존 경로로 번역하게 한다.
+    """
+    tasks = [
+        asyncio.create_task(translate_sentence(s, source_lang, target_lang))
+        for s in sentences
+    ]
+    translated: list[str] = []
+    used_llm = False
+    try:
+        for task in tasks:
+            try:
+                text, llm = await task
+            except Exception as e:
+                print(f"[Pipeline] 문장 번역 실패: {e!r}")
+                break
+            if not text:
+                break
+            translated.append(text)
+            used_llm = used_llm or llm
+            if on_prefix is not None:
+                try:
+                    await on_prefix(join_sentences([prefix, *translated], target_lang))
+                except Exception as e:
+                    print(f"[Pipeline] 부분 전송 실패: {e!r}")
+    finally:
+        for task in tasks[len(translated) :]:
+            task.cancel()
+    remainder = " ".join(sentences[len(translated) :])
+    return SentenceTranslation(translated, remainder, used_llm)
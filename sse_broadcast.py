@@ -8,16 +8,19 @@
 ---------
 - Streamlit 은 SSE 를 네이티브 지원하지 않으므로, 별도 aiohttp 기반 경량 HTTP
   서버를 daemon thread 로 구동한다 (``services.py`` 의 health server 패턴 참고).
-- 룸 단위 / 언어 단위로 viewer 큐를 분리한다. websocket_handler 의
-  ``_handle_transcript`` 가 메인 언어 번역을 publish 한 직후 추가 언어를
+- 룸 단위 / 언어 단위 채널마다 고정 크기 ring buffer 하나를 두고, viewer 는
+  시퀀스 번호 cursor 만 가진다 (publish O(1), 채널당 메모리 일정).
+  websocket_handler 의 ``_handle_transcript`` 가 메인 언어 번역을 publish 한 직후 추가 언어를
   ``asyncio.create_task`` 로 비동기 번역해 메인 송출이 블로킹되지 않도록 한다.
 - 추가 언어에 viewer 가 한 명도 없으면 번역 자체를 스킵한다 (lazy translation).
+- viewer 가 있는 추가 언어가 여럿이면 멀티 타깃 LLM 호출 한 번으로 묶고,
+  결과에서 빠진 언어만 언어별 번역으로 폴백한다.
 - 외부 노출 에러 메시지는 모두 generic 하게 유지한다 (RL-006). 룸 조회/내부
   처리 예외는 서버 로그에만 남기고 클라이언트에는 일반 404/500 만 노출한다.
 
 API
 ---
-- :class:`BroadcastManager` : (room_id, lang) 채널별 viewer 큐 등록/해제/배포.
+- :class:`BroadcastManager` : (room_id, lang) 채널별 viewer cursor 등록/해제/배포.
 - :func:`build_sse_app` : aiohttp ``web.Application`` 을 생성한다 (테스트 친화).
 - :func:`run_sse_server` : daemon thread 진입점. 서버 시작 시 한 번 호출한다.
 - :func:`broadcast_translation_for_room` : websocket_handler 가 호출하는
@@ -29,38 +32,383 @@ from __future__ import annotations
 import asyncio
 import html
 import json
+import os
+import secrets
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Mapping
 from pathlib import Path
 from typing import Any
 
 from aiohttp import web
 
+import fastpath
+from room_cache import get_room_cache
 from translation import SUPPORTED_OUTPUT_LANGS
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
-# 뷰어 큐의 최대 길이. 청중이 일시적으로 끊겨도 backpressure 로 메모리가
-# 무한 증가하지 않도록 막는 안전장치. 큐가 가득 차면 가장 오래된 메시지를
-# 1건 비우고 새 메시지를 넣는다 (캡션 도메인 — 약간의 자막 손실은 허용,
-# 메모리 누수는 불가).
-_DEFAULT_QUEUE_MAXSIZE = 32
+# (room, lang) 채널 ring buffer 의 크기. 청중이 일시적으로 끊겨도 채널당
+# 메모리가 일정하게 유지되도록 막는 안전장치. 가장 느린 viewer 가 이보다
+# 뒤처지면 밀려난 메시지 수를 ``gap`` 이벤트로 명시적으로 알린다 (캡션
+# 도메인 — 약간의 자막 손실은 허용, 메모리 누수는 불가).
+_DEFAULT_BUFFER_SIZE = int(os.getenv("SSE_CHANNEL_BUFFER_SIZE", "32"))
+
+# 마지막 viewer 가 떠난 뒤에도 채널 ring buffer 를 유지하는 시간(초). 행사장
+# Wi-Fi 가 잠깐 끊겼다 붙은 viewer 가 ``Last-Event-ID`` 로 그 사이 자막을
+# 이어받을 수 있게 한다. 0 이면 즉시 정리한다.
+_RESUME_RETENTION_SECONDS = float(os.getenv("SSE_RESUME_RETENTION_SECONDS", "60"))
+
+# 유휴 연결에 ``: ping`` comment 를 보내는 간격(초). 최근 데이터를 받은
+# 연결은 ping 을 건너뛰므로 실제 무음 구간은 최대 1.5배까지 늘어난다 —
+# 그 값이 프록시/CDN 의 idle timeout 보다 짧아야 한다.
+_HEARTBEAT_INTERVAL_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "5"))
+
+# heartbeat wheel 의 슬롯 수. 연결을 슬롯에 고르게 나눠 interval/슬롯 마다
+# 한 슬롯씩 ping 한다 — 수천 연결의 ping 쓰기가 한 순간에 몰리지 않는다.
+_HEARTBEAT_SLOTS = 10
+
+# 모든 연결이 공유하는 keep-alive comment 프레임 (SSE spec: ":" 줄은 무시됨).
+_PING_FRAME = b": ping\n\n"
 
 # Type alias for the translate callback the websocket_handler passes in.
 # Signature: (text, source_lang, target_lang) -> translated_text
 TranslateFn = Callable[[str, str, str], Awaitable[str | None]]
 
+# Batched multi-target translate callback (one LLM round trip for every
+# secondary language). Signature: (text, source_lang, target_langs) ->
+# async iterator of (lang, translated_text), yielded as each language is ready.
+MultiTranslateFn = Callable[[str, str, list[str]], AsyncIterator[tuple[str, str]]]
+
+# Channel membership listener (cross-process backend, see broadcast_hub).
+# Signature: (room_id, lang, live_viewer_count, joined) — ``joined`` is True
+# only for a newly registered, non-resumed viewer.
+ViewerChangeFn = Callable[[str, str, int, bool], None]
+
+
+# ---------------------------------------------------------------------------
+# Pre-encoded SSE frames
+# ---------------------------------------------------------------------------
+def encode_sse_frame(
+    event_name: str, payload: Mapping[str, Any], event_id: str | None = None
+) -> bytes:
+    """Encode one SSE event as ``[id: ...\n]event: ...\ndata: <json>\n\n``."""
+    data_line = fastpath.dumps_bytes(dict(payload))
+    id_line = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{id_line}event: {event_name}\ndata: ".encode() + data_line + b"\n\n"
+
+
+class SseFrame(Mapping[str, Any]):
+    """Immutable published payload plus its SSE wire bytes, encoded once.
+
+    ``publish`` builds one frame per (room, lang) message and fans the same
+    object out to every viewer, so a caption seen by 2,000 viewers is
+    JSON-encoded once instead of 2,000 times. The Mapping interface keeps
+    the payload readable (``frame["text"]``) for tests and consumers that
+    only care about the content; ``data`` is what the SSE handler writes.
+    """
+
+    __slots__ = ("_payload", "data")
+
+    def __init__(
+        self,
+        payload: Mapping[str, Any],
+        event_name: str = "message",
+        event_id: str | None = None,
+    ):
+        # Snapshot — later mutation of the caller's dict must not change
+        # what viewers that have not yet been served will receive.
+        self._payload = dict(payload)
+        self.data = encode_sse_frame(event_name, self._payload, event_id)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._payload[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._payload)
+
+    def __len__(self) -> int:
+        return len(self._payload)
+
+    def __repr__(self) -> str:
+        return f"SseFrame({self._payload!r})"
+
+
+# ---------------------------------------------------------------------------
+# Per-channel ring buffer + viewer cursors
+# ---------------------------------------------------------------------------
+class _Channel:
+    """Fixed-size ring buffer of frames for one (room_id, lang) channel.
+
+    Every published frame gets a monotonically increasing sequence number.
+    Frames live in ``_slots[seq % size]`` so publish is O(1) regardless of
+    viewer count, and memory stays constant per channel. One shared
+    ``asyncio.Event`` wakes every waiting viewer; it is swapped for a fresh
+    one on each publish so waiters never see a stale "set" state.
+
+    The channel belongs to the event loop that created it (the SSE server's
+    loop). ``publish`` usually runs on another thread's loop (the WebSocket
+    server in app.py daemon-thread mode), and ``asyncio.Event`` is not
+    thread-safe, so a foreign-thread append is handed to the owning loop
+    with ``call_soon_threadsafe`` — that also wakes the loop's selector, so
+    delivery never waits for an unrelated timer (e.g. the heartbeat).
+
+    The SSE ``id`` of a frame is ``"<epoch>-<seq>"``. ``epoch`` is random per
+    channel instance, so an id from a previous server process (or from an
+    expired channel) is recognised as foreign instead of being mistaken for
+    a position in the current buffer.
+    """
+
+    __slots__ = (
+        "_slots",
+        "_size",
+        "next_seq",
+        "_event",
+        "_loop",
+        "viewers",
+        "epoch",
+        "expiry",
+    )
+
+    def __init__(self, size: int) -> None:
+        self._size = max(1, size)
+        self._slots: list[SseFrame | None] = [None] * self._size
+        # Sequence number the next published frame will get.
+        self.next_seq = 0
+        self._event = asyncio.Event()
+        # Viewers wait on ``_event`` in this loop only.
+        self._loop = asyncio.get_running_loop()
+        self.viewers: set[ViewerCursor] = set()
+        self.epoch = secrets.token_hex(4)
+        # Pending retention-expiry timer while the channel has no viewers.
+        self.expiry: asyncio.TimerHandle | None = None
+
+    @property
+    def first_seq(self) -> int:
+        """Oldest sequence number still held in the buffer."""
+        return max(0, self.next_seq - self._size)
+
+    def append(self, payload: Mapping[str, Any]) -> None:
+        """Encode ``payload`` with the next sequence id and store it.
+
+        Safe to call from any thread: off the owning loop the append is
+        scheduled on it (``payload`` is snapshotted first).
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is not self._loop:
+            try:
+                self._loop.call_soon_threadsafe(self._append, dict(payload))
+            except RuntimeError:
+                # Owning loop already closed — the SSE server is gone and
+                # there is no viewer left to deliver to.
+                pass
+            return
+        self._append(payload)
+
+    def _append(self, payload: Mapping[str, Any]) -> None:
+        event_id = f"{self.epoch}-{self.next_seq}"
+        self._slots[self.next_seq % self._size] = SseFrame(payload, event_id=event_id)
+        self.next_seq += 1
+        event, self._event = self._event, asyncio.Event()
+        event.set()
+
+    def frame_at(self, seq: int) -> SseFrame | None:
+        """Frame for ``seq``; caller guarantees first_seq <= seq < next_seq."""
+        return self._slots[seq % self._size]
+
+    def resume_seq(self, last_event_id: str | None) -> int | None:
+        """Sequence to resume from for an SSE ``Last-Event-ID``, or None.
+
+        None means the id does not belong to this channel instance (no id,
+        malformed, other epoch) — the viewer starts at the head instead.
+        Ids ahead of the head are clamped to it.
+        """
+        if not last_event_id:
+            return None
+        epoch, _, seq_text = last_event_id.partition("-")
+        if epoch != self.epoch or not seq_text.isdigit():
+            return None
+        return min(int(seq_text) + 1, self.next_seq)
+
+    async def wait(self) -> None:
+        await self._event.wait()
+
+
+class ViewerCursor:
+    """A viewer's read position in its channel's ring buffer.
+
+    Viewers hold only this cursor — no per-viewer queue. ``get`` returns the
+    next frame, waiting for a publish if the viewer is caught up. A viewer
+    that fell further behind than the buffer holds receives one ``gap``
+    frame (``{"skipped": N}``) and resumes at the oldest retained frame.
+    """
+
+    __slots__ = ("_channel", "_cursor", "resumed", "__weakref__")
+
+    def __init__(self, channel: _Channel, start_seq: int | None = None) -> None:
+        self._channel = channel
+        # True when the viewer reattached via Last-Event-ID (replay).
+        self.resumed = start_seq is not None
+        self._cursor = channel.next_seq if start_seq is None else start_seq
+
+    def qsize(self) -> int:
+        """Number of frames this viewer has not consumed yet."""
+        ch = self._channel
+        return ch.next_seq - max(self._cursor, ch.first_seq)
+
+    def empty(self) -> bool:
+        return self._cursor >= self._channel.next_seq
+
+    def get_nowait(self) -> SseFrame:
+        """Return the next frame or raise ``asyncio.QueueEmpty``."""
+        ch = self._channel
+        if self._cursor >= ch.next_seq:
+            raise asyncio.QueueEmpty()
+        first = ch.first_seq
+        if self._cursor < first:
+            skipped = first - self._cursor
+            self._cursor = first
+            return SseFrame({"skipped": skipped, "timestamp": time.time()}, "gap")
+        frame = ch.frame_at(self._cursor)
+        self._cursor += 1
+        return frame
+
+    async def get(self) -> SseFrame:
+        """Return the next frame, waiting for a publish if caught up."""
+        while True:
+            try:
+                return self.get_nowait()
+            except asyncio.QueueEmpty:
+                await self._channel.wait()
+
+
+# ---------------------------------------------------------------------------
+# Loop-wide heartbeat
+# ---------------------------------------------------------------------------
+class _HeartbeatConn:
+    """Heartbeat bookkeeping for one registered SSE response."""
+
+    __slots__ = ("transport", "slot", "last_write")
+
+    def __init__(self, transport: Any, slot: int, last_write: float) -> None:
+        self.transport = transport
+        self.slot = slot
+        self.last_write = last_write
+
+
+class _HeartbeatWheel:
+    """One timer per event loop that keeps every idle SSE connection alive.
+
+    Viewer handlers no longer race their read against a per-viewer timeout;
+    they register their response here and block on ``cursor.get()`` only.
+
+    Connections are spread round-robin over ``slots`` buckets. A single task
+    wakes every ``interval / slots`` seconds and writes the shared
+    ``_PING_FRAME`` to the idle connections of the next bucket, so each
+    connection is visited once per ``interval`` and the writes are staggered
+    instead of hitting every socket at the same instant. The task runs only
+    while at least one connection is registered.
+
+    A connection is skipped when it received data (``touch``) within the last
+    half interval — a busy caption channel needs no keep-alive — or when
+    bytes are still queued in its transport, so a ping never waits on a slow
+    client's drain. Either way the longest silence is 1.5 × ``interval``.
+
+    Disconnects are not detected here — aiohttp's ``connection_lost`` cancels
+    the handler (``handler_cancellation``). A failed ping write just drops
+    the connection from the wheel.
+
+    Caption delivery never depends on this timer: publishes wake viewers
+    through their channel's owning loop (see :class:`_Channel`), so the
+    interval is purely a keep-alive setting.
+    """
+
+    def __init__(
+        self,
+        interval: float = _HEARTBEAT_INTERVAL_SECONDS,
+        slots: int = _HEARTBEAT_SLOTS,
+    ) -> None:
+        self._interval = interval
+        self._slots: list[set[web.StreamResponse]] = [
+            set() for _ in range(max(1, slots))
+        ]
+        self._conns: dict[web.StreamResponse, _HeartbeatConn] = {}
+        # Bucket the next tick visits / bucket the next connection joins.
+        self._cursor = 0
+        self._next_slot = 0
+        self._task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._conns)
+
+    def add(self, resp: web.StreamResponse, transport: Any) -> None:
+        slot = self._next_slot
+        self._next_slot = (slot + 1) % len(self._slots)
+        self._conns[resp] = _HeartbeatConn(transport, slot, time.monotonic())
+        self._slots[slot].add(resp)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def touch(self, resp: web.StreamResponse) -> None:
+        """Record that ``resp`` just received data (postpones its next ping)."""
+        conn = self._conns.get(resp)
+        if conn is not None:
+            conn.last_write = time.monotonic()
+
+    def discard(self, resp: web.StreamResponse) -> None:
+        conn = self._conns.pop(resp, None)
+        if conn is not None:
+            self._slots[conn.slot].discard(resp)
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        tick = self._interval / len(self._slots)
+        while self._conns:
+            await asyncio.sleep(tick)
+            await self._tick()
+
+    async def _tick(self) -> None:
+        """Ping the idle connections of the current bucket, then advance."""
+        bucket = self._slots[self._cursor]
+        self._cursor = (self._cursor + 1) % len(self._slots)
+        now = time.monotonic()
+        quiet_since = now - self._interval / 2
+        # Snapshot — handlers add/discard while pings are awaited.
+        for resp in list(bucket):
+            conn = self._conns.get(resp)
+            if conn is None or conn.last_write > quiet_since:
+                continue
+            if conn.transport is None or conn.transport.get_write_buffer_size():
+                continue
+            try:
+                await resp.write(_PING_FRAME)
+            except Exception:
+                # Closing transport; connection_lost unregisters the viewer.
+                self.discard(resp)
+            else:
+                conn.last_write = now
+
 
 # ---------------------------------------------------------------------------
 # BroadcastManager
 # ---------------------------------------------------------------------------
 class BroadcastManager:
-    """(room_id, lang) 채널 기준 viewer 큐 레지스트리.
+    """(room_id, lang) 채널 기준 ring buffer + viewer cursor 레지스트리.
 
     websocket_handler 가 메인/추가 언어 번역 결과를 publish 하면, 해당
-    채널을 구독 중인 모든 SSE viewer 큐에 payload 가 enqueue 된다.
-    SSE handler 는 큐에서 dequeue 해 ``data: ...\\n\\n`` 포맷으로 송신한다.
+    채널의 ring buffer 에 프레임이 한 번 추가되고 대기 중인 viewer 가 모두
+    깨어난다. SSE handler 는 자기 cursor 로 프레임을 읽어 그대로 송신한다.
 
     ISSUE-33: viewer metrics
     -------------------------
@@ -75,14 +423,19 @@ class BroadcastManager:
 
     def __init__(
         self,
-        queue_maxsize: int = _DEFAULT_QUEUE_MAXSIZE,
+        buffer_size: int = _DEFAULT_BUFFER_SIZE,
         *,
         metrics_repo: Any | None = None,
+        retention_seconds: float = _RESUME_RETENTION_SECONDS,
+        on_viewer_change: ViewerChangeFn | None = None,
     ) -> None:
-        # (room_id, lang) -> set[asyncio.Queue]
-        self._channels: dict[tuple[str, str], set[asyncio.Queue]] = {}
+        # (room_id, lang) -> _Channel (ring buffer + registered cursors).
+        # Channels whose last viewer left stay here for ``retention_seconds``
+        # so reconnecting viewers can replay what they missed.
+        self._channels: dict[tuple[str, str], _Channel] = {}
         self._lock = asyncio.Lock()
-        self._queue_maxsize = queue_maxsize
+        self._buffer_size = buffer_size
+        self._retention_seconds = retention_seconds
         # ISSUE-33: viewer metrics state.
         # room_id -> total current count
         self._current: dict[str, int] = {}
@@ -91,9 +444,24 @@ class BroadcastManager:
         # database.Room 호환 (update_viewer_metrics / get_viewer_metrics).
         # Typed Any to avoid an import cycle and to keep tests trivial.
         self._metrics_repo = metrics_repo
+        # SSE worker processes report channel membership to the broadcast
+        # hub through this hook (broadcast_hub.HubSubscriber.notify).
+        self._on_viewer_change = on_viewer_change
+
+    async def register_viewer(
+        self, room_id: str, lang: str, last_event_id: str | None = None
+    ) -> ViewerCursor:
+        """Add a viewer to (room_id, lang) and return its cursor.
+
+        The cursor starts at the channel's next sequence number, so the viewer
+        receives only messages published after registration. With a
+        ``last_event_id`` from this channel (EventSource reconnect), it starts
+        right after that event instead and replays the gap from the ring
+        buffer; if the gap is larger than the buffer the viewer gets a
+        ``gap`` event first.
 
-    async def register_viewer(self, room_id: str, lang: str) -> asyncio.Queue:
-        """Add a viewer to (room_id, lang) and return its dedicated queue.
+        Resumed viewers are not counted as new viewers in the persisted
+        metrics (no DB write) — a reconnect storm stays in memory.
 
         Side effects (ISSUE-33):
           - in-memory current count for ``room_id`` increments by 1.
@@ -104,21 +472,30 @@ class BroadcastManager:
             logged and swallowed (RL-006) — viewers must never see a 5xx
             because the metrics persistence path is flaky.
         """
-        q: asyncio.Queue = asyncio.Queue(maxsize=self._queue_maxsize)
         async with self._lock:
-            self._channels.setdefault((room_id, lang), set()).add(q)
+            channel = self._channels.get((room_id, lang))
+            if channel is None:
+                channel = _Channel(self._buffer_size)
+                self._channels[(room_id, lang)] = channel
+            if channel.expiry is not None:
+                channel.expiry.cancel()
+                channel.expiry = None
+            cursor = ViewerCursor(channel, channel.resume_seq(last_event_id))
+            channel.viewers.add(cursor)
             # In-memory metrics — accurate even when no DB repo is attached.
             new_total = self._current.get(room_id, 0) + 1
             self._current[room_id] = new_total
             lang_map = self._by_lang.setdefault(room_id, {})
             lang_map[lang] = lang_map.get(lang, 0) + 1
             current_for_db = new_total
+            live = len(channel.viewers)
 
+        self._notify_viewer_change(room_id, lang, live, not cursor.resumed)
         # DB persistence runs OUTSIDE the asyncio lock — repo is sync and
         # we don't want a slow SQLite write to serialise concurrent
         # registers. Errors are isolated; in-memory state is the source of
         # truth for the live snapshot.
-        if self._metrics_repo is not None:
+        if self._metrics_repo is not None and not cursor.resumed:
             try:
                 self._metrics_repo.update_viewer_metrics(
                     room_id, total_delta=1, current=current_for_db
@@ -129,12 +506,12 @@ class BroadcastManager:
                     f"[SSE] metrics_repo.update_viewer_metrics failed "
                     f"(room={room_id} lang={lang}): {e!r}"
                 )
-        return q
+        return cursor
 
     async def unregister_viewer(
-        self, room_id: str, lang: str, queue: asyncio.Queue
+        self, room_id: str, lang: str, cursor: ViewerCursor
     ) -> None:
-        """Remove a viewer queue. No-op if the channel/queue is unknown.
+        """Remove a viewer cursor. No-op if the channel/cursor is unknown.
 
         Side effects (ISSUE-33):
           - in-memory current count decrements by 1 (clamped at 0 — defensive).
@@ -146,20 +523,30 @@ class BroadcastManager:
         """
         key = (room_id, lang)
         async with self._lock:
-            viewers = self._channels.get(key)
-            if viewers is None:
+            channel = self._channels.get(key)
+            if channel is None:
                 return
-            had_queue = queue in viewers
-            viewers.discard(queue)
-            if not viewers:
-                # Drop empty channel so has_viewers reports False quickly
-                # and lazy translation gates publication accurately.
-                self._channels.pop(key, None)
-
-            # Only mutate counters if the queue we removed was actually
+            had_cursor = cursor in channel.viewers
+            channel.viewers.discard(cursor)
+            if not channel.viewers and channel.expiry is None:
+                # has_viewers already reports False (lazy translation stops).
+                # Keep the ring buffer for the retention window so a viewer
+                # reconnecting with Last-Event-ID can replay the gap, then
+                # drop it — memory stays bounded by recently-live channels.
+                if self._retention_seconds > 0:
+                    channel.expiry = asyncio.get_running_loop().call_later(
+                        self._retention_seconds,
+                        self._expire_channel,
+                        key,
+                        channel,
+                    )
+                else:
+                    self._channels.pop(key, None)
+
+            # Only mutate counters if the cursor we removed was actually
             # registered — guards against double-unregister scenarios that
             # would otherwise underflow the count.
-            if had_queue:
+            if had_cursor:
                 # Per-language decrement.
                 lang_map = self._by_lang.get(room_id)
                 if lang_map is not None:
@@ -174,6 +561,21 @@ class BroadcastManager:
                     self._current.pop(room_id, None)
                 else:
                     self._current[room_id] = new_total
+            live = len(channel.viewers)
+
+        if had_cursor:
+            self._notify_viewer_change(room_id, lang, live, False)
+
+    def _notify_viewer_change(
+        self, room_id: str, lang: str, live: int, joined: bool
+    ) -> None:
+        if self._on_viewer_change is None:
+            return
+        try:
+            self._on_viewer_change(room_id, lang, live, joined)
+        except Exception as e:
+            # Same isolation as metrics_repo — never fail a viewer for it.
+            print(f"[SSE] on_viewer_change failed (room={room_id}): {e!r}")
 
     def get_metrics(self, room_id: str) -> dict[str, Any]:
         """Return live in-memory snapshot for ``room_id`` (ISSUE-33).
@@ -204,40 +606,33 @@ class BroadcastManager:
         Snapshot semantics — a viewer arriving milliseconds later is fine,
         the next published message will reach them.
         """
-        viewers = self._channels.get((room_id, lang))
-        return bool(viewers)
+        channel = self._channels.get((room_id, lang))
+        return channel is not None and bool(channel.viewers)
 
     async def publish(self, room_id: str, lang: str, payload: dict[str, Any]) -> None:
-        """Enqueue payload for every viewer of (room_id, lang).
+        """Append payload to the (room_id, lang) ring buffer and wake viewers.
 
-        Full queues drop the oldest item — this prevents one stuck viewer
-        from blocking the publish loop or causing unbounded memory growth.
+        The payload is encoded into an :class:`SseFrame` once and stored in
+        the channel's ring buffer — O(1) in the number of viewers. Each viewer
+        reads it through its own cursor; a viewer too slow to keep up gets an
+        explicit ``gap`` event instead of a silent drop.
         """
-        viewers = self._channels.get((room_id, lang))
-        if not viewers:
+        channel = self._channels.get((room_id, lang))
+        if channel is None:
             return
-        # Snapshot so concurrent unregisters don't trip iteration.
-        for q in list(viewers):
-            try:
-                q.put_nowait(payload)
-            except asyncio.QueueFull:
-                # Drop one old message, then put the new one.
-                try:
-                    q.get_nowait()
-                except asyncio.QueueEmpty:
-                    pass
-                try:
-                    q.put_nowait(payload)
-                except asyncio.QueueFull:
-                    # Still full (concurrent producer) — give up on this viewer.
-                    print(
-                        f"[SSE] dropping payload, viewer queue saturated "
-                        f"(room={room_id} lang={lang})"
-                    )
+        # Retained channels (no live viewer) still buffer, so a viewer
+        # reconnecting within the retention window misses nothing.
+        channel.append(payload)
+
+    def _expire_channel(self, key: tuple[str, str], channel: _Channel) -> None:
+        """Retention timer callback — drop the channel if still viewer-less."""
+        channel.expiry = None
+        if not channel.viewers and self._channels.get(key) is channel:
+            self._channels.pop(key, None)
 
     def channel_count(self) -> int:
         """Total number of (room, lang) channels with at least one viewer."""
-        return len(self._channels)
+        return sum(1 for channel in self._channels.values() if channel.viewers)
 
 
 # ---------------------------------------------------------------------------
@@ -247,22 +642,44 @@ def build_sse_app(
     *,
     broadcast_manager: BroadcastManager,
     room_repo: Any,
+    heartbeat_interval: float = _HEARTBEAT_INTERVAL_SECONDS,
 ) -> web.Application:
     """Construct the aiohttp Application that serves /stream/{room_id}.
 
     ``room_repo`` only needs a ``.get_by_id(room_id) -> dict | None`` method,
     so tests can pass a lightweight fake without spinning up SQLite. In
     production this is :class:`database.Room`.
+
+    ``handler_cancellation`` is forced on for whichever runner serves the
+    app: aiohttp's protocol ``connection_lost`` then cancels the viewer's
+    handler the moment the client's TCP connection closes, which is how
+    disconnects reach the ISSUE-33 metrics without any polling.
     """
-    app = web.Application()
+    app = web.Application(handler_args={"handler_cancellation": True})
     app["broadcast_manager"] = broadcast_manager
     app["room_repo"] = room_repo
+    app["heartbeat"] = _HeartbeatWheel(heartbeat_interval)
+    app.on_cleanup.append(_stop_heartbeat)
     app.router.add_get("/stream/{room_id}", _handle_stream)
     app.router.add_get("/view/{room_id}", _handle_view)
     app.router.add_get("/health", _handle_health)
     return app
 
 
+def _lookup_room(app: web.Application, room_id: str) -> dict[str, Any] | None:
+    """Resolve a room row through the process-wide room cache.
+
+    A QR-scan or reconnect storm costs one ``room_repo.get_by_id`` per room
+    per ``ROOM_CACHE_TTL_SECONDS``; ``database.Room`` status changes
+    invalidate the entry. Repo exceptions propagate and are never cached.
+    """
+    return get_room_cache().get(room_id, app["room_repo"].get_by_id)
+
+
+async def _stop_heartbeat(app: web.Application) -> None:
+    await app["heartbeat"].stop()
+
+
 async def _handle_health(_request: web.Request) -> web.Response:
     return web.Response(text="OK")
 
@@ -381,10 +798,9 @@ async def _handle_view(request: web.Request) -> web.Response:
     detail; the response body is generic.
     """
     room_id = request.match_info["room_id"]
-    room_repo = request.app["room_repo"]
 
     try:
-        room = room_repo.get_by_id(room_id)
+        room = _lookup_room(request.app, room_id)
     except Exception as e:
         # RL-006: log internal detail, return generic 404.
         print(f"[View] room lookup failed: {e!r}")
@@ -419,21 +835,27 @@ async def _handle_stream(request: web.Request) -> web.StreamResponse:
     """SSE handler — one connection per viewer.
 
     Lifecycle:
-      1. Resolve the room via repo. Unknown → 404 (RL-006: generic message).
+      1. Resolve the room via the room cache (repo on miss). Unknown → 404
+         (RL-006: generic message).
       2. If room is closed → write a single ``session_end`` event then close.
       3. Otherwise pick the requested lang (?lang=<code>, default
-         primary_output_lang) and register a viewer queue.
-      4. Stream payloads as ``data: <json>\\n\\n`` until the client disconnects.
+         primary_output_lang) and register a viewer cursor. A reconnect with
+         ``Last-Event-ID`` resumes right after that event (replay).
+      4. Stream payloads as ``id: ...\\nevent: ...\\ndata: <json>\\n\\n``
+         until the client disconnects (aiohttp cancels this handler from
+         the protocol's ``connection_lost``; idle viewers are pinged by the
+         app-wide heartbeat).
 
     Generic error messages only — never echo exception text.
     """
     room_id = request.match_info["room_id"]
-    room_repo = request.app["room_repo"]
     mgr: BroadcastManager = request.app["broadcast_manager"]
+    # EventSource sends this automatically when it reconnects.
+    last_event_id = request.headers.get("Last-Event-ID")
 
     # --- 1) Resolve the room -------------------------------------------------
     try:
-        room = room_repo.get_by_id(room_id)
+        room = _lookup_room(request.app, room_id)
     except Exception as e:
         # RL-006: log full detail server-side, return generic 404.
         # Treat repo failure as "room not available" to avoid information
@@ -470,7 +892,7 @@ async def _handle_stream(request: web.Request) -> web.StreamResponse:
     requested_lang = request.query.get("lang") or primary_lang
 
     # --- 4) Register viewer + stream ---------------------------------------
-    queue = await mgr.register_viewer(room_id, requested_lang)
+    cursor = await mgr.register_viewer(room_id, requested_lang, last_event_id)
     resp = web.StreamResponse(status=200, headers=sse_headers)
     await resp.prepare(request)
 
@@ -480,68 +902,24 @@ async def _handle_stream(request: web.Request) -> web.StreamResponse:
     try:
         await resp.write(b": connected\n\n")
     except (ConnectionResetError, asyncio.CancelledError):
-        await mgr.unregister_viewer(room_id, requested_lang, queue)
+        await mgr.unregister_viewer(room_id, requested_lang, cursor)
         return resp
 
-    # Watcher task: poll the underlying transport so client TCP close
-    # (FIN/RST) is detected within ~0.5s instead of waiting for the next
-    # heartbeat write to fail. Without this the in-memory viewer count
-    # would lag client disconnects by up to one heartbeat cycle, breaking
-    # ISSUE-33 metrics fidelity (#69).
-    disconnect_event = asyncio.Event()
-
-    async def _watch_disconnect() -> None:
-        while not disconnect_event.is_set():
-            transport = request.transport
-            if transport is None or transport.is_closing():
-                disconnect_event.set()
-                return
-            await asyncio.sleep(0.25)
-
-    watcher = asyncio.create_task(_watch_disconnect())
-
+    # From here on the handler only waits on its cursor: no per-viewer
+    # timer, watcher or per-message task. Keep-alive pings come from the
+    # app-wide heartbeat, and a client disconnect surfaces as CancelledError
+    # (aiohttp connection_lost → handler cancellation), which runs the
+    # ``finally`` below so the ISSUE-33 viewer count drops immediately.
+    heartbeat: _HeartbeatWheel = request.app["heartbeat"]
+    heartbeat.add(resp, request.transport)
     try:
         while True:
-            get_task = asyncio.create_task(queue.get())
-            disc_task = asyncio.create_task(disconnect_event.wait())
-            try:
-                # Race the queue read against client disconnect; the 5s
-                # ceiling doubles as a keep-alive heartbeat so idle proxies
-                # don't drop the connection.
-                done, pending = await asyncio.wait(
-                    {get_task, disc_task},
-                    timeout=5.0,
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-            except asyncio.CancelledError:
-                get_task.cancel()
-                disc_task.cancel()
-                break
-
-            for p in pending:
-                p.cancel()
-
-            if disc_task in done:
-                break
-
-            if not done:
-                # Timed out — emit heartbeat. Failure on write reliably
-                # confirms a dead connection even when transport.is_closing
-                # somehow lags.
-                try:
-                    await resp.write(b": ping\n\n")
-                except (ConnectionResetError, asyncio.CancelledError):
-                    break
-                continue
-
-            try:
-                payload = get_task.result()
-            except asyncio.CancelledError:
-                break
-
+            frame = await cursor.get()
             try:
-                await _write_sse_event(resp, "message", payload)
-            except (ConnectionResetError, asyncio.CancelledError):
+                # Pre-encoded once in publish — shared by every viewer.
+                await resp.write(frame.data)
+                heartbeat.touch(resp)
+            except ConnectionResetError:
                 break
             except Exception as e:
                 # RL-006: log internal write error, do not echo to client.
@@ -550,8 +928,8 @@ async def _handle_stream(request: web.Request) -> web.StreamResponse:
                 )
                 break
     finally:
-        watcher.cancel()
-        await mgr.unregister_viewer(room_id, requested_lang, queue)
+        heartbeat.discard(resp)
+        await mgr.unregister_viewer(room_id, requested_lang, cursor)
 
     return resp
 
@@ -565,9 +943,7 @@ async def _write_sse_event(
     explicitly keeps the wire format readable and uniform across event
     types (``session_end`` etc.).
     """
-    data_line = json.dumps(payload, ensure_ascii=False)
-    frame = f"event: {event_name}\ndata: {data_line}\n\n".encode()
-    await response.write(frame)
+    await response.write(encode_sse_frame(event_name, payload))
 
 
 # ---------------------------------------------------------------------------
@@ -581,6 +957,7 @@ async def broadcast_translation_for_room(
     source_text: str,
     source_lang: str,
     translate_fn: TranslateFn,
+    translate_multi_fn: MultiTranslateFn | None = None,
 ) -> None:
     """Publish primary-language translation now; schedule secondary langs.
 
@@ -592,6 +969,12 @@ async def broadcast_translation_for_room(
                     로 백그라운드 번역 → publish.
                     뷰어 없는 언어는 translate_fn 호출 자체를 스킵한다.
 
+    When ``translate_multi_fn`` is supplied and two or more secondary
+    languages have viewers, they are translated together in ONE background
+    task / LLM call instead of one call per language. Languages the batch
+    does not produce (or all of them, if it raises) fall back to
+    ``translate_fn`` individually.
+
     Why this lives here (not in ``websocket_handler``):
     - Keeps the WS path purely sequential and easy to read.
     - Lets unit tests inject a fake ``translate_fn`` that asserts on call
@@ -621,11 +1004,28 @@ async def broadcast_translation_for_room(
     if not secondaries:
         return
 
-    # 3) For each secondary language with viewers, schedule a background
-    #    translate+publish task. Lazy-skip when no viewers exist.
-    for lang in secondaries:
-        if not manager.has_viewers(room_id, lang):
-            continue
+    # 3) Lazy-skip languages without viewers.
+    targets = [lang for lang in secondaries if manager.has_viewers(room_id, lang)]
+    if not targets:
+        return
+
+    # 4) Several languages watched → one batched multi-target task.
+    if translate_multi_fn is not None and len(targets) > 1:
+        asyncio.create_task(
+            _translate_and_publish_batch(
+                manager,
+                room_id,
+                source_text=source_text,
+                source_lang=source_lang,
+                target_langs=targets,
+                translate_multi_fn=translate_multi_fn,
+                translate_fn=translate_fn,
+            )
+        )
+        return
+
+    # 5) Otherwise schedule one background translate+publish task per lang.
+    for lang in targets:
         # Closure captures lang; create_task ensures the WS path is not
         # blocked by AWS Bedrock latency.
         asyncio.create_task(
@@ -664,6 +1064,59 @@ async def _translate_and_publish_secondary(
         return
     if not translated:
         return
+    await _publish_secondary(manager, room_id, target_lang, translated)
+
+
+async def _translate_and_publish_batch(
+    manager: BroadcastManager,
+    room_id: str,
+    *,
+    source_text: str,
+    source_lang: str,
+    target_langs: list[str],
+    translate_multi_fn: MultiTranslateFn,
+    translate_fn: TranslateFn,
+) -> None:
+    """Background worker — one batched translation for several secondary langs.
+
+    Each language is published as soon as the batch yields it. Languages
+    the batch never yields — missing from the model output, or left over
+    because the batch raised — are translated individually via
+    ``translate_fn`` (concurrently) so no channel silently goes dark.
+    """
+    published: set[str] = set()
+    try:
+        async for lang, translated in translate_multi_fn(
+            source_text, source_lang, list(target_langs)
+        ):
+            if lang not in target_langs or lang in published or not translated:
+                continue
+            published.add(lang)
+            await _publish_secondary(manager, room_id, lang, translated)
+    except Exception as e:
+        print(f"[SSE] batch translate failed (room={room_id}): {e!r}")
+
+    missing = [lang for lang in target_langs if lang not in published]
+    if missing:
+        await asyncio.gather(
+            *(
+                _translate_and_publish_secondary(
+                    manager,
+                    room_id,
+                    source_text=source_text,
+                    source_lang=source_lang,
+                    target_lang=lang,
+                    translate_fn=translate_fn,
+                )
+                for lang in missing
+            )
+        )
+
+
+async def _publish_secondary(
+    manager: BroadcastManager, room_id: str, target_lang: str, translated: str
+) -> None:
+    """Publish one secondary-language result; errors are logged, not raised."""
     try:
         await manager.publish(
             room_id,
@@ -718,7 +1171,7 @@ def run_sse_server(
     can't crash the Streamlit parent process.
     """
     try:
-        loop = asyncio.new_event_loop()
+        loop = fastpath.new_event_loop()
         asyncio.set_event_loop(loop)
         app = build_sse_app(broadcast_manager=broadcast_manager, room_repo=room_repo)
 
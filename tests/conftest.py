@@ -0,0 +1,57 @@
+"""
+공용 pytest fixture
+프로세스 전역 캐시가 테스트 간에 새지 않도록 격리한다.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _reset_translation_cache():
+    """번역 결과 캐시를 테스트마다 비운다 (mock 응답이 다른 테스트로 새지 않게)."""
+    from translation import get_translation_cache
+
+    get_translation_cache().clear()
+    yield
+    get_translation_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_model_router():
+    """모델 라우터 circuit/지연 표본을 테스트마다 초기화한다 (실패 mock 이
+    다른 테스트의 모델 순서를 바꾸지 않게)."""
+    from translation import get_model_router
+
+    get_model_router().reset()
+    yield
+    get_model_router().reset()
+
+
+@pytest.fixture(autouse=True)
+def _sync_usage_recording(monkeypatch):
+    """사용량 기록은 기본적으로 동기 경로로 — write-behind 전역 writer 가
+    테스트가 patch 한 모델 대신 실제 DB 로 쓰지 않게 한다. write-behind 를
+    검증하는 테스트는 ``USAGE_WRITE_BEHIND=1`` 로 다시 켠다."""
+    monkeypatch.setenv("USAGE_WRITE_BEHIND", "0")
+
+
+@pytest.fixture(autouse=True)
+def _reset_quota_ledger():
+    """quota ledger 를 테스트마다 비운다 (patch 한 남은 시간이 다른 테스트의
+    한도 확인으로 새지 않게)."""
+    from quota_ledger import get_quota_ledger
+
+    get_quota_ledger().invalidate()
+    yield
+    get_quota_ledger().invalidate()
+
+
+@pytest.fixture(autouse=True)
+def _reset_room_cache():
+    """룸 캐시를 테스트마다 비운다 (같은 room_id 를 쓰는 다른 테스트의 fake
+    repo 행이 새지 않게)."""
+    from room_cache import get_room_cache
+
+    get_room_cache().invalidate()
+    yield
+    get_room_cache().invalidate()
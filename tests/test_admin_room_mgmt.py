@@ -855,18 +855,11 @@ class TestWebSocketRecordUsageForwardsRoomId:
 
         captured: dict = {}
 
-        class _FakeUserModel:
-            def add_usage(self, *_args, **_kwargs):
-                pass
-
         class _FakeLogModel:
-            def record_usage(self, **kwargs):
+            def record_utterance(self, **kwargs):
                 captured.update(kwargs)
                 return 1
 
-        monkeypatch.setattr(
-            websocket_handler, "get_user_model", lambda: _FakeUserModel()
-        )
         monkeypatch.setattr(
             websocket_handler, "get_usage_log_model", lambda: _FakeLogModel()
         )
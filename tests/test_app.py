@@ -9,80 +9,85 @@ from io import BytesIO
 from unittest.mock import MagicMock
 
 from translation import (
-    _build_prompt_to_english,
-    _build_prompt_to_korean,
+    _build_translation_prompt,
     _clean_llm_response,
+    _system_prompt_to_english,
+    _system_prompt_to_korean,
     detect_language,
     split_into_sentences,
     translate_with_llm,
 )
 from websocket_handler import find_free_port
 
-# === _build_prompt_to_korean / _build_prompt_to_english Tests ===
+# === _system_prompt_to_korean / _system_prompt_to_english Tests ===
 
 
 class TestBuildPromptToKorean:
-    def test_contains_source_text(self):
-        """프롬프트에 원본 텍스트 포함"""
-        prompt = _build_prompt_to_korean("Hello world", "en")
-        assert "Hello world" in prompt
+    def test_source_text_goes_to_user_message(self):
+        """원문은 정적 system 프롬프트가 아니라 user 메시지로 간다"""
+        system, user_text = _build_translation_prompt("Hello world", "en", "ko")
+        assert user_text == '원문: "Hello world"'
+        assert system == [_system_prompt_to_korean("en")]
+        assert "Hello world" not in system[0]
 
     def test_english_source_uses_correct_label(self):
         """영어 소스일 때 '영어' 라벨 사용"""
-        prompt = _build_prompt_to_korean("Hello", "en")
+        prompt = _system_prompt_to_korean("en")
         assert "영어" in prompt
 
     def test_japanese_source_uses_specific_label(self):
         """일본어 소스일 때 '일본어' 라벨 사용 (generic이 아닌 구체적 언어명)"""
-        prompt = _build_prompt_to_korean("Hello", "ja")
+        prompt = _system_prompt_to_korean("ja")
         assert "일본어" in prompt
 
     def test_chinese_source_uses_specific_label(self):
         """중국어 소스일 때 '중국어' 라벨 사용"""
-        prompt = _build_prompt_to_korean("Hello", "zh")
+        prompt = _system_prompt_to_korean("zh")
         assert "중국어" in prompt
 
     def test_unknown_source_uses_fallback_label(self):
         """매핑되지 않은 언어 코드는 '원본 언어' 폴백 사용"""
-        prompt = _build_prompt_to_korean("Hello", "xx")
+        prompt = _system_prompt_to_korean("xx")
         assert "원본 언어" in prompt
 
     def test_contains_korean_translation_instruction(self):
         """한국어 번역 지시사항 포함"""
-        prompt = _build_prompt_to_korean("Hello", "en")
+        prompt = _system_prompt_to_korean("en")
         assert "한국어" in prompt
 
     def test_contains_guidelines(self):
         """번역 가이드라인 포함"""
-        prompt = _build_prompt_to_korean("Hello", "en")
+        prompt = _system_prompt_to_korean("en")
         assert "가이드라인" in prompt
 
 
 class TestBuildPromptToEnglish:
-    def test_contains_source_text(self):
-        """프롬프트에 원본 한국어 텍스트 포함"""
-        prompt = _build_prompt_to_english("안녕하세요")
-        assert "안녕하세요" in prompt
+    def test_source_text_goes_to_user_message(self):
+        """원문은 user 메시지로만 간다"""
+        system, user_text = _build_translation_prompt("안녕하세요", "ko", "en")
+        assert user_text == '원문: "안녕하세요"'
+        assert "안녕하세요" not in system[0]
 
     def test_contains_english_translation_instruction(self):
         """영어 번역 지시사항 포함"""
-        prompt = _build_prompt_to_english("안녕하세요")
+        prompt = _system_prompt_to_english()
         assert "English" in prompt or "영어" in prompt
 
     def test_contains_conference_context(self):
         """컨퍼런스 컨텍스트 포함"""
-        prompt = _build_prompt_to_english("안녕하세요")
+        prompt = _system_prompt_to_english()
         assert "컨퍼런스" in prompt
 
     def test_contains_guidelines(self):
         """번역 가이드라인 포함"""
-        prompt = _build_prompt_to_english("안녕하세요")
+        prompt = _system_prompt_to_english()
         assert "가이드라인" in prompt
 
-    def test_different_text_reflected_in_prompt(self):
-        """다른 입력 텍스트도 프롬프트에 반영"""
-        prompt = _build_prompt_to_english("대한민국 만세")
-        assert "대한민국 만세" in prompt
+    def test_system_prompt_is_static_per_language_pair(self):
+        """입력 텍스트가 달라도 system 프롬프트는 같다 (프롬프트 캐시 대상)"""
+        first, _ = _build_translation_prompt("안녕하세요", "ko", "en")
+        second, _ = _build_translation_prompt("대한민국 만세", "ko", "en")
+        assert first == second
 
 
 # === find_free_port Tests ===
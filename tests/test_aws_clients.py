@@ -0,0 +1,183 @@
+"""
+aws_clients.py 단위 테스트
+AwsClientPool 의 재사용 / 키 분리 / health check 재생성 검증
+"""
+
+import asyncio
+import io
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+from aws_clients import AwsClientPool
+
+CREDS = {"region": "ap-northeast-2", "access_key": "AKIA", "secret_key": "s3cr3t"}
+
+
+def _fake_boto3_client():
+    """호출마다 새 MagicMock 을 돌려주는 boto3.client 대체."""
+    return MagicMock(side_effect=lambda *a, **kw: MagicMock(name=a[0]))
+
+
+class TestAwsClientPoolReuse:
+    def test_same_key_returns_cached_client(self):
+        pool = AwsClientPool()
+        fake = _fake_boto3_client()
+        with patch("aws_clients.boto3.client", fake):
+            first = pool.get("translate", **CREDS)
+            second = pool.get("translate", **CREDS)
+
+        assert first is second
+        assert fake.call_count == 1
+
+    def test_max_pool_connections_is_configured(self):
+        pool = AwsClientPool(max_pool_connections=7)
+        fake = _fake_boto3_client()
+        with patch("aws_clients.boto3.client", fake):
+            pool.get("bedrock-runtime", **CREDS)
+
+        config = fake.call_args.kwargs["config"]
+        assert config.max_pool_connections == 7
+
+    def test_different_service_region_or_credentials_are_separate(self):
+        pool = AwsClientPool()
+        fake = _fake_boto3_client()
+        with patch("aws_clients.boto3.client", fake):
+            base = pool.get("translate", **CREDS)
+            other_service = pool.get("bedrock-runtime", **CREDS)
+            other_region = pool.get("translate", **{**CREDS, "region": "us-east-1"})
+            rotated = pool.get("translate", **{**CREDS, "secret_key": "rotated"})
+
+        assert len({id(base), id(other_service), id(other_region), id(rotated)}) == 4
+        assert pool.size() == 4
+
+    def test_concurrent_get_creates_single_client(self):
+        pool = AwsClientPool()
+        fake = _fake_boto3_client()
+        results = []
+
+        def _worker():
+            results.append(pool.get("translate", **CREDS))
+
+        with patch("aws_clients.boto3.client", fake):
+            threads = [threading.Thread(target=_worker) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert fake.call_count == 1
+        assert all(r is results[0] for r in results)
+
+    def test_creation_failure_is_not_cached(self):
+        pool = AwsClientPool()
+        with patch("aws_clients.boto3.client", side_effect=Exception("boom")):
+            try:
+                pool.get("translate", **CREDS)
+            except Exception:
+                pass
+        assert pool.size() == 0
+
+
+class TestAwsClientPoolHealth:
+    def test_connection_errors_evict_after_threshold(self):
+        pool = AwsClientPool(failure_threshold=2)
+        fake = _fake_boto3_client()
+        err = EndpointConnectionError(endpoint_url="https://translate")
+        with patch("aws_clients.boto3.client", fake):
+            client = pool.get("translate", **CREDS)
+            assert pool.report_failure(client, err) is False
+            assert pool.report_failure(client, err) is True
+            rebuilt = pool.get("translate", **CREDS)
+
+        assert rebuilt is not client
+        assert fake.call_count == 2
+
+    def test_success_resets_failure_count(self):
+        pool = AwsClientPool(failure_threshold=2)
+        err = EndpointConnectionError(endpoint_url="https://translate")
+        with patch("aws_clients.boto3.client", _fake_boto3_client()):
+            client = pool.get("translate", **CREDS)
+            pool.report_failure(client, err)
+            pool.report_success(client)
+            assert pool.report_failure(client, err) is False
+            assert pool.get("translate", **CREDS) is client
+
+    def test_service_errors_do_not_count(self):
+        pool = AwsClientPool(failure_threshold=1)
+        throttled = ClientError(
+            {"Error": {"Code": "ThrottlingException", "Message": "slow down"}},
+            "TranslateText",
+        )
+        with patch("aws_clients.boto3.client", _fake_boto3_client()):
+            client = pool.get("translate", **CREDS)
+            assert pool.report_failure(client, throttled) is False
+            assert pool.get("translate", **CREDS) is client
+
+    def test_report_success_on_unknown_client_is_noop(self):
+        pool = AwsClientPool()
+        pool.report_success(MagicMock())
+        pool.report_success(None)
+
+    def test_unknown_client_is_ignored(self):
+        pool = AwsClientPool(failure_threshold=1)
+        err = EndpointConnectionError(endpoint_url="https://translate")
+        assert pool.report_failure(MagicMock(), err) is False
+        assert pool.report_failure(None, err) is False
+
+
+class TestBedrockSuccessResetsFailures:
+    """Bedrock 경로도 성공 시 연속 실패 카운터를 초기화한다.
+
+    드문 연결 오류가 프로세스 수명 내내 누적돼 정상 클라이언트가 교체되면
+    안 된다.
+    """
+
+    def _pool_with_failures(self, pool):
+        err = EndpointConnectionError(endpoint_url="https://bedrock")
+        client = pool.get("bedrock-runtime", **CREDS)
+        pool.report_failure(client, err)
+        return client, err
+
+    def test_translate_with_llm_success_resets(self):
+        from translation import translate_with_llm
+
+        pool = AwsClientPool(failure_threshold=2)
+        with (
+            patch("aws_clients.boto3.client", _fake_boto3_client()),
+            patch("translation.get_client_pool", return_value=pool),
+        ):
+            client, err = self._pool_with_failures(pool)
+            body = json.dumps({"content": [{"text": "안녕"}]}).encode()
+            client.invoke_model.return_value = {"body": io.BytesIO(body)}
+            assert translate_with_llm(client, "Hi", "en", "ko") == "안녕"
+            assert pool.report_failure(client, err) is False
+            assert pool.get("bedrock-runtime", **CREDS) is client
+
+    def test_multi_target_stream_success_resets(self):
+        from websocket_handler import _stream_llm_multi_translation
+
+        pool = AwsClientPool(failure_threshold=2)
+
+        async def _collect(client):
+            return [
+                item
+                async for item in _stream_llm_multi_translation(
+                    client, "hi", "en", ["zh"]
+                )
+            ]
+
+        with (
+            patch("aws_clients.boto3.client", _fake_boto3_client()),
+            patch("websocket_handler.get_client_pool", return_value=pool),
+            patch(
+                "websocket_handler.translate_with_llm_multi_stream",
+                return_value=iter([("zh", "你好")]),
+            ),
+        ):
+            client, err = self._pool_with_failures(pool)
+            assert asyncio.run(_collect(client)) == [("zh", "你好")]
+            assert pool.report_failure(client, err) is False
+            assert pool.get("bedrock-runtime", **CREDS) is client
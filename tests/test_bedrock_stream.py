@@ -0,0 +1,469 @@
+"""
+bedrock_stream.py 단위 테스트
+로컬 fake event-stream 서버(aiohttp)로 AsyncBedrockClient 의 SigV4 서명,
+event-stream 프레이밍 파싱, 오류 처리, async 번역 스트림을 검증한다.
+"""
+
+import asyncio
+import base64
+import binascii
+import json
+import struct
+import threading
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import bedrock_stream
+from bedrock_stream import (
+    AsyncBedrockClient,
+    BedrockStreamError,
+    close_async_bedrock_clients,
+    get_async_bedrock_client,
+)
+from translation import (
+    BEDROCK_MODEL_IDS,
+    LLM_CACHE_MODEL,
+    get_translation_cache,
+    translate_with_llm_stream_async,
+)
+
+
+def _encode_headers(headers):
+    out = b""
+    for name, value in headers.items():
+        raw_name = name.encode()
+        raw_value = value.encode()
+        # header value type 7 = string
+        out += struct.pack("!B", len(raw_name)) + raw_name
+        out += struct.pack("!BH", 7, len(raw_value)) + raw_value
+    return out
+
+
+def _encode_message(headers, payload):
+    """AWS event-stream 메시지 하나를 바이너리로 인코딩한다."""
+    raw_headers = _encode_headers(headers)
+    total = 12 + len(raw_headers) + len(payload) + 4
+    prelude = struct.pack("!II", total, len(raw_headers))
+    prelude += struct.pack("!I", binascii.crc32(prelude))
+    body = prelude + raw_headers + payload
+    return body + struct.pack("!I", binascii.crc32(body))
+
+
+def _chunk_frame(data):
+    payload = json.dumps(
+        {"bytes": base64.b64encode(json.dumps(data).encode()).decode()}
+    ).encode()
+    return _encode_message(
+        {
+            ":message-type": "event",
+            ":event-type": "chunk",
+            ":content-type": "application/json",
+        },
+        payload,
+    )
+
+
+def _delta_frames(*pieces):
+    frames = [_chunk_frame({"type": "message_start"})]
+    frames += [
+        _chunk_frame({"type": "content_block_delta", "delta": {"text": p}})
+        for p in pieces
+    ]
+    frames.append(_chunk_frame({"type": "message_stop"}))
+    return frames
+
+
+async def _start_fake_bedrock(routes):
+    """``routes``: model_id -> handler(request) 로 fake Bedrock 서버를 띄운다."""
+    seen = []
+
+    async def _handler(request):
+        model_id = request.match_info["model_id"]
+        seen.append(
+            {
+                "model_id": model_id,
+                "raw_path": request.raw_path,
+                "headers": dict(request.headers),
+                "body": await request.read(),
+            }
+        )
+        return await routes[model_id](request)
+
+    app = web.Application()
+    app.router.add_post("/model/{model_id}/invoke-with-response-stream", _handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server, seen
+
+
+def _stream_handler(frames, split=False):
+    async def _handler(request):
+        resp = web.StreamResponse(
+            headers={"Content-Type": "application/vnd.amazon.eventstream"}
+        )
+        await resp.prepare(request)
+        for frame in frames:
+            if split:
+                # 프레임 경계가 TCP 쓰기 경계와 어긋나도 파싱되는지 확인.
+                for i in range(0, len(frame), 7):
+                    await resp.write(frame[i : i + 7])
+            else:
+                await resp.write(frame)
+        await resp.write_eof()
+        return resp
+
+    return _handler
+
+
+def _error_handler(status, message):
+    async def _handler(request):
+        return web.json_response(
+            {"message": message},
+            status=status,
+            headers={"x-amzn-ErrorType": "ValidationException"},
+        )
+
+    return _handler
+
+
+def _client(server):
+    return AsyncBedrockClient(
+        "ap-northeast-2",
+        "AKIDEXAMPLE",
+        "secret",
+        endpoint_url=str(server.make_url("/")),
+    )
+
+
+class TestAsyncBedrockClient:
+    @pytest.mark.asyncio
+    async def test_streams_decoded_chunks_with_sigv4(self):
+        model = BEDROCK_MODEL_IDS[0]
+        server, seen = await _start_fake_bedrock(
+            {model: _stream_handler(_delta_frames("안", "녕"))}
+        )
+        client = _client(server)
+        try:
+            chunks = [
+                c
+                async for c in client.invoke_model_with_response_stream(
+                    model, '{"x": 1}'
+                )
+            ]
+        finally:
+            await client.close()
+            await server.close()
+
+        assert [c["type"] for c in chunks] == [
+            "message_start",
+            "content_block_delta",
+            "content_block_delta",
+            "message_stop",
+        ]
+        request = seen[0]
+        assert request["model_id"] == model
+        # modelId 의 ':' 는 percent-encode 되어 전송된다.
+        assert "%3A" in request["raw_path"]
+        assert request["body"] == b'{"x": 1}'
+        auth = request["headers"]["Authorization"]
+        assert auth.startswith("AWS4-HMAC-SHA256 Credential=AKIDEXAMPLE/")
+        assert "/ap-northeast-2/bedrock/aws4_request" in auth
+        assert "X-Amz-Date" in request["headers"]
+
+    @pytest.mark.asyncio
+    async def test_frames_split_across_writes(self):
+        model = BEDROCK_MODEL_IDS[0]
+        server, _ = await _start_fake_bedrock(
+            {model: _stream_handler(_delta_frames("a", "b", "c"), split=True)}
+        )
+        client = _client(server)
+        try:
+            chunks = [
+                c async for c in client.invoke_model_with_response_stream(model, "{}")
+            ]
+        finally:
+            await client.close()
+            await server.close()
+
+        deltas = [c["delta"]["text"] for c in chunks if "delta" in c]
+        assert deltas == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_http_error_raises(self):
+        model = BEDROCK_MODEL_IDS[0]
+        server, _ = await _start_fake_bedrock({model: _error_handler(400, "bad")})
+        client = _client(server)
+        try:
+            with pytest.raises(BedrockStreamError) as exc:
+                async for _ in client.invoke_model_with_response_stream(model, "{}"):
+                    pass
+        finally:
+            await client.close()
+            await server.close()
+
+        assert exc.value.status == 400
+        assert exc.value.code == "ValidationException"
+
+    @pytest.mark.asyncio
+    async def test_exception_event_raises(self):
+        model = BEDROCK_MODEL_IDS[0]
+        exception_frame = _encode_message(
+            {
+                ":message-type": "exception",
+                ":exception-type": "throttlingException",
+            },
+            json.dumps({"message": "slow down"}).encode(),
+        )
+        server, _ = await _start_fake_bedrock(
+            {model: _stream_handler(_delta_frames("a")[:2] + [exception_frame])}
+        )
+        client = _client(server)
+        received = []
+        try:
+            with pytest.raises(BedrockStreamError, match="throttlingException"):
+                async for chunk in client.invoke_model_with_response_stream(
+                    model, "{}"
+                ):
+                    received.append(chunk)
+        finally:
+            await client.close()
+            await server.close()
+
+        assert len(received) == 2
+
+
+class TestCredentialsAndSessions:
+    @staticmethod
+    def _refreshable(refresh_calls):
+        from botocore.credentials import RefreshableCredentials
+
+        def _refresh():
+            refresh_calls.append(1)
+            expiry = datetime.now(UTC) + timedelta(hours=1)
+            return {
+                "access_key": f"ASIAROTATED{len(refresh_calls)}",
+                "secret_key": "rotated",
+                "token": "session-token",
+                "expiry_time": expiry.isoformat(),
+            }
+
+        # 이미 만료된 임시 자격 증명 (인스턴스 프로파일 / SSO 와 같은 형태).
+        expired = datetime.now(UTC) - timedelta(minutes=1)
+        return RefreshableCredentials.create_from_metadata(
+            {
+                "access_key": "ASIAEXPIRED",
+                "secret_key": "old",
+                "token": "old-token",
+                "expiry_time": expired.isoformat(),
+            },
+            refresh_using=_refresh,
+            method="test",
+        )
+
+    @pytest.mark.asyncio
+    async def test_default_chain_credentials_are_refreshed_before_signing(
+        self, monkeypatch
+    ):
+        refresh_calls = []
+        chain = self._refreshable(refresh_calls)
+        monkeypatch.setattr(bedrock_stream, "_default_credentials", lambda: chain)
+        model = BEDROCK_MODEL_IDS[0]
+        server, seen = await _start_fake_bedrock(
+            {model: _stream_handler(_delta_frames("a"))}
+        )
+        client = AsyncBedrockClient(
+            "ap-northeast-2", None, None, endpoint_url=str(server.make_url("/"))
+        )
+        try:
+            for _ in range(2):
+                async for _chunk in client.invoke_model_with_response_stream(
+                    model, "{}"
+                ):
+                    pass
+        finally:
+            await client.close()
+            await server.close()
+
+        # 만료된 값으로 서명하지 않고, 갱신은 필요할 때 한 번만 한다.
+        assert len(refresh_calls) == 1
+        for request in seen:
+            auth = request["headers"]["Authorization"]
+            assert auth.startswith("AWS4-HMAC-SHA256 Credential=ASIAROTATED1/")
+            assert request["headers"]["X-Amz-Security-Token"] == "session-token"
+
+    @pytest.mark.asyncio
+    async def test_missing_credentials_raise_stream_error(self, monkeypatch):
+        monkeypatch.setattr(bedrock_stream, "_default_credentials", lambda: None)
+        client = AsyncBedrockClient("ap-northeast-2", None, None)
+        with pytest.raises(BedrockStreamError, match="자격 증명"):
+            async for _ in client.invoke_model_with_response_stream("m", "{}"):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_session_from_other_loop_is_closed_on_switch(self):
+        client = AsyncBedrockClient("ap-northeast-2", "a", "b")
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever, daemon=True)
+        thread.start()
+
+        async def _open():
+            return client._get_session()
+
+        try:
+            old = asyncio.run_coroutine_threadsafe(_open(), other).result(5)
+            current = client._get_session()
+            assert current is not old
+            for _ in range(100):
+                if old.closed:
+                    break
+                await asyncio.sleep(0.01)
+            assert old.closed
+        finally:
+            await client.close()
+            other.call_soon_threadsafe(other.stop)
+            thread.join(5)
+            other.close()
+        assert current.closed
+
+    @pytest.mark.asyncio
+    async def test_close_all_closes_cached_client_sessions(self, monkeypatch):
+        monkeypatch.setattr(bedrock_stream, "_clients", {})
+        client = get_async_bedrock_client(
+            region="ap-northeast-2", access_key="a", secret_key="b"
+        )
+        session = client._get_session()
+
+        await close_async_bedrock_clients()
+
+        assert session.closed
+        # 클라이언트는 캐시에 남고 다음 호출에서 세션을 다시 연다.
+        assert (
+            get_async_bedrock_client(
+                region="ap-northeast-2", access_key="a", secret_key="b"
+            )
+            is client
+        )
+        reopened = client._get_session()
+        assert not reopened.closed
+        await client.close()
+
+
+class TestTranslateWithLlmStreamAsync:
+    @pytest.mark.asyncio
+    async def test_yields_cumulative_then_final_and_caches(self):
+        model = BEDROCK_MODEL_IDS[0]
+        server, _ = await _start_fake_bedrock(
+            {model: _stream_handler(_delta_frames("안녕", "하세요"))}
+        )
+        client = _client(server)
+        try:
+            chunks = [
+                c
+                async for c in translate_with_llm_stream_async(
+                    client, "Hello", "en", "ko"
+                )
+            ]
+        finally:
+            await client.close()
+            await server.close()
+
+        assert chunks == [("안녕", False), ("안녕하세요", False), ("안녕하세요", True)]
+        cache = get_translation_cache()
+        assert cache.get("Hello", "en", "ko", LLM_CACHE_MODEL) == "안녕하세요"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_next_model_before_first_chunk(self):
+        first, second = BEDROCK_MODEL_IDS[0], BEDROCK_MODEL_IDS[1]
+        server, seen = await _start_fake_bedrock(
+            {
+                first: _error_handler(503, "unavailable"),
+                second: _stream_handler(_delta_frames("감사합니다")),
+            }
+        )
+        client = _client(server)
+        try:
+            chunks = [
+                c
+                async for c in translate_with_llm_stream_async(
+                    client, "Thanks", "en", "ko"
+                )
+            ]
+        finally:
+            await client.close()
+            await server.close()
+
+        assert [s["model_id"] for s in seen] == [first, second]
+        assert chunks[-1] == ("감사합니다", True)
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_network(self):
+        get_translation_cache().put("Hi", "en", "ko", LLM_CACHE_MODEL, "안녕")
+        client = AsyncBedrockClient("ap-northeast-2", "a", "b")
+        chunks = [
+            c async for c in translate_with_llm_stream_async(client, "Hi", "en", "ko")
+        ]
+        assert chunks == [("안녕", True)]
+
+
+class TestWebsocketHandlerAsyncPath:
+    @pytest.mark.asyncio
+    async def test_stream_llm_translation_uses_async_client(self, monkeypatch):
+        from websocket_handler import _stream_llm_translation
+
+        # 청크 전달 경로만 본다 — 부분 결과 코얼레싱은 끈다.
+        monkeypatch.setattr("partial_updates.PARTIAL_MIN_INTERVAL_SECONDS", 0)
+
+        model = BEDROCK_MODEL_IDS[0]
+        server, _ = await _start_fake_bedrock(
+            {model: _stream_handler(_delta_frames("다음 ", "슬라이드"))}
+        )
+        client = _client(server)
+        ws = AsyncMock()
+        try:
+            with (
+                patch(
+                    "websocket_handler._get_async_bedrock_client",
+                    return_value=client,
+                ),
+                patch("websocket_handler.translate_with_llm_stream") as sync_stream,
+            ):
+                result = await _stream_llm_translation(
+                    ws, None, "Next slide", "en", "ko"
+                )
+        finally:
+            await client.close()
+            await server.close()
+
+        assert result == "다음 슬라이드"
+        sync_stream.assert_not_called()
+        partials = [
+            json.loads(c.args[0])["text"]
+            for c in ws.send.call_args_list
+            if json.loads(c.args[0]).get("type") == "translation_partial"
+        ]
+        assert partials == ["다음 ", "다음 슬라이드"]
+
+    @pytest.mark.asyncio
+    async def test_async_stream_failure_returns_none_for_fallback(self):
+        from websocket_handler import _stream_llm_translation
+
+        server, _ = await _start_fake_bedrock(
+            {m: _error_handler(500, "boom") for m in BEDROCK_MODEL_IDS}
+        )
+        client = _client(server)
+        try:
+            with patch(
+                "websocket_handler._get_async_bedrock_client", return_value=client
+            ):
+                result = await _stream_llm_translation(
+                    AsyncMock(), None, "Hello", "en", "ko"
+                )
+        finally:
+            await client.close()
+            await server.close()
+
+        assert result is None
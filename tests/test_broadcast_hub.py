@@ -0,0 +1,205 @@
+"""
+broadcast_hub.py 단위 테스트
+같은 이벤트 루프 안에서 HubPublisher 와 워커(BroadcastManager + HubSubscriber)
+를 Unix domain socket 으로 연결해 관심 채널 동기화, fan-out, 워커 이탈,
+metrics 합산, hub 재시작 후 재동기화를 검증한다.
+"""
+
+import asyncio
+import os
+import socket
+import stat
+from unittest.mock import MagicMock
+
+import pytest
+
+from broadcast_hub import (
+    HubPublisher,
+    HubSubscriber,
+    _default_hub_socket,
+    _prepare_socket_path,
+)
+from sse_broadcast import BroadcastManager
+
+
+async def _wait_until(predicate, timeout=2.0):
+    deadline = asyncio.get_event_loop().time() + timeout
+    while not predicate() and asyncio.get_event_loop().time() < deadline:
+        await asyncio.sleep(0.01)
+    return predicate()
+
+
+@pytest.fixture
+def hub_path(tmp_path):
+    return str(tmp_path / "hub.sock")
+
+
+class _Worker:
+    """테스트용 SSE 워커 — 로컬 manager + hub 구독 task."""
+
+    def __init__(self, path):
+        self.subscriber = HubSubscriber(path)
+        self.manager = BroadcastManager(on_viewer_change=self.subscriber.notify)
+        self.task = asyncio.create_task(self.subscriber.run(self.manager))
+
+    async def stop(self):
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+
+
+@pytest.fixture
+async def hub(hub_path):
+    publisher = HubPublisher(hub_path)
+    await publisher.start()
+    yield publisher
+    await publisher.close()
+
+
+class TestHubFanOut:
+    @pytest.mark.asyncio
+    async def test_publish_reaches_subscribed_worker(self, hub, hub_path):
+        worker = _Worker(hub_path)
+        await asyncio.wait_for(worker.subscriber.connected.wait(), 2)
+        assert hub.has_viewers("r1", "ko") is False
+
+        cursor = await worker.manager.register_viewer("r1", "ko")
+        assert await _wait_until(lambda: hub.has_viewers("r1", "ko"))
+
+        await hub.publish("r1", "ko", {"text": "안녕하세요", "lang": "ko"})
+        frame = await asyncio.wait_for(cursor.get(), 2)
+        assert frame["text"] == "안녕하세요"
+
+        await worker.manager.unregister_viewer("r1", "ko", cursor)
+        assert await _wait_until(lambda: not hub.has_viewers("r1", "ko"))
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_only_interested_workers_receive(self, hub, hub_path):
+        a, b = _Worker(hub_path), _Worker(hub_path)
+        cursor_a = await a.manager.register_viewer("r1", "ko")
+        cursor_b = await b.manager.register_viewer("r1", "en")
+        assert await _wait_until(
+            lambda: hub.has_viewers("r1", "ko") and hub.has_viewers("r1", "en")
+        )
+
+        await hub.publish("r1", "ko", {"text": "ko only"})
+        await hub.publish("r1", "en", {"text": "en only"})
+
+        assert (await asyncio.wait_for(cursor_a.get(), 2))["text"] == "ko only"
+        assert (await asyncio.wait_for(cursor_b.get(), 2))["text"] == "en only"
+        assert cursor_a.empty() and cursor_b.empty()
+        await a.stop()
+        await b.stop()
+
+    @pytest.mark.asyncio
+    async def test_metrics_are_summed_across_workers(self, hub, hub_path):
+        a, b = _Worker(hub_path), _Worker(hub_path)
+        await a.manager.register_viewer("r1", "ko")
+        await a.manager.register_viewer("r1", "ko")
+        await b.manager.register_viewer("r1", "ko")
+        await b.manager.register_viewer("r1", "en")
+
+        assert await _wait_until(lambda: hub.get_metrics("r1")["current"] == 4)
+        assert hub.get_metrics("r1") == {"current": 4, "by_lang": {"ko": 3, "en": 1}}
+        assert hub.worker_count() == 2
+
+        # 워커가 죽으면 그 워커 몫이 빠진다.
+        await b.stop()
+        assert await _wait_until(lambda: hub.get_metrics("r1")["current"] == 2)
+        assert hub.has_viewers("r1", "en") is False
+        await a.stop()
+
+    @pytest.mark.asyncio
+    async def test_joins_persist_aggregate_metrics(self, hub, hub_path):
+        repo = MagicMock()
+        hub._metrics_repo = repo
+        a, b = _Worker(hub_path), _Worker(hub_path)
+        first = await a.manager.register_viewer("r1", "ko")
+        assert await _wait_until(lambda: repo.update_viewer_metrics.call_count == 1)
+        await b.manager.register_viewer("r1", "ko")
+        assert await _wait_until(lambda: repo.update_viewer_metrics.call_count == 2)
+        repo.update_viewer_metrics.assert_called_with("r1", total_delta=1, current=2)
+
+        # Last-Event-ID 재접속은 누적 viewer 로 세지 않는다.
+        await a.manager.publish("r1", "ko", {"text": "x"})
+        last_id = first.get_nowait().data.split(b"\n", 1)[0][4:].decode()
+        await a.manager.unregister_viewer("r1", "ko", first)
+        await a.manager.register_viewer("r1", "ko", last_id)
+        assert await _wait_until(lambda: hub.get_metrics("r1")["current"] == 2)
+        assert repo.update_viewer_metrics.call_count == 2
+        await a.stop()
+        await b.stop()
+
+    @pytest.mark.asyncio
+    async def test_worker_resyncs_after_hub_restart(self, hub_path, monkeypatch):
+        monkeypatch.setattr("broadcast_hub._RECONNECT_DELAY_SECONDS", 0.01)
+        first_hub = HubPublisher(hub_path)
+        await first_hub.start()
+        worker = _Worker(hub_path)
+        cursor = await worker.manager.register_viewer("r1", "ko")
+        assert await _wait_until(lambda: first_hub.has_viewers("r1", "ko"))
+        await first_hub.close()
+
+        second_hub = HubPublisher(hub_path)
+        await second_hub.start()
+        try:
+            assert await _wait_until(lambda: second_hub.has_viewers("r1", "ko"))
+            await second_hub.publish("r1", "ko", {"text": "after restart"})
+            frame = await asyncio.wait_for(cursor.get(), 2)
+            assert frame["text"] == "after restart"
+        finally:
+            await worker.stop()
+            await second_hub.close()
+
+    @pytest.mark.asyncio
+    async def test_publish_without_viewers_is_noop(self, hub):
+        await hub.publish("nobody", "ko", {"text": "x"})
+        assert hub.channel_count() == 0
+
+
+class TestHubSocketPath:
+    @pytest.mark.asyncio
+    async def test_socket_is_owner_only(self, hub, hub_path):
+        assert stat.S_IMODE(os.stat(hub_path).st_mode) == 0o600
+
+    @pytest.mark.asyncio
+    async def test_missing_directory_is_created_private(self, tmp_path):
+        path = str(tmp_path / "run" / "hub.sock")
+        publisher = HubPublisher(path)
+        await publisher.start()
+        try:
+            assert stat.S_IMODE(os.stat(tmp_path / "run").st_mode) == 0o700
+        finally:
+            await publisher.close()
+
+    def test_stale_own_socket_is_replaced(self, hub_path):
+        stale = socket.socket(socket.AF_UNIX)
+        stale.bind(hub_path)
+        stale.close()
+        _prepare_socket_path(hub_path)
+        assert not os.path.exists(hub_path)
+
+    def test_refuses_to_unlink_other_users_socket(self, hub_path):
+        stale = socket.socket(socket.AF_UNIX)
+        stale.bind(hub_path)
+        stale.close()
+        other_uid = os.stat(hub_path).st_uid + 1
+        with pytest.raises(PermissionError):
+            _prepare_socket_path(hub_path, uid=other_uid)
+        assert os.path.exists(hub_path)
+
+    def test_refuses_to_unlink_regular_file(self, hub_path):
+        with open(hub_path, "w") as f:
+            f.write("not a socket")
+        with pytest.raises(FileExistsError):
+            _prepare_socket_path(hub_path)
+        assert os.path.exists(hub_path)
+
+    def test_default_path_is_per_user(self, monkeypatch):
+        monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+        assert _default_hub_socket() == "/run/user/1000/realtime-translator-sse.sock"
+        monkeypatch.delenv("XDG_RUNTIME_DIR")
+        assert f"realtime-translator-{os.geteuid()}" in _default_hub_socket()
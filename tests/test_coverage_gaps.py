@@ -60,6 +60,15 @@ def _isolate_auth_module():
 class TestInitTranslationClients:
     """_init_translation_clients 테스트"""
 
+    @pytest.fixture(autouse=True)
+    def _fresh_client_pool(self):
+        """프로세스 전역 클라이언트 풀을 테스트마다 비운다."""
+        from aws_clients import get_client_pool
+
+        get_client_pool().clear()
+        yield
+        get_client_pool().clear()
+
     def test_returns_translate_and_bedrock_clients(self):
         """boto3 클라이언트 두 개가 정상 반환"""
         from websocket_handler import _init_translation_clients
@@ -78,7 +87,7 @@ class TestInitTranslationClients:
             patch("websocket_handler.get_aws_access_key_id", return_value="key"),
             patch("websocket_handler.get_aws_secret_access_key", return_value="secret"),
             patch("websocket_handler.get_aws_region", return_value="us-east-1"),
-            patch("websocket_handler.boto3.client", side_effect=fake_client),
+            patch("aws_clients.boto3.client", side_effect=fake_client),
         ):
             translate_client, bedrock_client, bedrock_available = (
                 _init_translation_clients()
@@ -105,7 +114,7 @@ class TestInitTranslationClients:
             patch("websocket_handler.get_aws_access_key_id", return_value="key"),
             patch("websocket_handler.get_aws_secret_access_key", return_value="secret"),
             patch("websocket_handler.get_aws_region", return_value="us-east-1"),
-            patch("websocket_handler.boto3.client", side_effect=fake_client),
+            patch("aws_clients.boto3.client", side_effect=fake_client),
         ):
             translate_client, bedrock_client, bedrock_available = (
                 _init_translation_clients()
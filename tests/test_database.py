@@ -1,15 +1,17 @@
 """
 database.py 단위 테스트
-DatabaseManager, PasswordManager, User, UsageLog 클래스 테스트
+DatabaseManager, ConnectionPool, PasswordManager, User, UsageLog 클래스 테스트
 """
 
 import os
 import sqlite3
+import threading
 from unittest.mock import patch
 
 import pytest
 
 from database import (
+    ConnectionPool,
     DatabaseManager,
     PasswordManager,
     UsageLog,
@@ -82,6 +84,93 @@ class TestDatabaseManager:
             assert cursor.fetchone()[0] == 1
 
 
+class TestConnectionPool:
+    def test_connection_is_reused(self, db_manager):
+        with db_manager.get_connection() as first:
+            pass
+        with db_manager.get_connection() as second:
+            pass
+        assert first is second
+        assert db_manager.pool.stats()["reused"] >= 1
+
+    def test_pragmas_applied_per_connection(self, db_path):
+        DatabaseManager(db_path)
+        pool = ConnectionPool(db_path, synchronous="FULL", busy_timeout_ms=1234)
+        conn = pool.acquire()
+        try:
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+        finally:
+            pool.release(conn)
+            pool.close()
+
+    def test_default_keeps_sqlite_synchronous(self, db_path):
+        DatabaseManager(db_path)
+        pool = ConnectionPool(db_path)
+        conn = pool.acquire()
+        try:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+        finally:
+            pool.release(conn)
+            pool.close()
+
+    def test_synchronous_normal_is_opt_in(self, db_path):
+        DatabaseManager(db_path)
+        pool = ConnectionPool(db_path, synchronous="normal")
+        conn = pool.acquire()
+        try:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        finally:
+            pool.release(conn)
+            pool.close()
+
+    def test_uncommitted_changes_rolled_back_on_release(self, db_manager):
+        with db_manager.get_connection() as conn:
+            conn.execute(
+                "INSERT INTO users (username, password_hash) VALUES ('ghost', 'x')"
+            )
+        with db_manager.get_connection() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM users WHERE username = 'ghost'"
+            ).fetchone()
+        assert row[0] == 0
+
+    def test_idle_connections_are_bounded(self, db_path):
+        dbm = DatabaseManager(db_path, pool_size=1)
+        with dbm.get_connection(), dbm.get_connection():
+            pass
+        assert dbm.pool.stats()["idle"] == 1
+
+    def test_pool_size_zero_disables_pooling(self, db_path):
+        dbm = DatabaseManager(db_path, pool_size=0)
+        with dbm.get_connection() as first:
+            pass
+        with dbm.get_connection() as second:
+            pass
+        assert first is not second
+
+    def test_connections_shared_across_threads(self, db_manager, sample_user):
+        user = User(db_manager)
+        errors = []
+
+        def _worker():
+            try:
+                for _ in range(20):
+                    user.add_usage(sample_user, 1)
+            except Exception as e:  # noqa: BLE001
+                errors.append(e)
+
+        threads = [threading.Thread(target=_worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert user.get_user_by_id(sample_user)["total_usage_seconds"] == 80
+
+
 # === PasswordManager Tests ===
 
 
@@ -284,6 +373,30 @@ class TestUsageLog:
         )
         assert log_id is not None
 
+    def test_record_utterance_updates_usage_and_logs_atomically(
+        self, usage_log_model, user_model, sample_user
+    ):
+        """발화 기록은 사용량 누적 + 로그 INSERT 를 한 번에, 남은 시간을 반환"""
+        remaining = usage_log_model.record_utterance(
+            user_id=sample_user,
+            duration_seconds=30,
+            source_language="en",
+            target_language="ko",
+            metadata={"used_llm": True},
+            room_id=None,
+        )
+
+        assert remaining == 3600 - 30
+        assert user_model.get_remaining_seconds(sample_user) == remaining
+        logs = usage_log_model.get_user_logs(sample_user)
+        assert [log["duration_seconds"] for log in logs] == [30]
+        assert logs[0]["action"] == "transcribe"
+
+    def test_record_utterance_unknown_user_writes_nothing(self, usage_log_model):
+        """없는 사용자면 None, 로그도 남기지 않는다"""
+        assert usage_log_model.record_utterance(user_id=999, duration_seconds=5) is None
+        assert usage_log_model.get_all_logs() == []
+
     def test_record_usage_with_metadata(self, usage_log_model, sample_user):
         """메타데이터 포함 사용량 기록"""
         metadata = {"transcript_length": 100, "used_llm": True}
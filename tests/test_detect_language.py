@@ -4,7 +4,9 @@ detect_language()의 한국어/중국어/베트남어/영어 감지 및
 output_lang 폴백 로직 검증
 """
 
-from translation import detect_language
+from unittest.mock import patch
+
+from translation import count_scripts, detect_language
 
 
 class TestDetectLanguageKorean:
@@ -169,3 +171,54 @@ class TestDetectLanguagePriority:
         source, target = detect_language("안녕하세요")
         assert source == "ko"
         assert target == "en"
+
+
+class TestDetectLanguageMajority:
+    """혼합 발화는 첫 발견이 아니라 문자 체계 다수결로 감지"""
+
+    def test_count_scripts_single_pass_counts(self):
+        """문자 체계별 글자 수 (베트남어 고유 글자는 라틴에도 포함)"""
+        assert count_scripts("Xin chào ơ 안녕 你好!") == {
+            "hangul": 2,
+            "han": 2,
+            "latin": 8,
+            "vietnamese": 1,
+        }
+
+    def test_english_sentence_with_korean_word(self):
+        """영어 문장 속 한국어 단어 하나는 영어로 감지"""
+        source, _ = detect_language("I really love eating 김치 with rice")
+        assert source == "en"
+
+    def test_korean_sentence_with_english_terms(self):
+        """영어 용어가 섞인 한국어 발화는 한국어로 감지 (음절 가중치)"""
+        source, _ = detect_language("오늘은 AWS Lambda 와 Amazon Bedrock 을 소개합니다")
+        assert source == "ko"
+
+    def test_chinese_sentence_with_english_term(self):
+        """영어 용어가 섞인 중국어 발화는 중국어로 감지"""
+        source, _ = detect_language("我们今天讨论 Kubernetes 的部署")
+        assert source == "zh"
+
+    def test_no_letters_defaults_to_english(self):
+        """글자가 없으면 영어(기본)"""
+        assert detect_language("12345 !!!")[0] == "en"
+        assert detect_language("")[0] == "en"
+
+    def test_hangul_only_fast_path_matches_majority_vote(self):
+        """한글 전용 fast path 는 다수결 경로와 같은 결과를 낸다"""
+        samples = [
+            "오늘 발표에서는 실시간 자막을 소개합니다.",
+            "2024년 3분기 매출은 15% 늘었습니다!",
+            "네… 그렇습니다 · 감사합니다。",
+            "I really love eating 김치 with rice",
+            "안녕你好",
+            "12345 !!!",
+        ]
+        for output_lang in ("ko", "en"):
+            fast = [detect_language(s, output_lang) for s in samples]
+            # 겨루는 글자가 항상 있는 것처럼 만들어 fast path 를 끈다.
+            with patch("translation._COMPETING_LETTER_RE") as competing:
+                competing.search.return_value = True
+                slow = [detect_language(s, output_lang) for s in samples]
+            assert fast == slow
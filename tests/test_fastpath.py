@@ -0,0 +1,73 @@
+"""
+fastpath.py 단위 테스트
+JSON 백엔드(orjson / stdlib) 간 출력 동일성, orjson 이 거부하는 입력의 stdlib
+폴백, 디코드 예외 타입, 백엔드 선택과 이벤트 루프 폴백을 검증한다.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+import fastpath
+
+_BACKENDS = ["stdlib"] + (["orjson"] if fastpath.orjson is not None else [])
+
+
+@pytest.fixture(params=_BACKENDS)
+def backend(request):
+    previous = fastpath.json_backend()
+    assert fastpath.set_json_backend(request.param) == request.param
+    yield request.param
+    fastpath.set_json_backend(previous)
+
+
+class TestJson:
+    def test_compact_utf8_output_is_backend_independent(self, backend):
+        payload = {"type": "translation_partial", "text": "안녕 </script>", "n": 1}
+        assert fastpath.dumps(payload) == (
+            '{"type":"translation_partial","text":"안녕 </script>","n":1}'
+        )
+        assert fastpath.dumps_bytes(payload) == fastpath.dumps(payload).encode()
+
+    def test_roundtrip_str_and_bytes(self, backend):
+        payload = {"a": [1, 2.5, None, True], "b": {"c": "ü"}}
+        assert fastpath.loads(fastpath.dumps(payload)) == payload
+        assert fastpath.loads(fastpath.dumps_bytes(payload)) == payload
+
+    def test_inputs_outside_orjson_fall_back_to_stdlib(self, backend):
+        assert fastpath.dumps({1: 2**70}) == f'{{"1":{2**70}}}'
+        assert fastpath.loads('"\\ud800"') == "\ud800"
+
+    def test_invalid_json_raises_json_decode_error(self, backend):
+        with pytest.raises(json.JSONDecodeError):
+            fastpath.loads(b"{not json")
+
+    def test_unknown_backend_falls_back_to_stdlib(self):
+        previous = fastpath.json_backend()
+        try:
+            assert fastpath.set_json_backend("simdjson") == "stdlib"
+            assert fastpath.json_backend() == "stdlib"
+        finally:
+            fastpath.set_json_backend(previous)
+
+
+class TestEventLoop:
+    def test_asyncio_loop_when_forced(self, monkeypatch):
+        monkeypatch.setenv("REALTIME_EVENT_LOOP", "asyncio")
+        assert fastpath.event_loop_backend() == "asyncio"
+
+        async def _loop_type():
+            return type(asyncio.get_running_loop()).__module__
+
+        assert fastpath.run(_loop_type()).startswith("asyncio")
+
+    def test_auto_without_uvloop_uses_asyncio(self, monkeypatch):
+        monkeypatch.delenv("REALTIME_EVENT_LOOP", raising=False)
+        monkeypatch.setattr(fastpath, "uvloop", None)
+        assert fastpath.event_loop_backend() == "asyncio"
+        loop = fastpath.new_event_loop()
+        try:
+            assert isinstance(loop, asyncio.AbstractEventLoop)
+        finally:
+            loop.close()
@@ -0,0 +1,250 @@
+"""
+모델 라우터 단위 테스트
+ModelRouter 의 지연 기반 순서 / circuit open·half-open·close 전이와,
+translate_with_llm 이 열린 모델을 건너뛰고 전부 열리면 네트워크 호출 없이
+폴백하는지 검증
+"""
+
+import json
+from io import BytesIO
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError, ReadTimeoutError
+
+from bedrock_stream import BedrockStreamError
+from model_router import (
+    LATENCY_FIRST_TOKEN,
+    LATENCY_RESPONSE,
+    STATE_CLOSED,
+    STATE_OPEN,
+    ModelRouter,
+    is_model_fault,
+)
+from translation import (
+    BEDROCK_MODEL_IDS,
+    get_model_router,
+    translate_with_llm,
+    translate_with_llm_stream,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _client_error(code, status):
+    return ClientError(
+        {
+            "Error": {"Code": code, "Message": code},
+            "ResponseMetadata": {"HTTPStatusCode": status},
+        },
+        "InvokeModel",
+    )
+
+
+def _router(clock=None, **kwargs):
+    kwargs.setdefault("failure_threshold", 2)
+    kwargs.setdefault("open_seconds", 10)
+    kwargs.setdefault("min_samples", 100)
+    return ModelRouter(["haiku", "sonnet"], clock=clock or _Clock(), **kwargs)
+
+
+class TestModelRouter:
+    def test_configured_order_without_samples(self):
+        assert _router().candidates() == ["haiku", "sonnet"]
+
+    def test_fastest_model_first(self):
+        router = _router()
+        router.record_success("haiku", 0.9)
+        router.record_success("sonnet", 0.3)
+        assert router.candidates() == ["sonnet", "haiku"]
+
+    def test_consecutive_failures_open_circuit(self):
+        router = _router()
+        router.record_failure("haiku")
+        assert router.candidates() == ["haiku", "sonnet"]
+        router.record_failure("haiku")
+        assert router.candidates() == ["sonnet"]
+        assert router.stats()["haiku"]["state"] == STATE_OPEN
+
+    def test_error_rate_opens_circuit(self):
+        router = _router(failure_threshold=100, min_samples=4, error_rate=0.5)
+        for ok in (True, False, True, False):
+            if ok:
+                router.record_success("haiku", 0.1)
+            else:
+                router.record_failure("haiku")
+        assert "haiku" not in router.candidates()
+
+    def test_half_open_probe_closes_on_success(self):
+        clock = _Clock()
+        router = _router(clock)
+        router.record_failure("haiku")
+        router.record_failure("haiku")
+        clock.now = 11
+        # 한 요청만 probe 한다.
+        assert router.candidates() == ["haiku", "sonnet"]
+        assert router.candidates() == ["sonnet"]
+        router.record_success("haiku", 0.2)
+        assert router.stats()["haiku"]["state"] == STATE_CLOSED
+        assert router.candidates()[0] == "haiku"
+
+    def test_half_open_probe_failure_reopens(self):
+        clock = _Clock()
+        router = _router(clock)
+        router.record_failure("haiku")
+        router.record_failure("haiku")
+        clock.now = 11
+        router.candidates()
+        router.record_failure("haiku")
+        assert router.candidates() == ["sonnet"]
+
+    def test_stats_report_latency_percentiles(self):
+        router = _router()
+        for latency in (0.1, 0.2, 0.3, 0.4):
+            router.record_success("haiku", latency)
+        router.record_failure("haiku")
+        stats = router.stats()["haiku"]
+        assert stats["response"] == {"p50_ms": 300.0, "p95_ms": 400.0}
+        assert stats["first_token"] == {"p50_ms": None, "p95_ms": None}
+        assert stats["error_rate"] == 0.2
+
+    def test_latency_kinds_are_ordered_separately(self):
+        router = _router()
+        # haiku: 첫 토큰은 빠르지만 전체 응답은 느리다 — 두 값을 섞지 않는다.
+        router.record_success("haiku", 0.1, LATENCY_FIRST_TOKEN)
+        router.record_success("haiku", 2.0, LATENCY_RESPONSE)
+        router.record_success("sonnet", 0.5, LATENCY_FIRST_TOKEN)
+        router.record_success("sonnet", 1.0, LATENCY_RESPONSE)
+        assert router.candidates(LATENCY_FIRST_TOKEN) == ["haiku", "sonnet"]
+        assert router.candidates(LATENCY_RESPONSE) == ["sonnet", "haiku"]
+
+    def test_client_errors_do_not_open_circuit(self):
+        router = _router()
+        for _ in range(5):
+            assert (
+                router.record_error("haiku", _client_error("ValidationException", 400))
+                is False
+            )
+        assert router.stats()["haiku"]["state"] == STATE_CLOSED
+        assert router.stats()["haiku"]["samples"] == 0
+
+    def test_throttling_timeouts_and_5xx_open_circuit(self):
+        faults = [
+            _client_error("ThrottlingException", 429),
+            _client_error("InternalServerException", 500),
+            ReadTimeoutError(endpoint_url="https://bedrock"),
+            BedrockStreamError("stream", code="throttlingException"),
+            BedrockStreamError("HTTP 503", status=503),
+        ]
+        for error in faults:
+            assert is_model_fault(error), error
+        router = _router()
+        assert router.record_error("haiku", faults[0]) is True
+        assert router.record_error("haiku", faults[2]) is True
+        assert router.stats()["haiku"]["state"] == STATE_OPEN
+
+    def test_client_error_releases_half_open_probe(self):
+        clock = _Clock()
+        router = _router(clock)
+        router.record_failure("haiku")
+        router.record_failure("haiku")
+        clock.now = 11
+        assert router.candidates()[0] == "haiku"
+        router.record_error("haiku", _client_error("ValidationException", 400))
+        # 요청 오류는 probe 결과가 아니다 — 다음 요청이 다시 probe 한다.
+        assert router.candidates()[0] == "haiku"
+
+
+def _response(text):
+    return {"body": BytesIO(json.dumps({"content": [{"text": text}]}).encode())}
+
+
+class TestTranslateWithRouter:
+    def test_failed_model_is_not_retried_per_caption(self):
+        first, second = BEDROCK_MODEL_IDS[0], BEDROCK_MODEL_IDS[1]
+        client = MagicMock()
+
+        def _invoke(modelId, **kwargs):
+            if modelId == first:
+                raise _client_error("ThrottlingException", 429)
+            return _response("안녕하세요")
+
+        client.invoke_model.side_effect = _invoke
+        for text in ("one", "two", "three"):
+            assert translate_with_llm(client, text, "en", "ko") == "안녕하세요"
+
+        # 첫 호출만 실패를 치르고, 이후에는 응답한 모델로 바로 간다.
+        tried = [c.kwargs["modelId"] for c in client.invoke_model.call_args_list]
+        assert tried == [first, second, second, second]
+
+    def test_all_models_open_skips_network(self):
+        router = get_model_router()
+        for model in BEDROCK_MODEL_IDS:
+            for _ in range(10):
+                router.record_failure(model)
+        client = MagicMock()
+
+        assert translate_with_llm(client, "Hello", "en", "ko") is None
+        client.invoke_model.assert_not_called()
+
+    def test_validation_error_falls_back_without_opening_circuit(self):
+        first = BEDROCK_MODEL_IDS[0]
+        client = MagicMock()
+
+        def _invoke(modelId, **kwargs):
+            if modelId == first:
+                raise _client_error("ValidationException", 400)
+            return _response("안녕하세요")
+
+        client.invoke_model.side_effect = _invoke
+        for _ in range(5):
+            assert translate_with_llm(client, "Hello", "en", "ko") == "안녕하세요"
+
+        assert get_model_router().stats()[first]["state"] == STATE_CLOSED
+
+    def test_stream_latency_is_time_to_first_chunk(self, monkeypatch):
+        # 호출 시작 10.0 → 첫 청크 10.5 (이후 호출은 13.0).
+        clock = iter([10.0, 10.5] + [13.0] * 10)
+        monkeypatch.setattr("translation.time.monotonic", lambda: next(clock))
+        client = MagicMock()
+        delta = {"type": "content_block_delta", "delta": {"text": "안녕"}}
+        client.invoke_model_with_response_stream.return_value = {
+            "body": [{"chunk": {"bytes": json.dumps(delta).encode()}}]
+        }
+
+        chunks = list(translate_with_llm_stream(client, "Hi", "en", "ko"))
+
+        assert chunks[-1] == ("안녕", True)
+        stats = get_model_router().stats()[BEDROCK_MODEL_IDS[0]]
+        assert stats["first_token"]["p50_ms"] == 500.0
+        assert stats["response"]["p50_ms"] is None
+
+    def test_stream_falls_back_when_failing_before_first_chunk(self):
+        first, second = BEDROCK_MODEL_IDS[0], BEDROCK_MODEL_IDS[1]
+        delta = {"type": "content_block_delta", "delta": {"text": "안녕"}}
+
+        def _broken_body():
+            raise _client_error("ModelStreamErrorException", 424)
+            yield  # pragma: no cover
+
+        def _invoke(modelId, **kwargs):
+            if modelId == first:
+                return {"body": _broken_body()}
+            return {"body": [{"chunk": {"bytes": json.dumps(delta).encode()}}]}
+
+        client = MagicMock()
+        client.invoke_model_with_response_stream.side_effect = _invoke
+
+        chunks = list(translate_with_llm_stream(client, "Hi", "en", "ko"))
+
+        assert chunks[-1] == ("안녕", True)
+        tried = [
+            c.kwargs["modelId"]
+            for c in client.invoke_model_with_response_stream.call_args_list
+        ]
+        assert tried == [first, second]
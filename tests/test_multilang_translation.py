@@ -1,7 +1,7 @@
 """
 다국어 번역 기능 단위 테스트 (ISSUE-3)
-_build_prompt_to_chinese, _build_prompt_to_vietnamese,
-_build_prompt_to_english(source_lang), translate_with_llm 다국어 분기
+_system_prompt_to_chinese, _system_prompt_to_vietnamese,
+_system_prompt_to_english(source_lang), translate_with_llm 다국어 분기
 """
 
 import json
@@ -12,10 +12,11 @@ import pytest
 
 from translation import (
     SOURCE_LANG_NAMES,
-    _build_prompt_to_chinese,
-    _build_prompt_to_english,
-    _build_prompt_to_japanese,
-    _build_prompt_to_vietnamese,
+    _build_translation_prompt,
+    _system_prompt_to_chinese,
+    _system_prompt_to_english,
+    _system_prompt_to_japanese,
+    _system_prompt_to_vietnamese,
     translate_with_llm,
 )
 
@@ -39,132 +40,137 @@ class TestSourceLangNames:
         assert set(SOURCE_LANG_NAMES.keys()) == expected
 
 
-# === _build_prompt_to_chinese 테스트 ===
+# === _system_prompt_to_chinese 테스트 ===
 
 
 class TestBuildPromptToChinese:
-    def test_contains_source_text(self):
-        """프롬프트에 원본 텍스트 포함"""
-        prompt = _build_prompt_to_chinese("Hello world", "en")
-        assert "Hello world" in prompt
+    def test_source_text_goes_to_user_message(self):
+        """원문은 system 프롬프트가 아니라 user 메시지로 간다"""
+        system, user_text = _build_translation_prompt("Hello world", "en", "zh")
+        assert user_text == '원문: "Hello world"'
+        assert system == [_system_prompt_to_chinese("en")]
 
     def test_english_source_shows_label(self):
         """영어 소스 라벨이 프롬프트에 포함"""
-        prompt = _build_prompt_to_chinese("Hello", "en")
+        prompt = _system_prompt_to_chinese("en")
         assert SOURCE_LANG_NAMES["en"] in prompt
 
     def test_korean_source_shows_label(self):
         """한국어 소스 라벨이 프롬프트에 포함"""
-        prompt = _build_prompt_to_chinese("안녕하세요", "ko")
+        prompt = _system_prompt_to_chinese("ko")
         assert SOURCE_LANG_NAMES["ko"] in prompt
 
     def test_unknown_source_uses_fallback(self):
         """매핑되지 않은 언어는 중국어 폴백 라벨 사용"""
-        prompt = _build_prompt_to_chinese("Hello", "xx")
+        prompt = _system_prompt_to_chinese("xx")
         assert "原始语言" in prompt
 
     def test_contains_chinese_instructions(self):
         """중국어 번역 지시사항 포함"""
-        prompt = _build_prompt_to_chinese("Hello", "en")
+        prompt = _system_prompt_to_chinese("en")
         assert "中文" in prompt
 
     def test_contains_translation_guidelines(self):
         """번역 가이드라인 포함"""
-        prompt = _build_prompt_to_chinese("Hello", "en")
+        prompt = _system_prompt_to_chinese("en")
         assert "翻译指南" in prompt
 
 
-# === _build_prompt_to_vietnamese 테스트 ===
+# === _system_prompt_to_vietnamese 테스트 ===
 
 
 class TestBuildPromptToVietnamese:
-    def test_contains_source_text(self):
-        """프롬프트에 원본 텍스트 포함"""
-        prompt = _build_prompt_to_vietnamese("Hello world", "en")
-        assert "Hello world" in prompt
+    def test_source_text_goes_to_user_message(self):
+        """원문은 system 프롬프트가 아니라 user 메시지로 간다"""
+        system, user_text = _build_translation_prompt("Hello world", "en", "vi")
+        assert user_text == '원문: "Hello world"'
+        assert system == [_system_prompt_to_vietnamese("en")]
 
     def test_english_source_shows_label(self):
         """영어 소스 라벨이 프롬프트에 포함"""
-        prompt = _build_prompt_to_vietnamese("Hello", "en")
+        prompt = _system_prompt_to_vietnamese("en")
         assert SOURCE_LANG_NAMES["en"] in prompt
 
     def test_korean_source_shows_label(self):
         """한국어 소스 라벨이 프롬프트에 포함"""
-        prompt = _build_prompt_to_vietnamese("안녕하세요", "ko")
+        prompt = _system_prompt_to_vietnamese("ko")
         assert SOURCE_LANG_NAMES["ko"] in prompt
 
     def test_unknown_source_uses_fallback(self):
         """매핑되지 않은 언어는 베트남어 폴백 라벨 사용"""
-        prompt = _build_prompt_to_vietnamese("Hello", "xx")
+        prompt = _system_prompt_to_vietnamese("xx")
         assert "ngon ngu goc" in prompt
 
     def test_contains_vietnamese_instructions(self):
         """베트남어 번역 지시사항 포함"""
-        prompt = _build_prompt_to_vietnamese("Hello", "en")
+        prompt = _system_prompt_to_vietnamese("en")
         assert "tieng Viet" in prompt
 
     def test_contains_translation_guidelines(self):
         """번역 가이드라인 포함"""
-        prompt = _build_prompt_to_vietnamese("Hello", "en")
+        prompt = _system_prompt_to_vietnamese("en")
         assert "Huong dan dich" in prompt
 
 
-# === _build_prompt_to_japanese 테스트 (#103) ===
+# === _system_prompt_to_japanese 테스트 (#103) ===
 
 
 class TestBuildPromptToJapanese:
-    def test_contains_source_text(self):
-        prompt = _build_prompt_to_japanese("Hello world", "en")
-        assert "Hello world" in prompt
+    def test_source_text_goes_to_user_message(self):
+        """원문은 system 프롬프트가 아니라 user 메시지로 간다"""
+        system, user_text = _build_translation_prompt("Hello world", "en", "ja")
+        assert user_text == '원문: "Hello world"'
+        assert system == [_system_prompt_to_japanese("en")]
 
     def test_contains_japanese_instructions(self):
         """일본어 번역 프롬프트여야 한다 (영어 기본값으로 새지 않음)."""
-        prompt = _build_prompt_to_japanese("Hello", "en")
+        prompt = _system_prompt_to_japanese("en")
         assert "日本語" in prompt
         assert "日本語訳" in prompt
 
     def test_english_source_shows_label(self):
-        prompt = _build_prompt_to_japanese("Hello", "en")
+        prompt = _system_prompt_to_japanese("en")
         assert SOURCE_LANG_NAMES["en"] in prompt
 
     def test_unknown_source_uses_fallback(self):
-        prompt = _build_prompt_to_japanese("Hello", "xx")
+        prompt = _system_prompt_to_japanese("xx")
         assert "元の言語" in prompt
 
 
-# === _build_prompt_to_english 확장 테스트 ===
+# === _system_prompt_to_english 확장 테스트 ===
 
 
 class TestBuildPromptToEnglishExtended:
     def test_no_source_lang_defaults_to_korean(self):
         """source_lang=None 시 한국어 기본값 사용"""
-        prompt = _build_prompt_to_english("안녕하세요")
+        prompt = _system_prompt_to_english()
         assert "한국어" in prompt
 
     def test_source_lang_zh_shows_chinese_label(self):
         """source_lang=zh 시 중국어 라벨 사용"""
-        prompt = _build_prompt_to_english("你好", source_lang="zh")
+        prompt = _system_prompt_to_english(source_lang="zh")
         assert "중국어" in prompt
 
     def test_source_lang_vi_shows_vietnamese_label(self):
         """source_lang=vi 시 베트남어 라벨 사용"""
-        prompt = _build_prompt_to_english("Xin chao", source_lang="vi")
+        prompt = _system_prompt_to_english(source_lang="vi")
         assert "베트남어" in prompt
 
     def test_source_lang_ko_shows_korean_label(self):
         """source_lang=ko 시 한국어 라벨 사용"""
-        prompt = _build_prompt_to_english("안녕하세요", source_lang="ko")
+        prompt = _system_prompt_to_english(source_lang="ko")
         assert "한국어" in prompt
 
     def test_unknown_source_lang_uses_fallback(self):
         """알 수 없는 source_lang은 폴백 라벨 사용"""
-        prompt = _build_prompt_to_english("text", source_lang="xx")
+        prompt = _system_prompt_to_english(source_lang="xx")
         assert "원본 언어" in prompt
 
-    def test_contains_source_text(self):
-        """프롬프트에 원본 텍스트 포함"""
-        prompt = _build_prompt_to_english("你好世界", source_lang="zh")
-        assert "你好世界" in prompt
+    def test_source_text_goes_to_user_message(self):
+        """원문은 system 프롬프트가 아니라 user 메시지로 간다"""
+        system, user_text = _build_translation_prompt("你好世界", "zh", "en")
+        assert user_text == '원문: "你好世界"'
+        assert system == [_system_prompt_to_english(source_lang="zh")]
 
 
 # === translate_with_llm 다국어 분기 테스트 ===
@@ -216,7 +222,7 @@ class TestTranslateWithLlmMultilang:
         assert result is not None and "こんにちは" in result
         # 실제 Bedrock 에 보낸 body(JSON)를 파싱해 프롬프트가 일본어인지 검증.
         sent_body = mock_client.invoke_model.call_args.kwargs["body"]
-        prompt = json.loads(sent_body)["messages"][0]["content"][0]["text"]
+        prompt = json.loads(sent_body)["system"][0]["text"]
         assert "日本語訳" in prompt
         assert "국제 컨퍼런스" not in prompt  # 영어 프롬프트 마커가 아님
 
@@ -292,7 +298,7 @@ class TestTranslateWithLlmStream:
         mock = self._make_stream_bedrock(["안녕"])
         list(translate_with_llm_stream(mock, "Hello", "en", "ko"))
         body = mock.invoke_model_with_response_stream.call_args.kwargs["body"]
-        prompt = json.loads(body)["messages"][0]["content"][0]["text"]
+        prompt = json.loads(body)["system"][0]["text"]
         assert "한국어" in prompt
 
     def test_raises_on_bedrock_error_for_fallback(self):
@@ -302,3 +308,88 @@ class TestTranslateWithLlmStream:
         mock.invoke_model_with_response_stream.side_effect = RuntimeError("boom")
         with pytest.raises(RuntimeError):
             list(translate_with_llm_stream(mock, "Hello", "en", "ko"))
+
+
+# === translate_with_llm_multi_stream 테스트 ===
+
+
+def _stream_response(*pieces):
+    """Bedrock 스트리밍 응답 흉내 — content_block_delta 이벤트 목록."""
+    events = []
+    for piece in pieces:
+        delta = {"type": "content_block_delta", "delta": {"text": piece}}
+        events.append({"chunk": {"bytes": json.dumps(delta).encode()}})
+    return {"body": events}
+
+
+class TestTranslateWithLlmMultiStream:
+    def test_yields_each_language_as_field_completes(self):
+        from translation import translate_with_llm_multi_stream
+
+        client = MagicMock()
+        client.invoke_model_with_response_stream.return_value = _stream_response(
+            '{"zh": "你', '好", "v', 'i": "Xin chào"}'
+        )
+
+        results = list(
+            translate_with_llm_multi_stream(client, "Hi", "en", ["zh", "vi"])
+        )
+
+        assert results == [("zh", "你好"), ("vi", "Xin chào")]
+        assert client.invoke_model_with_response_stream.call_count == 1
+        body = json.loads(
+            client.invoke_model_with_response_stream.call_args.kwargs["body"]
+        )
+        prompt = body["system"][0]["text"]
+        assert body["messages"][0]["content"][0]["text"] == '원문: "Hi"'
+        assert "zh" in prompt and "vi" in prompt
+        assert body["max_tokens"] == 400
+
+    def test_missing_language_is_not_yielded(self):
+        from translation import translate_with_llm_multi_stream
+
+        client = MagicMock()
+        client.invoke_model_with_response_stream.return_value = _stream_response(
+            '{"zh": "你好"}'
+        )
+
+        results = dict(
+            translate_with_llm_multi_stream(client, "Hi", "en", ["zh", "vi"])
+        )
+
+        assert results == {"zh": "你好"}
+
+    def test_cached_languages_skip_request(self):
+        from translation import (
+            LLM_CACHE_MODEL,
+            get_translation_cache,
+            translate_with_llm_multi_stream,
+        )
+
+        get_translation_cache().put("Hi", "en", "zh", LLM_CACHE_MODEL, "你好")
+        client = MagicMock()
+        client.invoke_model_with_response_stream.return_value = _stream_response(
+            '{"vi": "Xin chào"}'
+        )
+
+        results = list(
+            translate_with_llm_multi_stream(client, "Hi", "en", ["zh", "vi"])
+        )
+
+        assert results == [("zh", "你好"), ("vi", "Xin chào")]
+        body = json.loads(
+            client.invoke_model_with_response_stream.call_args.kwargs["body"]
+        )
+        assert '"zh"' not in body["system"][0]["text"]
+
+    def test_escaped_quotes_are_decoded(self):
+        from translation import translate_with_llm_multi_stream
+
+        client = MagicMock()
+        client.invoke_model_with_response_stream.return_value = _stream_response(
+            '{"zh": "他说\\"你好\\""}'
+        )
+
+        results = list(translate_with_llm_multi_stream(client, "Hi", "en", ["zh"]))
+
+        assert results == [("zh", '他说"你好"')]
@@ -0,0 +1,111 @@
+"""
+partial_updates.py 단위 테스트
+PartialCoalescer 의 최소 간격/글자 증가/경계/재작성 규칙과
+PartialDeltaEncoder 의 append-delta 인코딩(UTF-16 offset 포함)을 검증한다.
+"""
+
+from partial_updates import PartialCoalescer, PartialDeltaEncoder
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _coalescer(clock, min_interval=0.05, min_chars=4):
+    return PartialCoalescer(min_interval=min_interval, min_chars=min_chars, clock=clock)
+
+
+class TestPartialCoalescer:
+    def test_first_partial_is_sent_immediately(self):
+        c = _coalescer(_Clock())
+        assert c.offer("안") is True
+
+    def test_holds_within_min_interval(self):
+        clock = _Clock()
+        c = _coalescer(clock)
+        c.offer("안녕")
+        clock.now += 0.01
+        assert c.offer("안녕하세요 여러분") is False
+        clock.now += 0.05
+        assert c.offer("안녕하세요 여러분") is True
+
+    def test_holds_small_growth_until_min_chars(self):
+        clock = _Clock()
+        c = _coalescer(clock)
+        c.offer("안녕")
+        clock.now += 1
+        assert c.offer("안녕하") is False
+        assert c.offer("안녕하세요여") is True
+
+    def test_boundary_bypasses_min_chars(self):
+        clock = _Clock()
+        c = _coalescer(clock)
+        c.offer("안녕")
+        clock.now += 1
+        assert c.offer("안녕하세요.") is True
+        clock.now += 1
+        assert c.offer("안녕하세요. ") is True
+
+    def test_rewrite_is_sent_immediately(self):
+        clock = _Clock()
+        c = _coalescer(clock)
+        c.offer("다음 슬라이드")
+        assert c.offer("다음 장표") is True
+
+    def test_duplicate_and_empty_are_skipped(self):
+        c = _coalescer(_Clock())
+        assert c.offer("") is False
+        c.offer("같음")
+        assert c.offer("같음") is False
+
+    def test_token_stream_is_thinned(self):
+        clock = _Clock()
+        c = _coalescer(clock)
+        text = (
+            "오늘 발표에서는 실시간 자막 시스템의 지연 시간을 줄이는 방법을 소개합니다."
+        )
+        sent = []
+        for i in range(1, len(text) + 1):
+            clock.now += 0.015  # 토큰(여기서는 글자) 간격 15ms
+            if c.offer(text[:i]):
+                sent.append(text[:i])
+        assert sent[0] == text[:1]
+        assert len(sent) < len(text) / 3
+
+
+class TestPartialDeltaEncoder:
+    def test_full_format_sends_text(self):
+        enc = PartialDeltaEncoder("full")
+        assert enc.encode("c", "안녕") == {"text": "안녕"}
+        assert enc.encode("c", "안녕하세요") == {"text": "안녕하세요"}
+
+    def test_delta_format_appends(self):
+        enc = PartialDeltaEncoder("delta")
+        assert enc.encode("c", "안녕") == {"text": "안녕", "seq": 1}
+        assert enc.encode("c", "안녕하세요") == {
+            "offset": 2,
+            "delta": "하세요",
+            "seq": 2,
+        }
+
+    def test_delta_rewrite_keeps_common_prefix(self):
+        enc = PartialDeltaEncoder("delta")
+        enc.encode("c", "다음 슬라이드")
+        assert enc.encode("c", "다음 장표") == {"offset": 3, "delta": "장표", "seq": 2}
+        assert enc.encode("c", "이번 장표") == {"text": "이번 장표", "seq": 3}
+
+    def test_offset_counts_utf16_code_units(self):
+        enc = PartialDeltaEncoder("delta")
+        enc.encode("c", "👍 좋아")
+        assert enc.encode("c", "👍 좋아요") == {"offset": 5, "delta": "요", "seq": 2}
+
+    def test_channels_are_independent_and_reset(self):
+        enc = PartialDeltaEncoder("delta")
+        enc.encode(("r1", "ko"), "안녕")
+        assert enc.encode(("r2", "ko"), "안녕하") == {"text": "안녕하", "seq": 1}
+        enc.reset(("r1", "ko"))
+        assert enc.encode(("r1", "ko"), "안녕하") == {"text": "안녕하", "seq": 1}
@@ -0,0 +1,191 @@
+"""
+QuotaLedger 단위 테스트
+O(1) 조회, reconcile 주기 재적재, charge 차감, invalidate,
+기록 번호 기반 적재/차감 순서 독립성과
+check_usage_limit / User 변경 경로의 ledger 연동 검증
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from database import DatabaseManager, User
+from quota_ledger import QuotaLedger, get_quota_ledger
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def ledger(clock):
+    return QuotaLedger(reconcile_seconds=30, clock=clock)
+
+
+class TestQuotaLedger:
+    def test_hit_does_not_call_loader(self, ledger):
+        load = MagicMock(return_value=(100, None))
+        assert ledger.remaining(1, load) == 100
+        assert ledger.remaining(1, load) == 100
+        load.assert_called_once_with(1)
+        assert ledger.stats() == {"users": 1, "hits": 1, "loads": 1}
+
+    def test_stale_entry_is_reconciled(self, ledger, clock):
+        ledger.prime(1, 100)
+        clock.now = 31
+        load = MagicMock(return_value=(40, None))
+        assert ledger.remaining(1, load) == 40
+        load.assert_called_once_with(1)
+
+    def test_charge_subtracts_from_loaded_user(self, ledger):
+        ledger.prime(1, 100)
+        assert ledger.charge(1, 7) == 93
+        assert ledger.remaining(1, MagicMock()) == 93
+
+    def test_charge_unknown_user_returns_none(self, ledger):
+        assert ledger.charge(1, 7) is None
+        assert ledger.stats()["users"] == 0
+
+    def test_missing_user_is_not_cached(self, ledger):
+        load = MagicMock(return_value=(None, None))
+        assert ledger.remaining(1, load) is None
+        assert ledger.remaining(1, load) is None
+        assert load.call_count == 2
+
+    def test_invalidate_single_and_all(self, ledger):
+        ledger.prime(1, 10)
+        ledger.prime(2, 20)
+        ledger.invalidate(1)
+        assert ledger.stats()["users"] == 1
+        ledger.invalidate()
+        assert ledger.stats()["users"] == 0
+
+
+class TestLedgerRecordIds:
+    """적재(prime)와 차감(charge)이 어떤 순서로 엇갈려도 한 번씩만 빠진다."""
+
+    def test_charge_already_in_reload_is_noop(self, ledger):
+        ledger.prime(1, 100, upto=0)
+        # 기록 1 이 submit 된 뒤, charge 전에 다시 적재됨 (pending 에 포함).
+        ledger.prime(1, 95, upto=1)
+        assert ledger.charge(1, 5, record_id=1) == 95
+
+    def test_reload_reapplies_later_charges(self, ledger):
+        ledger.prime(1, 100, upto=0)
+        assert ledger.charge(1, 5, record_id=1) == 95
+        assert ledger.charge(1, 3, record_id=2) == 92
+        # 기록 1 까지만 반영한 적재 — 기록 2 는 다시 빼야 한다.
+        assert ledger.prime(1, 95, upto=1) == 92
+        assert ledger.prime(1, 92, upto=2) == 92
+
+    def test_stale_reload_is_ignored(self, ledger):
+        ledger.prime(1, 95, upto=1)
+        assert ledger.charge(1, 3, record_id=2) == 92
+        ledger.prime(1, 92, upto=2)
+        # 더 먼저 시작했지만 늦게 끝난 적재.
+        assert ledger.prime(1, 95, upto=1) == 92
+        assert ledger.remaining(1, MagicMock()) == 92
+
+
+class TestLedgerWithUsageWriter:
+    def test_prime_charge_commit_settle_interleaving(self, tmp_path, monkeypatch):
+        """prime → submit → (커밋 중 reload) → charge → settle → reload."""
+        import threading
+
+        import auth
+        from database import UsageLog
+        from usage_writer import UsageLogWriter
+
+        monkeypatch.setenv("USAGE_WRITE_BEHIND", "1")
+        dbm = DatabaseManager(str(tmp_path / "test.db"))
+        user_model = User(dbm)
+        user_id = user_model.create_user("op", "pw", usage_limit_seconds=60)
+        log = UsageLog(dbm)
+        committed = threading.Event()
+        release = threading.Event()
+        original = log.record_utterances
+
+        def _commit_then_pause(rows):
+            original(rows)
+            committed.set()
+            assert release.wait(5)
+
+        log.record_utterances = _commit_then_pause
+        writer = UsageLogWriter(log, flush_interval=0)
+        ledger = get_quota_ledger()
+
+        with (
+            patch("auth.get_user_model", return_value=user_model),
+            patch("auth.get_usage_writer", return_value=writer),
+        ):
+            ledger.prime(user_id, *auth.load_remaining_snapshot(user_id))
+            record_id = writer.submit(user_id=user_id, duration_seconds=5)
+            assert committed.wait(5)
+
+            # 커밋은 끝났고 settle 전 — reload 는 settle 뒤의 값을 읽는다.
+            reloaded = []
+            reloader = threading.Thread(
+                target=lambda: reloaded.append(
+                    ledger.prime(user_id, *auth.load_remaining_snapshot(user_id))
+                )
+            )
+            reloader.start()
+            assert ledger.charge(user_id, 5, record_id=record_id) == 55
+            release.set()
+            reloader.join(5)
+            assert reloaded == [55]
+
+            # 이미 반영된 기록을 다시 charge 해도 그대로.
+            assert ledger.charge(user_id, 5, record_id=record_id) == 55
+            assert writer.flush(timeout=5)
+            assert auth.load_remaining_snapshot(user_id) == (55, record_id)
+            ledger.prime(user_id, *auth.load_remaining_snapshot(user_id))
+            assert ledger.remaining(user_id, auth.load_remaining_snapshot) == 55
+        writer.close()
+
+
+class TestCheckUsageLimitLedger:
+    def test_repeated_checks_read_db_once(self):
+        from auth import check_usage_limit
+
+        user_model = MagicMock()
+        user_model.get_remaining_seconds.return_value = 10
+        user_info = {"id": 1, "role": "user"}
+        with patch("auth.get_user_model", return_value=user_model):
+            assert check_usage_limit(5, user_info) is True
+            assert check_usage_limit(5, user_info) is True
+            assert check_usage_limit(11, user_info) is False
+        user_model.get_remaining_seconds.assert_called_once_with(1)
+
+    def test_admin_skips_ledger(self):
+        from auth import check_usage_limit
+
+        with patch("auth.get_user_model") as get_model:
+            assert check_usage_limit(10**6, {"id": 1, "role": "admin"}) is True
+        get_model.assert_not_called()
+
+
+class TestUserInvalidatesLedger:
+    def test_limit_change_is_visible_immediately(self, tmp_path):
+        user_model = User(DatabaseManager(str(tmp_path / "test.db")))
+        user_id = user_model.create_user("op", "pw", usage_limit_seconds=60)
+
+        def load(uid):
+            return user_model.get_remaining_seconds(uid), None
+
+        ledger = get_quota_ledger()
+
+        assert ledger.remaining(user_id, load) == 60
+        user_model.update_user(user_id, usage_limit_seconds=120)
+        assert ledger.remaining(user_id, load) == 120
+        user_model.add_usage(user_id, 20)
+        assert ledger.remaining(user_id, load) == 100
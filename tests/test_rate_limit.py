@@ -240,6 +240,49 @@ class TestHandleWebsocketRateLimit:
         rate_limit_msgs = [m for m in sent if m.get("message") == "rate_limit_exceeded"]
         assert len(rate_limit_msgs) == 0
 
+    @pytest.mark.asyncio
+    async def test_transcript_deltas_are_rate_limited_separately(self):
+        """transcript_delta 는 별도 창으로 제한되고, 초과분은 조용히 버린다"""
+        from websocket_handler import handle_openai_websocket
+
+        messages = [
+            json.dumps({"type": "transcript_delta", "item_id": "i1", "text": f"H{i}"})
+            for i in range(4)
+        ] + [json.dumps({"type": "transcript", "text": "Hello"})]
+
+        ws = _make_websocket(messages)
+        mock_user = {
+            "id": 1,
+            "username": "testuser",
+            "role": "user",
+            "full_name": None,
+            "is_active": 1,
+        }
+        mock_handle_delta = MagicMock()
+        mock_handle_transcript = AsyncMock()
+
+        with (
+            patch(
+                "websocket_handler._authenticate_client",
+                new=AsyncMock(return_value=mock_user),
+            ),
+            patch(
+                "websocket_handler._init_translation_clients",
+                return_value=(MagicMock(), MagicMock(), True),
+            ),
+            patch("websocket_handler._handle_transcript_delta", mock_handle_delta),
+            patch("websocket_handler._handle_transcript", mock_handle_transcript),
+            patch("websocket_handler.WS_DELTA_RATE_LIMIT_PER_MINUTE", 3),
+            patch("websocket_handler.WS_RATE_LIMIT_PER_MINUTE", 1),
+        ):
+            await handle_openai_websocket(ws)
+
+        # 4번째 델타는 거부, 델타가 transcript 한도를 쓰지는 않는다.
+        assert mock_handle_delta.call_count == 3
+        assert mock_handle_transcript.call_count == 1
+        sent = _get_sent_messages(ws)
+        assert not [m for m in sent if m.get("message") == "rate_limit_exceeded"]
+
     @pytest.mark.asyncio
     async def test_rate_limit_is_per_connection(self):
         """각 연결은 독립적인 레이트 리밋을 가짐"""
@@ -0,0 +1,198 @@
+"""
+realtime_service.py 단위 테스트
+control API (health / viewer metrics), Streamlit 쪽 클라이언트, 그리고
+serve() 의 기동 → stop 신호 → graceful shutdown 순서를 검증한다.
+"""
+
+import asyncio
+import socket
+from unittest.mock import MagicMock, patch
+
+import aiohttp
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from realtime_service import (
+    build_control_app,
+    fetch_health,
+    fetch_viewer_metrics,
+    serve,
+    use_external_service,
+)
+from sse_broadcast import BroadcastManager
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class TestControlApi:
+    @pytest.mark.asyncio
+    async def test_health_reports_ports(self):
+        app = build_control_app(
+            broadcast_manager=BroadcastManager(), ws_port=8765, sse_port=None
+        )
+        async with TestClient(TestServer(app)) as client:
+            resp = await client.get("/health")
+            assert resp.status == 200
+            assert await resp.json() == {
+                "status": "ok",
+                "ws_port": 8765,
+                "sse_port": None,
+            }
+
+    @pytest.mark.asyncio
+    async def test_viewer_metrics_match_manager(self):
+        mgr = BroadcastManager()
+        await mgr.register_viewer("r1", "ko")
+        await mgr.register_viewer("r1", "en")
+        app = build_control_app(broadcast_manager=mgr, ws_port=1, sse_port=2)
+        async with TestClient(TestServer(app)) as client:
+            resp = await client.get("/rooms/r1/viewers")
+            assert await resp.json() == mgr.get_metrics("r1")
+
+    @pytest.mark.asyncio
+    async def test_llm_usage_reports_token_stats(self):
+        from translation import get_llm_token_usage
+
+        usage = get_llm_token_usage()
+        usage.clear()
+        usage.record({"input_tokens": 40, "output_tokens": 6})
+        app = build_control_app(
+            broadcast_manager=BroadcastManager(), ws_port=1, sse_port=2
+        )
+        try:
+            async with TestClient(TestServer(app)) as client:
+                stats = await (await client.get("/llm/usage")).json()
+        finally:
+            usage.clear()
+
+        assert stats["requests"] == 1
+        assert stats["avg_prompt_tokens"] == 40
+
+    @pytest.mark.asyncio
+    async def test_translation_cache_reports_hit_miss(self):
+        from translation import LLM_CACHE_MODEL, get_translation_cache
+
+        cache = get_translation_cache()
+        cache.put("Hi", "en", "ko", LLM_CACHE_MODEL, "안녕")
+        cache.get("Hi", "en", "ko", LLM_CACHE_MODEL)
+        cache.get("Bye", "en", "ko", LLM_CACHE_MODEL)
+        app = build_control_app(
+            broadcast_manager=BroadcastManager(), ws_port=1, sse_port=2
+        )
+        async with TestClient(TestServer(app)) as client:
+            stats = await (await client.get("/translation/cache")).json()
+
+        assert stats == cache.stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_translation_executor_reports_queue_stats(self):
+        from translation_executor import get_translation_executor
+
+        app = build_control_app(
+            broadcast_manager=BroadcastManager(), ws_port=1, sse_port=2
+        )
+        async with TestClient(TestServer(app)) as client:
+            resp = await client.get("/translation/executor")
+            assert resp.status == 200
+            stats = await resp.json()
+
+        # 워커 스레드가 카운터를 비동기로 갱신하므로 값이 아니라 모양을 본다.
+        assert set(stats) == set(get_translation_executor().stats())
+        assert set(stats["queued"]) == {"primary", "secondary"}
+
+    @pytest.mark.asyncio
+    async def test_viewer_metrics_error_is_generic(self):
+        mgr = MagicMock()
+        mgr.get_metrics.side_effect = RuntimeError("sqlite3 exploded")
+        app = build_control_app(broadcast_manager=mgr, ws_port=1, sse_port=2)
+        async with TestClient(TestServer(app)) as client:
+            resp = await client.get("/rooms/r1/viewers")
+            assert resp.status == 500
+            assert "sqlite3" not in await resp.text()
+
+
+class TestControlClient:
+    @pytest.mark.asyncio
+    async def test_fetch_viewer_metrics_over_http(self, monkeypatch):
+        mgr = BroadcastManager()
+        await mgr.register_viewer("r1", "ko")
+        app = build_control_app(broadcast_manager=mgr, ws_port=1, sse_port=2)
+        async with TestServer(app) as server:
+            monkeypatch.setenv("REALTIME_SERVICE_URL", str(server.make_url("")))
+            assert use_external_service() is True
+            # Streamlit 쪽 호출은 동기 — 서버 루프를 막지 않도록 스레드에서.
+            metrics = await asyncio.to_thread(fetch_viewer_metrics, "r1")
+            health = await asyncio.to_thread(fetch_health)
+
+        assert metrics == {"current": 1, "by_lang": {"ko": 1}}
+        assert health["status"] == "ok"
+
+    def test_fetch_health_returns_none_when_unreachable(self, monkeypatch):
+        monkeypatch.setenv("REALTIME_SERVICE_URL", f"http://127.0.0.1:{_free_port()}")
+        assert fetch_health() is None
+
+    def test_external_service_off_by_default(self, monkeypatch):
+        monkeypatch.delenv("REALTIME_SERVICE_URL", raising=False)
+        assert use_external_service() is False
+
+
+class TestServe:
+    @pytest.mark.asyncio
+    async def test_serves_until_stop_then_shuts_down(self):
+        ws_server = MagicMock()
+        ws_server.wait_closed = MagicMock(return_value=asyncio.sleep(0))
+        executor = MagicMock()
+        repo = MagicMock()
+        repo.get_by_id.return_value = None
+        sse_port, control_port = _free_port(), _free_port()
+        stop = asyncio.Event()
+
+        async def _fake_serve_websocket(host, port):
+            return ws_server
+
+        with (
+            patch("websocket_handler.serve_websocket", _fake_serve_websocket),
+            patch("database.get_room_model", return_value=repo),
+            patch("websocket_handler.attach_broadcast_metrics_repo") as attach,
+            patch(
+                "translation_executor.get_translation_executor",
+                return_value=executor,
+            ),
+        ):
+            task = asyncio.create_task(
+                serve(
+                    host="127.0.0.1",
+                    ws_port=8765,
+                    sse_port=sse_port,
+                    control_port=control_port,
+                    stop=stop,
+                )
+            )
+            async with aiohttp.ClientSession() as session:
+                for _ in range(100):
+                    try:
+                        async with session.get(
+                            f"http://127.0.0.1:{control_port}/health"
+                        ) as resp:
+                            health = await resp.json()
+                        break
+                    except aiohttp.ClientConnectionError:
+                        await asyncio.sleep(0.02)
+                async with session.get(f"http://127.0.0.1:{sse_port}/health") as resp:
+                    assert await resp.text() == "OK"
+
+            stop.set()
+            await asyncio.wait_for(task, 5)
+
+        assert health == {"status": "ok", "ws_port": 8765, "sse_port": sse_port}
+        attach.assert_called_once_with(repo)
+        ws_server.close.assert_called_once()
+        executor.shutdown.assert_called_once_with(wait=False)
+        # 리스너가 모두 닫혔다.
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", control_port))
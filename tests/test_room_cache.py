@@ -0,0 +1,136 @@
+"""
+RoomCache 단위 테스트
+read-through 조회, TTL 재적재, 조회 중 invalidate 경합, Room 상태 변경의
+명시적 무효화와 SSE viewer 접속 폭주 시 룸당 1회 조회 검증
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from database import DatabaseManager, Room, User
+from room_cache import RoomCache, get_room_cache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def cache(clock):
+    return RoomCache(ttl_seconds=5, clock=clock)
+
+
+class TestRoomCache:
+    def test_hit_does_not_call_loader(self, cache):
+        load = MagicMock(return_value={"id": "r1", "status": "active"})
+        assert cache.get("r1", load)["status"] == "active"
+        assert cache.get("r1", load)["status"] == "active"
+        load.assert_called_once_with("r1")
+        assert cache.stats() == {"rooms": 1, "hits": 1, "loads": 1}
+
+    def test_expired_entry_is_reloaded(self, cache, clock):
+        load = MagicMock(side_effect=[{"status": "active"}, {"status": "closed"}])
+        cache.get("r1", load)
+        clock.now = 5
+        assert cache.get("r1", load)["status"] == "closed"
+        assert load.call_count == 2
+
+    def test_missing_room_is_not_cached(self, cache):
+        load = MagicMock(return_value=None)
+        assert cache.get("r1", load) is None
+        assert cache.get("r1", load) is None
+        assert load.call_count == 2
+
+    def test_loader_exception_propagates_and_is_not_cached(self, cache):
+        load = MagicMock(side_effect=[RuntimeError("locked"), {"status": "active"}])
+        with pytest.raises(RuntimeError):
+            cache.get("r1", load)
+        assert cache.get("r1", load) == {"status": "active"}
+
+    def test_invalidate_during_load_keeps_stale_row_out(self, cache):
+        def load(room_id):
+            # 조회 도중 다른 스레드가 상태를 바꾸고 무효화했다.
+            cache.invalidate(room_id)
+            return {"status": "active"}
+
+        cache.get("r1", load)
+        assert cache.stats()["rooms"] == 0
+
+
+class TestRoomInvalidation:
+    @pytest.fixture
+    def room_model(self, tmp_path):
+        db = DatabaseManager(str(tmp_path / "rooms.db"))
+        self.admin_id = User(db).create_user("admin1", "pw", role="admin")
+        return Room(db)
+
+    def _cached(self, room_model, room_id):
+        return get_room_cache().get(room_id, room_model.get_by_id)
+
+    def test_transition_and_force_close_are_visible_immediately(self, room_model):
+        room_model.create("r1", "Room", created_by=self.admin_id)
+        assert self._cached(room_model, "r1")["status"] == "waiting"
+
+        room_model.transition_status("r1", "active")
+        assert self._cached(room_model, "r1")["status"] == "active"
+
+        room_model.force_close("r1")
+        assert self._cached(room_model, "r1")["status"] == "closed"
+
+    def test_assign_operator_is_visible_immediately(self, room_model):
+        room_model.create("r1", "Room", created_by=self.admin_id)
+        assert self._cached(room_model, "r1")["operator_id"] is None
+
+        room_model.assign_operator("r1", self.admin_id)
+        assert self._cached(room_model, "r1")["operator_id"] == self.admin_id
+
+    def test_create_replaces_cached_miss(self, room_model):
+        assert self._cached(room_model, "r1") is None
+        room_model.create("r1", "Room", created_by=self.admin_id)
+        assert self._cached(room_model, "r1")["status"] == "waiting"
+
+
+class _CountingRepo:
+    def __init__(self, rows: dict[str, dict[str, Any]]):
+        self._rows = rows
+        self.calls = 0
+
+    def get_by_id(self, room_id: str) -> dict[str, Any] | None:
+        self.calls += 1
+        return self._rows.get(room_id)
+
+
+class TestViewerJoinStorm:
+    @pytest.mark.asyncio
+    async def test_view_and_stream_share_one_lookup(self):
+        from aiohttp.test_utils import TestClient, TestServer
+
+        from sse_broadcast import BroadcastManager, build_sse_app
+
+        repo = _CountingRepo(
+            {"r1": {"id": "r1", "status": "closed", "primary_output_lang": "ko"}}
+        )
+        app = build_sse_app(broadcast_manager=BroadcastManager(), room_repo=repo)
+
+        async with TestClient(TestServer(app)) as client:
+            for _ in range(20):
+                resp = await client.get("/view/r1")
+                assert resp.status == 200
+                resp = await client.get("/stream/r1")
+                await resp.read()
+                assert resp.status == 200
+
+        assert repo.calls == 1
@@ -0,0 +1,356 @@
+"""
+speculative_translation.py 단위 테스트
+안정 문장 판정, 추측 번역 시작/취소, 최종 transcript 와의 reconcile,
+websocket_handler 의 transcript_delta → transcript 재사용 경로 검증
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from speculative_translation import (
+    SpeculativeTranslator,
+    join_sentences,
+    stable_sentences,
+)
+
+
+def _fake_translate(calls):
+    async def _translate(sentence, src, dst):
+        calls.append(sentence)
+        await asyncio.sleep(0)
+        return f"<{sentence}>", True
+
+    return _translate
+
+
+class TestHelpers:
+    def test_last_sentence_is_never_stable(self):
+        assert stable_sentences("Hello there. How are", "en") == ["Hello there."]
+        assert stable_sentences("Hello there.", "en") == []
+
+    def test_join_respects_language_spacing(self):
+        assert join_sentences(["안녕하세요.", "반갑습니다."], "ko") == (
+            "안녕하세요. 반갑습니다."
+        )
+        assert join_sentences(["你好。", "谢谢。"], "zh") == "你好。谢谢。"
+
+
+class TestSpeculativeTranslator:
+    @pytest.mark.asyncio
+    async def test_starts_only_new_stable_sentences(self):
+        calls = []
+        spec = SpeculativeTranslator(_fake_translate(calls))
+
+        assert spec.on_delta("i1", "First one. Sec", "en", "ko") == 1
+        assert spec.on_delta("i1", "First one. Second one. Th", "en", "ko") == 1
+        assert spec.on_delta("i1", "First one. Second one. Thi", "en", "ko") == 0
+        await asyncio.sleep(0.01)
+
+        assert calls == ["First one.", "Second one."]
+        spec.close()
+
+    @pytest.mark.asyncio
+    async def test_reconcile_reuses_matching_prefix(self):
+        calls = []
+        spec = SpeculativeTranslator(_fake_translate(calls))
+        spec.on_delta("i1", "First one. Second one. Third", "en", "ko")
+
+        result = await spec.reconcile(
+            "i1", "First one. Second one. Third one.", "en", "ko"
+        )
+
+        assert result.translated == ["<First one.>", "<Second one.>"]
+        assert result.remainder == "Third one."
+        assert result.used_llm is True
+        assert spec.tracked_items() == 0
+
+    @pytest.mark.asyncio
+    async def test_reconcile_stops_at_first_mismatch(self):
+        calls = []
+        spec = SpeculativeTranslator(_fake_translate(calls))
+        spec.on_delta("i1", "First one. Second one. Third", "en", "ko")
+
+        result = await spec.reconcile(
+            "i1", "First one. Second two. Third one.", "en", "ko"
+        )
+
+        assert result.translated == ["<First one.>"]
+        assert result.remainder == "Second two. Third one."
+
+    @pytest.mark.asyncio
+    async def test_reconcile_without_speculation_returns_full_text(self):
+        spec = SpeculativeTranslator(_fake_translate([]))
+        result = await spec.reconcile("unknown", "Hello.", "en", "ko")
+        assert result.translated == []
+        assert result.remainder == "Hello."
+
+    @pytest.mark.asyncio
+    async def test_language_change_discards_speculation(self):
+        calls = []
+        spec = SpeculativeTranslator(_fake_translate(calls))
+        spec.on_delta("i1", "First one. Sec", "en", "ko")
+
+        result = await spec.reconcile("i1", "First one. Second.", "en", "zh")
+
+        assert result.translated == []
+        assert result.remainder == "First one. Second."
+
+    @pytest.mark.asyncio
+    async def test_failed_sentence_is_retranslated(self):
+        async def _translate(sentence, src, dst):
+            if sentence.startswith("Second"):
+                raise RuntimeError("bedrock down")
+            return f"<{sentence}>", False
+
+        spec = SpeculativeTranslator(_translate)
+        spec.on_delta("i1", "First one. Second one. Third", "en", "ko")
+
+        result = await spec.reconcile(
+            "i1", "First one. Second one. Third one.", "en", "ko"
+        )
+
+        assert result.translated == ["<First one.>"]
+        assert result.remainder == "Second one. Third one."
+
+    @pytest.mark.asyncio
+    async def test_corrected_transcript_restarts_changed_sentence(self):
+        calls = []
+        spec = SpeculativeTranslator(_fake_translate(calls))
+        spec.on_delta("i1", "Fist one. Sec", "en", "ko")
+        spec.on_delta("i1", "First one. Second", "en", "ko")
+
+        result = await spec.reconcile("i1", "First one. Second.", "en", "ko")
+
+        assert result.translated == ["<First one.>"]
+        assert "First one." in calls
+
+    @pytest.mark.asyncio
+    async def test_prefix_ready_announces_in_order(self):
+        release = {"First one.": asyncio.Event(), "Second one.": asyncio.Event()}
+        announced = []
+
+        async def _translate(sentence, src, dst):
+            await release[sentence].wait()
+            return sentence.upper(), True
+
+        async def _ready(item_id, text, lang):
+            announced.append(text)
+
+        spec = SpeculativeTranslator(_translate, _ready)
+        spec.on_delta("i1", "First one. Second one. Th", "en", "ko")
+
+        # 두 번째 문장이 먼저 끝나도 첫 문장 전에는 알리지 않는다.
+        release["Second one."].set()
+        await asyncio.sleep(0.01)
+        assert announced == []
+        release["First one."].set()
+        await asyncio.sleep(0.01)
+
+        assert announced == ["FIRST ONE. SECOND ONE."]
+        spec.close()
+
+    @pytest.mark.asyncio
+    async def test_tracked_items_are_bounded(self):
+        spec = SpeculativeTranslator(_fake_translate([]), max_items=2)
+        for i in range(4):
+            spec.on_delta(f"i{i}", "A. B", "en", "ko")
+        assert spec.tracked_items() == 2
+        spec.close()
+
+
+class TestHandleTranscriptReusesSpeculation:
+    @pytest.mark.asyncio
+    async def test_final_transcript_translates_only_remainder(self):
+        from websocket_handler import _handle_transcript, _handle_transcript_delta
+
+        calls = []
+        spec = SpeculativeTranslator(_fake_translate(calls))
+        settings = {"input_lang": "auto", "output_lang": "ko"}
+        user = {"id": 1, "username": "op", "room_id": None}
+        with patch("websocket_handler.check_usage_limit", return_value=True):
+            _handle_transcript_delta(
+                {"item_id": "i1", "text": "First one. Second one. Th"},
+                user,
+                settings,
+                spec,
+            )
+
+        ws = AsyncMock()
+        translate_client = MagicMock()
+        translate_client.translate_text.return_value = {"TranslatedText": "셋째."}
+        user_model = MagicMock()
+        user_model.get_remaining_seconds.return_value = 100
+
+        with (
+            patch("websocket_handler.check_usage_limit", return_value=True),
+            patch("websocket_handler._record_usage", return_value=(1.0, 100)),
+            patch("websocket_handler.get_user_model", return_value=user_model),
+        ):
+            await _handle_transcript(
+                ws,
+                {
+                    "item_id": "i1",
+                    "text": "First one. Second one. Third one.",
+                    "audio_duration_seconds": 1.0,
+                },
+                user,
+                translate_client,
+                None,
+                False,
+                language_settings=settings,
+                speculative=spec,
+            )
+
+        # AWS Translate 에는 남은 문장만 간다.
+        sent_text = translate_client.translate_text.call_args.kwargs["Text"]
+        assert sent_text == "Third one."
+        result = [
+            json.loads(c.args[0])
+            for c in ws.send.call_args_list
+            if json.loads(c.args[0]).get("type") == "transcription_result"
+        ][0]
+        assert result["translated_text"] == "<First one.> <Second one.> 셋째."
+        assert result["used_llm"] is True
+
+    def test_delta_without_item_id_is_ignored(self):
+        from websocket_handler import _handle_transcript_delta
+
+        spec = MagicMock()
+        _handle_transcript_delta({"text": "A. B"}, {"id": 1}, {}, spec)
+        spec.on_delta.assert_not_called()
+
+    def test_delta_over_quota_is_rejected(self):
+        from websocket_handler import _handle_transcript_delta
+
+        spec = MagicMock()
+        user = {"id": 1, "username": "op", "role": "user"}
+        with patch("websocket_handler.check_usage_limit", return_value=False):
+            _handle_transcript_delta(
+                {"item_id": "i1", "text": "First one. Second"}, user, {}, spec
+            )
+        spec.on_delta.assert_not_called()
+        spec.discard.assert_called_once_with("i1")
+
+    def test_delta_without_user_is_ignored(self):
+        from websocket_handler import _handle_transcript_delta
+
+        spec = MagicMock()
+        _handle_transcript_delta({"item_id": "i1", "text": "A. B"}, None, {}, spec)
+        spec.on_delta.assert_not_called()
+
+
+class TestSentencePipeline:
+    def test_short_text_is_not_pipelined(self):
+        from speculative_translation import pipeline_sentences
+
+        assert pipeline_sentences("One. Two.", "en") == []
+
+    def test_long_text_is_split(self):
+        from speculative_translation import pipeline_sentences
+
+        text = " ".join(f"This is sentence number {i}." for i in range(8))
+        assert len(pipeline_sentences(text, "en")) == 8
+
+    @pytest.mark.asyncio
+    async def test_results_are_emitted_in_source_order(self):
+        from speculative_translation import translate_sentences_pipelined
+
+        started = []
+        gates = {s: asyncio.Event() for s in ("A.", "B.", "C.")}
+
+        async def _translate(sentence, src, dst):
+            started.append(sentence)
+            await gates[sentence].wait()
+            return sentence.lower(), True
+
+        emitted = []
+
+        async def _on_prefix(text):
+            emitted.append(text)
+
+        run = asyncio.create_task(
+            translate_sentences_pipelined(
+                ["A.", "B.", "C."], "en", "ko", _translate, _on_prefix, prefix="p."
+            )
+        )
+        await asyncio.sleep(0.01)
+        # 모든 문장이 동시에 시작된다.
+        assert started == ["A.", "B.", "C."]
+
+        gates["C."].set()
+        gates["B."].set()
+        await asyncio.sleep(0.01)
+        assert emitted == []  # 첫 문장 전에는 아무것도 내보내지 않는다.
+
+        gates["A."].set()
+        result = await run
+
+        assert emitted == ["p. a.", "p. a. b.", "p. a. b. c."]
+        assert result.translated == ["a.", "b.", "c."]
+        assert result.remainder == ""
+
+    @pytest.mark.asyncio
+    async def test_failure_returns_remainder_and_cancels_rest(self):
+        from speculative_translation import translate_sentences_pipelined
+
+        cancelled = []
+
+        async def _translate(sentence, src, dst):
+            if sentence == "B.":
+                return None, False
+            if sentence == "C.":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(sentence)
+                    raise
+            return sentence.lower(), False
+
+        result = await translate_sentences_pipelined(
+            ["A.", "B.", "C."], "en", "ko", _translate
+        )
+
+        assert result.translated == ["a."]
+        assert result.remainder == "B. C."
+        await asyncio.sleep(0)
+        assert cancelled == ["C."]
+
+    @pytest.mark.asyncio
+    async def test_handle_transcript_pipelines_long_turns(self):
+        from websocket_handler import _handle_transcript
+
+        text = " ".join(f"This is sentence number {i}." for i in range(6))
+        ws = AsyncMock()
+        translate_client = MagicMock()
+        translate_client.translate_text.side_effect = lambda **kw: {
+            "TranslatedText": f"[{kw['Text']}]"
+        }
+        user_model = MagicMock()
+        user_model.get_remaining_seconds.return_value = 100
+
+        with (
+            patch("websocket_handler.check_usage_limit", return_value=True),
+            patch("websocket_handler._record_usage", return_value=(1.0, 100)),
+            patch("websocket_handler.get_user_model", return_value=user_model),
+        ):
+            await _handle_transcript(
+                ws,
+                {"text": text, "audio_duration_seconds": 10.0},
+                {"id": 1, "username": "op", "room_id": None},
+                translate_client,
+                None,
+                False,
+                language_settings={"input_lang": "en", "output_lang": "ko"},
+            )
+
+        # 문장마다 따로 번역된다.
+        assert translate_client.translate_text.call_count == 6
+        messages = [json.loads(c.args[0]) for c in ws.send.call_args_list]
+        partials = [m["text"] for m in messages if m["type"] == "translation_partial"]
+        assert len(partials) == 6
+        assert partials[0] == "[This is sentence number 0.]"
+        final = [m for m in messages if m["type"] == "transcription_result"][0]
+        assert final["translated_text"] == partials[-1]
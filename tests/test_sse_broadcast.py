@@ -21,9 +21,10 @@ import asyncio
 import json
 import sqlite3
 import sys
+import threading
 import time
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -115,8 +116,7 @@ class TestRoomsMigrationLangs:
         db_file = str(tmp_path / "legacy.db")
         # 손수 만든 레거시 rooms 스키마 (ISSUE-26 직후 상태) 시뮬레이션.
         conn = sqlite3.connect(db_file)
-        conn.execute(
-            """
+        conn.execute("""
             CREATE TABLE users (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 username TEXT UNIQUE NOT NULL,
@@ -128,10 +128,8 @@ class TestRoomsMigrationLangs:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 last_login TIMESTAMP
             )
-            """
-        )
-        conn.execute(
-            """
+            """)
+        conn.execute("""
             CREATE TABLE rooms (
                 id TEXT PRIMARY KEY,
                 name TEXT NOT NULL,
@@ -146,8 +144,7 @@ class TestRoomsMigrationLangs:
                 closed_at TIMESTAMP,
                 FOREIGN KEY (created_by) REFERENCES users(id)
             )
-            """
-        )
+            """)
         # 시드 데이터 — 이 row 가 마이그레이션 후에도 살아있어야 한다.
         conn.execute(
             "INSERT INTO users (username, password_hash) VALUES ('legacyadmin','x')"
@@ -604,111 +601,142 @@ class _StubRoomRepo:
 
 
 # ---------------------------------------------------------------------------
-# publish queue-saturation paths (lines 221-231)
+# Per-channel ring buffer + viewer cursors
 # ---------------------------------------------------------------------------
-class TestPublishSaturationPaths:
-    """publish 의 QueueFull 처리 분기 — 가장 오래된 메시지 제거 / 더블 saturation."""
+class TestRingBufferCursors:
+    """채널당 ring buffer 하나 — viewer 는 cursor 만 갖고, 뒤처지면 gap 을 받는다."""
 
     @pytest.mark.asyncio
-    async def test_publish_drops_oldest_when_queue_full_and_delivers_new(self):
-        """큐가 가득 차면 oldest 1건 삭제 후 새 payload 가 들어간다."""
+    async def test_slow_viewer_gets_explicit_gap(self):
         from sse_broadcast import BroadcastManager
 
-        # maxsize=1 으로 만들어서 두 번째 publish 가 saturation 분기를 타게 함.
-        mgr = BroadcastManager(queue_maxsize=1)
+        mgr = BroadcastManager(buffer_size=2)
         q = await mgr.register_viewer("r1", "ko")
 
-        first = {"text": "first", "lang": "ko", "timestamp": 1.0}
-        second = {"text": "second", "lang": "ko", "timestamp": 2.0}
-
-        await mgr.publish("r1", "ko", first)
-        # 두 번째 publish 는 큐 가득 → get_nowait 후 put.
-        await mgr.publish("r1", "ko", second)
+        for i in range(5):
+            await mgr.publish("r1", "ko", {"text": f"m{i}"})
 
-        # get_nowait 의 결과는 second (oldest 인 first 가 빠진 뒤 second 가 들어감).
-        got = q.get_nowait()
-        assert got == second
-        # 큐는 다시 비어 있어야 한다.
+        gap = q.get_nowait()
+        assert gap.data.startswith(b"event: gap\n")
+        assert gap["skipped"] == 3
+        assert [q.get_nowait()["text"] for _ in range(2)] == ["m3", "m4"]
         assert q.qsize() == 0
+        with pytest.raises(asyncio.QueueEmpty):
+            q.get_nowait()
 
         await mgr.unregister_viewer("r1", "ko", q)
 
     @pytest.mark.asyncio
-    async def test_publish_double_saturation_drops_message_and_logs(self, capsys):
-        """두 번째 put_nowait 도 QueueFull → 메시지 drop + 서버 로그."""
+    async def test_viewers_read_independently_from_one_buffer(self):
         from sse_broadcast import BroadcastManager
 
-        mgr = BroadcastManager(queue_maxsize=1)
-        q = await mgr.register_viewer("r1", "ko")
-        # 큐를 미리 채워둠.
-        q.put_nowait({"text": "preexisting"})
+        mgr = BroadcastManager(buffer_size=4)
+        fast = await mgr.register_viewer("r1", "ko")
+        slow = await mgr.register_viewer("r1", "ko")
+
+        await mgr.publish("r1", "ko", {"text": "a"})
+        assert fast.get_nowait()["text"] == "a"
+        await mgr.publish("r1", "ko", {"text": "b"})
 
-        # put_nowait 를 항상 QueueFull raise — 동시 producer 시뮬레이션.
-        original_put = q.put_nowait
+        assert fast.qsize() == 1
+        assert slow.qsize() == 2
+        assert slow.get_nowait()["text"] == "a"
+        assert slow.get_nowait() is fast.get_nowait()
 
-        def _always_full(_payload):
-            raise asyncio.QueueFull()
+        await mgr.unregister_viewer("r1", "ko", fast)
+        await mgr.unregister_viewer("r1", "ko", slow)
+
+    @pytest.mark.asyncio
+    async def test_new_viewer_starts_at_head(self):
+        from sse_broadcast import BroadcastManager
 
-        q.put_nowait = _always_full
-        # get_nowait 도 QueueEmpty 를 raise 하도록 만들어 swallow 분기를 친다.
-        original_get = q.get_nowait
+        mgr = BroadcastManager()
+        first = await mgr.register_viewer("r1", "ko")
+        await mgr.publish("r1", "ko", {"text": "old"})
+        late = await mgr.register_viewer("r1", "ko")
 
-        def _empty(_=None):
-            raise asyncio.QueueEmpty()
+        assert late.empty()
+        await mgr.publish("r1", "ko", {"text": "new"})
+        assert late.get_nowait()["text"] == "new"
 
-        q.get_nowait = _empty
+        await mgr.unregister_viewer("r1", "ko", first)
+        await mgr.unregister_viewer("r1", "ko", late)
 
-        try:
-            await mgr.publish("r1", "ko", {"text": "drop-me"})
-        finally:
-            q.put_nowait = original_put
-            q.get_nowait = original_get
+    @pytest.mark.asyncio
+    async def test_single_publish_wakes_all_waiters(self):
+        from sse_broadcast import BroadcastManager
 
-        captured = capsys.readouterr()
-        # drop 로그가 남아야 한다.
-        assert "[SSE] dropping payload" in captured.out
-        assert "viewer queue saturated" in captured.out
+        mgr = BroadcastManager()
+        cursors = [await mgr.register_viewer("r1", "ko") for _ in range(20)]
+        waiters = [asyncio.create_task(c.get()) for c in cursors]
+        await asyncio.sleep(0)
 
-        await mgr.unregister_viewer("r1", "ko", q)
+        await mgr.publish("r1", "ko", {"text": "hi"})
+        frames = await asyncio.wait_for(asyncio.gather(*waiters), timeout=1.0)
+
+        assert all(f is frames[0] for f in frames)
+        for c in cursors:
+            await mgr.unregister_viewer("r1", "ko", c)
 
     @pytest.mark.asyncio
-    async def test_publish_recovers_when_get_raises_queue_empty(self):
-        """QueueFull 직후 get_nowait 가 QueueEmpty (race) → swallow 후 retry put."""
+    async def test_publish_from_another_thread_wakes_viewer_promptly(self):
+        """WebSocket 서버 스레드의 publish 가 SSE 루프의 대기 viewer 를 바로 깨운다.
+
+        루프에 다른 타이머가 없어도 (heartbeat 등) selector 가 깨어나야 한다.
+        """
         from sse_broadcast import BroadcastManager
 
-        mgr = BroadcastManager(queue_maxsize=1)
-        q = await mgr.register_viewer("r1", "ko")
+        mgr = BroadcastManager()
+        cursor = await mgr.register_viewer("r1", "ko")
+        waiter = asyncio.create_task(cursor.get())
+        await asyncio.sleep(0)
+
+        publisher = threading.Thread(
+            target=lambda: asyncio.run(mgr.publish("r1", "ko", {"text": "hi"}))
+        )
+        started = time.monotonic()
+        publisher.start()
+        frame = await asyncio.wait_for(waiter, timeout=2.0)
+        elapsed = time.monotonic() - started
+        publisher.join()
 
-        # put_nowait 를 첫 호출에서만 QueueFull 을 raise, 그 다음엔 정상 동작.
-        original_put = q.put_nowait
-        call_count = {"n": 0}
-        captured_payloads = []
+        assert frame["text"] == "hi"
+        assert elapsed < 0.5
+        await mgr.unregister_viewer("r1", "ko", cursor)
 
-        def _put(payload):
-            call_count["n"] += 1
-            if call_count["n"] == 1:
-                raise asyncio.QueueFull()
-            captured_payloads.append(payload)
-            return original_put(payload)
+    @pytest.mark.asyncio
+    async def test_foreign_thread_publish_is_applied_on_owning_loop(self):
+        from sse_broadcast import BroadcastManager
 
-        # get_nowait 는 항상 QueueEmpty (race 시뮬레이션).
-        original_get = q.get_nowait
+        mgr = BroadcastManager()
+        cursor = await mgr.register_viewer("r1", "ko")
+        payload = {"text": "before"}
 
-        def _empty(_=None):
-            raise asyncio.QueueEmpty()
+        publisher = threading.Thread(
+            target=lambda: asyncio.run(mgr.publish("r1", "ko", payload))
+        )
+        publisher.start()
+        publisher.join()
+        # 예약만 됐다 — ring buffer 는 SSE 루프가 돌 때 갱신된다.
+        assert cursor.empty()
+        payload["text"] = "after"
 
-        q.put_nowait = _put
-        q.get_nowait = _empty
+        frame = await asyncio.wait_for(cursor.get(), timeout=1.0)
+        assert frame["text"] == "before"
+        await mgr.unregister_viewer("r1", "ko", cursor)
 
-        try:
-            await mgr.publish("r1", "ko", {"text": "racy"})
-        finally:
-            q.put_nowait = original_put
-            q.get_nowait = original_get
+    @pytest.mark.asyncio
+    async def test_buffer_memory_is_constant(self):
+        from sse_broadcast import BroadcastManager
 
-        # 두 번째 put 시도가 성공해 payload 가 들어갔어야 한다.
-        assert captured_payloads == [{"text": "racy"}]
+        mgr = BroadcastManager(buffer_size=8)
+        q = await mgr.register_viewer("r1", "ko")
+        for i in range(1000):
+            await mgr.publish("r1", "ko", {"text": str(i)})
 
+        channel = mgr._channels[("r1", "ko")]
+        assert len(channel._slots) == 8
+        assert channel.next_seq == 1000
         await mgr.unregister_viewer("r1", "ko", q)
 
 
@@ -1104,3 +1132,554 @@ class TestTranslateAndPublishSecondary:
 
         captured = capsys.readouterr()
         assert "[SSE] secondary publish failed" in captured.out
+
+
+# ---------------------------------------------------------------------------
+# Batched multi-target secondary translation
+# ---------------------------------------------------------------------------
+class TestBatchedSecondaryTranslation:
+    """추가 언어 viewer 가 여럿이면 멀티 타깃 번역 한 번으로 묶는다."""
+
+    @pytest.mark.asyncio
+    async def test_multiple_secondaries_use_single_batch_call(self):
+        from sse_broadcast import BroadcastManager, broadcast_translation_for_room
+
+        mgr = BroadcastManager()
+        await mgr.register_viewer("r1", "ko")
+        en_q = await mgr.register_viewer("r1", "en")
+        zh_q = await mgr.register_viewer("r1", "zh")
+
+        batch_calls: list[list[str]] = []
+        single_calls: list[str] = []
+
+        async def fake_multi(text, src, langs):
+            batch_calls.append(list(langs))
+            for lang in langs:
+                yield lang, f"[{lang}]{text}"
+
+        async def fake_translate(text, src, dst):
+            single_calls.append(dst)
+            return f"single-{dst}"
+
+        await broadcast_translation_for_room(
+            mgr,
+            {"id": "r1", "primary_output_lang": "ko"},
+            primary_translated="안녕",
+            source_text="hi",
+            source_lang="en",
+            translate_fn=fake_translate,
+            translate_multi_fn=fake_multi,
+        )
+
+        assert (await asyncio.wait_for(en_q.get(), timeout=1.0))["text"] == "[en]hi"
+        assert (await asyncio.wait_for(zh_q.get(), timeout=1.0))["text"] == "[zh]hi"
+        assert batch_calls == [["en", "zh"]]
+        assert single_calls == []
+
+    @pytest.mark.asyncio
+    async def test_single_secondary_skips_batch(self):
+        from sse_broadcast import BroadcastManager, broadcast_translation_for_room
+
+        mgr = BroadcastManager()
+        en_q = await mgr.register_viewer("r1", "en")
+
+        async def fake_multi(text, src, langs):  # pragma: no cover — must not run
+            raise AssertionError("batch should not be used for one language")
+            yield
+
+        async def fake_translate(text, src, dst):
+            return f"single-{dst}"
+
+        await broadcast_translation_for_room(
+            mgr,
+            {"id": "r1", "primary_output_lang": "ko"},
+            primary_translated="안녕",
+            source_text="hi",
+            source_lang="en",
+            translate_fn=fake_translate,
+            translate_multi_fn=fake_multi,
+        )
+
+        msg = await asyncio.wait_for(en_q.get(), timeout=1.0)
+        assert msg["text"] == "single-en"
+
+    @pytest.mark.asyncio
+    async def test_missing_and_failed_languages_fall_back_individually(self):
+        from sse_broadcast import BroadcastManager, broadcast_translation_for_room
+
+        mgr = BroadcastManager()
+        en_q = await mgr.register_viewer("r1", "en")
+        zh_q = await mgr.register_viewer("r1", "zh")
+        vi_q = await mgr.register_viewer("r1", "vi")
+
+        fallback_calls: list[str] = []
+
+        async def flaky_multi(text, src, langs):
+            yield "en", "batch-en"
+            raise RuntimeError("stream broke")
+
+        async def fake_translate(text, src, dst):
+            fallback_calls.append(dst)
+            return f"single-{dst}"
+
+        await broadcast_translation_for_room(
+            mgr,
+            {"id": "r1", "primary_output_lang": "ko"},
+            primary_translated="안녕",
+            source_text="hi",
+            source_lang="en",
+            translate_fn=fake_translate,
+            translate_multi_fn=flaky_multi,
+        )
+
+        assert (await asyncio.wait_for(en_q.get(), timeout=1.0))["text"] == "batch-en"
+        assert (await asyncio.wait_for(zh_q.get(), timeout=1.0))["text"] == "single-zh"
+        assert (await asyncio.wait_for(vi_q.get(), timeout=1.0))["text"] == "single-vi"
+        assert sorted(fallback_calls) == ["vi", "zh"]
+
+
+# ---------------------------------------------------------------------------
+# Pre-encoded SSE frame fan-out
+# ---------------------------------------------------------------------------
+class TestPreEncodedFrames:
+    """publish 는 (room, lang) 메시지당 한 번만 인코딩해 같은 bytes 를 공유한다."""
+
+    def test_sse_frame_encodes_event_and_json(self):
+        from sse_broadcast import SseFrame
+
+        frame = SseFrame({"text": "안녕", "lang": "ko"})
+        assert frame.data == (
+            'event: message\ndata: {"text":"안녕","lang":"ko"}\n\n'.encode()
+        )
+        assert frame["text"] == "안녕"
+        assert dict(frame) == {"text": "안녕", "lang": "ko"}
+
+    def test_sse_frame_snapshots_payload(self):
+        from sse_broadcast import SseFrame
+
+        payload = {"text": "a"}
+        frame = SseFrame(payload)
+        payload["text"] = "b"
+        assert frame["text"] == "a"
+        assert b'"a"' in frame.data
+
+    @pytest.mark.asyncio
+    async def test_publish_encodes_once_for_all_viewers(self, monkeypatch):
+        import fastpath
+        from sse_broadcast import BroadcastManager
+
+        mgr = BroadcastManager()
+        queues = [await mgr.register_viewer("r1", "ko") for _ in range(50)]
+
+        dumps_calls = []
+        real_dumps = fastpath.dumps_bytes
+
+        def _counting_dumps(*args, **kwargs):
+            dumps_calls.append(args)
+            return real_dumps(*args, **kwargs)
+
+        monkeypatch.setattr(fastpath, "dumps_bytes", _counting_dumps)
+        await mgr.publish("r1", "ko", {"text": "hi"})
+
+        frames = [q.get_nowait() for q in queues]
+        assert len(dumps_calls) == 1
+        assert all(f is frames[0] for f in frames)
+        assert all(f.data is frames[0].data for f in frames)
+
+
+# ---------------------------------------------------------------------------
+# Last-Event-ID resume / replay
+# ---------------------------------------------------------------------------
+class TestLastEventIdResume:
+    """시퀀스 id 가 붙은 프레임과 Last-Event-ID 재접속 시 replay."""
+
+    @staticmethod
+    def _event_id(frame) -> str:
+        first_line = frame.data.split(b"\n", 1)[0].decode()
+        assert first_line.startswith("id: ")
+        return first_line[len("id: ") :]
+
+    @pytest.mark.asyncio
+    async def test_published_frames_carry_sequence_ids(self):
+        from sse_broadcast import BroadcastManager
+
+        mgr = BroadcastManager()
+        q = await mgr.register_viewer("r1", "ko")
+        await mgr.publish("r1", "ko", {"text": "a"})
+        await mgr.publish("r1", "ko", {"text": "b"})
+
+        ids = [self._event_id(q.get_nowait()) for _ in range(2)]
+        epoch = ids[0].split("-")[0]
+        assert ids == [f"{epoch}-0", f"{epoch}-1"]
+        await mgr.unregister_viewer("r1", "ko", q)
+
+    @pytest.mark.asyncio
+    async def test_reconnect_replays_missed_frames(self):
+        from sse_broadcast import BroadcastManager
+
+        mgr = BroadcastManager()
+        q = await mgr.register_viewer("r1", "ko")
+        await mgr.publish("r1", "ko", {"text": "seen"})
+        last_id = self._event_id(q.get_nowait())
+        await mgr.unregister_viewer("r1", "ko", q)
+
+        # 끊긴 동안 publish — 채널은 retention 동안 유지되며 계속 버퍼링한다.
+        assert mgr.has_viewers("r1", "ko") is False
+        await mgr.publish("r1", "ko", {"text": "missed-1"})
+        await mgr.publish("r1", "ko", {"text": "missed-2"})
+
+        resumed = await mgr.register_viewer("r1", "ko", last_id)
+        assert resumed.resumed is True
+        assert [resumed.get_nowait()["text"] for _ in range(2)] == [
+            "missed-1",
+            "missed-2",
+        ]
+        await mgr.unregister_viewer("r1", "ko", resumed)
+
+    @pytest.mark.asyncio
+    async def test_gap_larger_than_buffer_reports_skipped(self):
+        from sse_broadcast import BroadcastManager
+
+        mgr = BroadcastManager(buffer_size=2)
+        q = await mgr.register_viewer("r1", "ko")
+        await mgr.publish("r1", "ko", {"text": "seen"})
+        last_id = self._event_id(q.get_nowait())
+        await mgr.unregister_viewer("r1", "ko", q)
+        for i in range(4):
+            await mgr.publish("r1", "ko", {"text": f"m{i}"})
+
+        resumed = await mgr.register_viewer("r1", "ko", last_id)
+        assert resumed.get_nowait()["skipped"] == 2
+        assert resumed.get_nowait()["text"] == "m2"
+        await mgr.unregister_viewer("r1", "ko", resumed)
+
+    @pytest.mark.asyncio
+    async def test_foreign_or_malformed_id_starts_at_head(self):
+        from sse_broadcast import BroadcastManager
+
+        mgr = BroadcastManager()
+        q = await mgr.register_viewer("r1", "ko")
+        await mgr.publish("r1", "ko", {"text": "old"})
+
+        for bogus in ("deadbeef-0", "garbage", "-1"):
+            cursor = await mgr.register_viewer("r1", "ko", bogus)
+            assert cursor.resumed is False
+            assert cursor.empty()
+            await mgr.unregister_viewer("r1", "ko", cursor)
+        await mgr.unregister_viewer("r1", "ko", q)
+
+    @pytest.mark.asyncio
+    async def test_retained_channel_expires(self):
+        from sse_broadcast import BroadcastManager
+
+        mgr = BroadcastManager(retention_seconds=0.01)
+        q = await mgr.register_viewer("r1", "ko")
+        await mgr.unregister_viewer("r1", "ko", q)
+        assert ("r1", "ko") in mgr._channels
+
+        await asyncio.sleep(0.05)
+        assert ("r1", "ko") not in mgr._channels
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_metrics_db_write(self):
+        from sse_broadcast import BroadcastManager
+
+        repo = MagicMock()
+        mgr = BroadcastManager(metrics_repo=repo)
+        q = await mgr.register_viewer("r1", "ko")
+        await mgr.publish("r1", "ko", {"text": "a"})
+        last_id = self._event_id(q.get_nowait())
+        await mgr.unregister_viewer("r1", "ko", q)
+
+        resumed = await mgr.register_viewer("r1", "ko", last_id)
+
+        assert repo.update_viewer_metrics.call_count == 1
+        assert mgr.get_metrics("r1")["current"] == 1
+        await mgr.unregister_viewer("r1", "ko", resumed)
+
+    @pytest.mark.asyncio
+    async def test_stream_endpoint_resumes_from_last_event_id(self, db_manager):
+        from aiohttp.test_utils import TestClient, TestServer
+
+        from sse_broadcast import BroadcastManager, build_sse_app
+
+        room = {"id": "r1", "status": "active", "primary_output_lang": "ko"}
+        repo = MagicMock()
+        repo.get_by_id.return_value = room
+        mgr = BroadcastManager()
+        app = build_sse_app(broadcast_manager=mgr, room_repo=repo)
+
+        # 첫 viewer 가 채널을 만든 뒤 id 를 얻는다.
+        first = await mgr.register_viewer("r1", "ko")
+        await mgr.publish("r1", "ko", {"text": "seen"})
+        last_id = self._event_id(first.get_nowait())
+        await mgr.publish("r1", "ko", {"text": "missed"})
+
+        async with TestClient(TestServer(app)) as client:
+            # 일반 연결은 항상 repo 를 조회하고 캐시를 채운다.
+            fresh = await client.get("/stream/r1?lang=ko")
+            fresh.close()
+            assert repo.get_by_id.call_count == 1
+
+            resp = await client.get(
+                "/stream/r1?lang=ko", headers={"Last-Event-ID": last_id}
+            )
+            buf = b""
+            deadline = asyncio.get_event_loop().time() + 1.5
+            while b"missed" not in buf and asyncio.get_event_loop().time() < deadline:
+                chunk = await asyncio.wait_for(resp.content.read(256), timeout=0.5)
+                if not chunk:
+                    break
+                buf += chunk
+            resp.close()
+
+        epoch = last_id.split("-")[0]
+        assert f"id: {epoch}-1\nevent: message\n".encode() in buf
+        assert b"missed" in buf
+        # 재접속은 캐시된 룸 정보를 재사용한다 (SQLite 조회 없음).
+        assert repo.get_by_id.call_count == 1
+        await mgr.unregister_viewer("r1", "ko", first)
+
+
+# ---------------------------------------------------------------------------
+# Event-driven disconnect + loop-wide heartbeat
+# ---------------------------------------------------------------------------
+class TestEventDrivenDisconnect:
+    """viewer 당 polling / timeout task 없이 끊김 감지와 keep-alive 가 동작한다."""
+
+    _ROOM = {"id": "r1", "status": "active", "primary_output_lang": "ko"}
+
+    async def _wait_until(self, predicate, timeout=1.0):
+        deadline = asyncio.get_event_loop().time() + timeout
+        while not predicate() and asyncio.get_event_loop().time() < deadline:
+            await asyncio.sleep(0.01)
+        return predicate()
+
+    @pytest.mark.asyncio
+    async def test_client_close_unregisters_viewer_promptly(self):
+        from aiohttp.test_utils import TestClient, TestServer
+
+        from sse_broadcast import BroadcastManager, build_sse_app
+
+        mgr = BroadcastManager()
+        # heartbeat 이 끊김을 잡는 게 아님을 보이려 간격을 길게 둔다.
+        app = build_sse_app(
+            broadcast_manager=mgr,
+            room_repo=_StubRoomRepo({"r1": self._ROOM}),
+            heartbeat_interval=60,
+        )
+        async with TestClient(TestServer(app)) as client:
+            resp = await client.get("/stream/r1?lang=ko")
+            assert await self._wait_until(lambda: mgr.has_viewers("r1", "ko"))
+            assert len(app["heartbeat"]) == 1
+
+            resp.close()
+
+            assert await self._wait_until(
+                lambda: mgr.get_metrics("r1")["current"] == 0, timeout=0.5
+            )
+            assert len(app["heartbeat"]) == 0
+
+    @pytest.mark.asyncio
+    async def test_streaming_creates_no_per_message_tasks(self):
+        from aiohttp.test_utils import TestClient, TestServer
+
+        from sse_broadcast import BroadcastManager, build_sse_app
+
+        mgr = BroadcastManager()
+        app = build_sse_app(
+            broadcast_manager=mgr,
+            room_repo=_StubRoomRepo({"r1": self._ROOM}),
+            heartbeat_interval=60,
+        )
+        async with TestClient(TestServer(app)) as client:
+            resp = await client.get("/stream/r1?lang=ko")
+            await resp.content.readuntil(b"\n\n")  # ": connected"
+            assert await self._wait_until(lambda: mgr.has_viewers("r1", "ko"))
+            tasks_before = len(asyncio.all_tasks())
+
+            for i in range(3):
+                await mgr.publish("r1", "ko", {"text": f"m{i}"})
+                frame = await asyncio.wait_for(resp.content.readuntil(b"\n\n"), 1)
+                assert f"m{i}".encode() in frame
+
+            assert len(asyncio.all_tasks()) == tasks_before
+            resp.close()
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_pings_idle_connection(self):
+        from aiohttp.test_utils import TestClient, TestServer
+
+        from sse_broadcast import BroadcastManager, build_sse_app
+
+        mgr = BroadcastManager()
+        app = build_sse_app(
+            broadcast_manager=mgr,
+            room_repo=_StubRoomRepo({"r1": self._ROOM}),
+            heartbeat_interval=0.05,
+        )
+        async with TestClient(TestServer(app)) as client:
+            resp = await client.get("/stream/r1?lang=ko")
+            assert await resp.content.readuntil(b"\n\n") == b": connected\n\n"
+            ping = await asyncio.wait_for(resp.content.readuntil(b"\n\n"), 1)
+            assert ping == b": ping\n\n"
+            resp.close()
+
+    @pytest.mark.asyncio
+    async def test_wheel_drops_dead_connections_and_stops(self):
+        from sse_broadcast import _HeartbeatWheel
+
+        dead = MagicMock()
+        dead.write = AsyncMock(side_effect=ConnectionResetError("gone"))
+        transport = MagicMock()
+        transport.get_write_buffer_size.return_value = 0
+
+        wheel = _HeartbeatWheel(interval=0.01)
+        wheel.add(dead, transport)
+        task = wheel._task
+
+        await asyncio.wait_for(task, 1)  # 연결이 없어지면 task 도 끝난다.
+        assert len(wheel) == 0
+        dead.write.assert_awaited_once_with(b": ping\n\n")
+
+    @pytest.mark.asyncio
+    async def test_wheel_skips_connection_with_pending_writes(self):
+        from sse_broadcast import _HeartbeatWheel
+
+        busy = MagicMock()
+        busy.write = AsyncMock()
+        transport = MagicMock()
+        transport.get_write_buffer_size.return_value = 4096
+
+        wheel = _HeartbeatWheel(interval=0.02, slots=2)
+        wheel.add(busy, transport)
+        await asyncio.sleep(0.1)
+
+        busy.write.assert_not_awaited()
+        await wheel.stop()
+
+
+class TestSharedHeartbeat:
+    """슬롯 분산 ping, 최근 데이터 수신 연결 skip, 공유 ping 프레임."""
+
+    def _conn(self):
+        resp = MagicMock()
+        resp.write = AsyncMock()
+        transport = MagicMock()
+        transport.get_write_buffer_size.return_value = 0
+        return resp, transport
+
+    @pytest.mark.asyncio
+    async def test_connections_are_staggered_across_slots(self):
+        from sse_broadcast import _PING_FRAME, _HeartbeatWheel
+
+        wheel = _HeartbeatWheel(interval=0.1, slots=4)
+        conns = [self._conn() for _ in range(8)]
+        for resp, transport in conns:
+            wheel.add(resp, transport)
+        await wheel.stop()  # tick 을 직접 돌린다.
+        await asyncio.sleep(0.06)  # 모두 반 interval 이상 유휴.
+
+        await wheel._tick()
+
+        pinged = [resp for resp, _ in conns if resp.write.await_count]
+        # 한 tick 은 한 슬롯(8 / 4 = 2 연결)만 ping 한다.
+        assert pinged == [conns[0][0], conns[4][0]]
+        pinged[0].write.assert_awaited_once_with(_PING_FRAME)
+
+        for _ in range(3):
+            await wheel._tick()
+        assert all(resp.write.await_count == 1 for resp, _ in conns)
+
+    @pytest.mark.asyncio
+    async def test_recently_written_connection_is_not_pinged(self):
+        from sse_broadcast import _HeartbeatWheel
+
+        resp, transport = self._conn()
+        wheel = _HeartbeatWheel(interval=0.1, slots=2)
+        wheel.add(resp, transport)
+
+        # 자막이 계속 흐르는 동안에는 ping 하지 않는다.
+        for _ in range(15):
+            await asyncio.sleep(0.02)
+            wheel.touch(resp)
+        resp.write.assert_not_awaited()
+
+        # 조용해지면 늦어도 1.5 interval 안에 ping 한다.
+        await asyncio.sleep(0.2)
+        resp.write.assert_awaited()
+        await wheel.stop()
+
+    @pytest.mark.asyncio
+    async def test_stream_writes_touch_the_heartbeat(self):
+        from aiohttp.test_utils import TestClient, TestServer
+
+        from sse_broadcast import BroadcastManager, build_sse_app
+
+        mgr = BroadcastManager()
+        app = build_sse_app(
+            broadcast_manager=mgr,
+            room_repo=_StubRoomRepo(
+                {"r1": {"id": "r1", "status": "active", "primary_output_lang": "ko"}}
+            ),
+            heartbeat_interval=0.2,
+        )
+        async with TestClient(TestServer(app)) as client:
+            resp = await client.get("/stream/r1?lang=ko")
+            await resp.content.readuntil(b"\n\n")  # ": connected"
+            received = []
+            for i in range(12):
+                await mgr.publish("r1", "ko", {"text": f"m{i}"})
+                received.append(
+                    await asyncio.wait_for(resp.content.readuntil(b"\n\n"), 1)
+                )
+                await asyncio.sleep(0.03)
+            resp.close()
+
+        assert not any(chunk.startswith(b": ping") for chunk in received)
+
+    @pytest.mark.asyncio
+    async def test_cross_thread_delivery_does_not_wait_for_heartbeat(self, monkeypatch):
+        """자막 지연은 keep-alive 주기와 무관하다 — heartbeat tick 없이 전달된다."""
+        from aiohttp.test_utils import TestClient, TestServer
+
+        from sse_broadcast import BroadcastManager, _HeartbeatWheel, build_sse_app
+
+        ticks = []
+        real_tick = _HeartbeatWheel._tick
+
+        async def _counting_tick(wheel):
+            ticks.append(time.monotonic())
+            await real_tick(wheel)
+
+        monkeypatch.setattr(_HeartbeatWheel, "_tick", _counting_tick)
+
+        mgr = BroadcastManager()
+        app = build_sse_app(
+            broadcast_manager=mgr,
+            room_repo=_StubRoomRepo(
+                {"r1": {"id": "r1", "status": "active", "primary_output_lang": "ko"}}
+            ),
+            heartbeat_interval=3600,
+        )
+        async with TestClient(TestServer(app)) as client:
+            resp = await client.get("/stream/r1?lang=ko")
+            await resp.content.readuntil(b"\n\n")  # ": connected"
+            for i in range(5):
+                # WebSocket 서버 스레드(app.py daemon-thread 모드)에서 publish.
+                publisher = threading.Thread(
+                    target=lambda i=i: asyncio.run(
+                        mgr.publish("r1", "ko", {"text": f"m{i}"})
+                    )
+                )
+                started = time.monotonic()
+                publisher.start()
+                frame = await asyncio.wait_for(resp.content.readuntil(b"\n\n"), 2)
+                elapsed = time.monotonic() - started
+                publisher.join()
+
+                assert f"m{i}".encode() in frame
+                assert elapsed < 0.5
+            resp.close()
+
+        assert ticks == []
@@ -0,0 +1,228 @@
+"""
+번역 결과 캐시 단위 테스트
+TranslationCache LRU/TTL 동작과 translate_with_llm / translate_with_llm_stream /
+_translate_text 의 캐시 hit 시 네트워크 호출 생략 검증, 그리고 룸 번역 문맥
+(TranslationContext) 의 window/토큰 예산과 프롬프트 주입 검증
+"""
+
+import json
+import sys
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+if "streamlit" not in sys.modules:
+    sys.modules["streamlit"] = MagicMock()
+if "extra_streamlit_components" not in sys.modules:
+    sys.modules["extra_streamlit_components"] = MagicMock()
+
+from translation import (  # noqa: E402
+    LLM_CACHE_MODEL,
+    TranslationCache,
+    TranslationContext,
+    _build_translation_prompt,
+    get_translation_cache,
+    translate_with_llm,
+    translate_with_llm_stream,
+)
+
+
+def _bedrock_client(text="안녕하세요"):
+    client = MagicMock()
+    body = json.dumps({"content": [{"text": text}]}).encode()
+    client.invoke_model.side_effect = lambda **kw: {"body": BytesIO(body)}
+    return client
+
+
+class TestTranslationCache:
+    def test_hit_after_put(self):
+        cache = TranslationCache(max_entries=4, ttl_seconds=60)
+        cache.put("Thank you", "en", "ko", "m", "감사합니다")
+        assert cache.get("Thank you", "en", "ko", "m") == "감사합니다"
+        assert cache.stats()["hits"] == 1
+
+    def test_key_includes_langs_and_model(self):
+        cache = TranslationCache(max_entries=4, ttl_seconds=60)
+        cache.put("Thank you", "en", "ko", "m", "감사합니다")
+        assert cache.get("Thank you", "en", "zh", "m") is None
+        assert cache.get("Thank you", "en", "ko", "other") is None
+        assert cache.stats()["misses"] == 2
+
+    def test_whitespace_is_normalized(self):
+        cache = TranslationCache(max_entries=4, ttl_seconds=60)
+        cache.put("  Next   slide ", "en", "ko", "m", "다음 슬라이드")
+        assert cache.get("Next slide", "en", "ko", "m") == "다음 슬라이드"
+
+    def test_lru_eviction(self):
+        cache = TranslationCache(max_entries=2, ttl_seconds=60)
+        cache.put("a", "en", "ko", "m", "A")
+        cache.put("b", "en", "ko", "m", "B")
+        cache.get("a", "en", "ko", "m")  # a 를 최근 사용으로 올림
+        cache.put("c", "en", "ko", "m", "C")
+
+        assert cache.get("b", "en", "ko", "m") is None
+        assert cache.get("a", "en", "ko", "m") == "A"
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["size"] == 2
+
+    def test_ttl_expiry(self):
+        cache = TranslationCache(max_entries=4, ttl_seconds=10)
+        with patch("translation.time.monotonic", return_value=100.0):
+            cache.put("hi", "en", "ko", "m", "안녕")
+        with patch("translation.time.monotonic", return_value=111.0):
+            assert cache.get("hi", "en", "ko", "m") is None
+        assert cache.stats()["size"] == 0
+
+    def test_empty_results_not_cached(self):
+        cache = TranslationCache(max_entries=4, ttl_seconds=60)
+        cache.put("hi", "en", "ko", "m", None)
+        cache.put("hi", "en", "ko", "m", "")
+        assert cache.stats()["size"] == 0
+
+    def test_zero_size_disables_cache(self):
+        cache = TranslationCache(max_entries=0, ttl_seconds=60)
+        cache.put("hi", "en", "ko", "m", "안녕")
+        assert cache.get("hi", "en", "ko", "m") is None
+
+
+class TestTranslatorsUseCache:
+    def test_translate_with_llm_skips_bedrock_on_hit(self):
+        client = _bedrock_client()
+        first = translate_with_llm(client, "Hello", "en", "ko")
+        second = translate_with_llm(client, "Hello", "en", "ko")
+
+        assert first == second == "안녕하세요"
+        assert client.invoke_model.call_count == 1
+
+    def test_failed_translation_is_not_cached(self):
+        client = MagicMock()
+        client.invoke_model.side_effect = Exception("down")
+        assert translate_with_llm(client, "Hello", "en", "ko") is None
+        assert get_translation_cache().stats()["size"] == 0
+
+    def test_stream_hit_yields_final_only(self):
+        get_translation_cache().put("Hello", "en", "ko", LLM_CACHE_MODEL, "안녕하세요")
+        client = MagicMock()
+
+        chunks = list(translate_with_llm_stream(client, "Hello", "en", "ko"))
+
+        assert chunks == [("안녕하세요", True)]
+        client.invoke_model_with_response_stream.assert_not_called()
+
+    def test_stream_result_populates_cache(self):
+        delta = {"type": "content_block_delta", "delta": {"text": "안녕"}}
+        client = MagicMock()
+        client.invoke_model_with_response_stream.return_value = {
+            "body": [{"chunk": {"bytes": json.dumps(delta).encode()}}]
+        }
+
+        list(translate_with_llm_stream(client, "Hi", "en", "ko"))
+
+        assert get_translation_cache().get("Hi", "en", "ko", LLM_CACHE_MODEL) == "안녕"
+
+    def test_aws_translate_result_is_cached(self):
+        from websocket_handler import _translate_text
+
+        translate_client = MagicMock()
+        translate_client.translate_text.return_value = {"TranslatedText": "감사합니다"}
+
+        for _ in range(2):
+            text, used_llm = _translate_text(
+                "Thank you", "en", "ko", translate_client, None, False
+            )
+            assert text == "감사합니다"
+            assert used_llm is False
+
+        assert translate_client.translate_text.call_count == 1
+
+
+class TestTranslationContext:
+    def test_recent_keeps_last_pairs_in_order(self):
+        ctx = TranslationContext(max_pairs=2, token_budget=1000)
+        ctx.add("one", "하나", "en", "ko")
+        ctx.add("two", "둘", "en", "ko")
+        ctx.add("three", "셋", "en", "ko")
+        assert ctx.recent("en", "ko") == [("two", "둘"), ("three", "셋")]
+        assert len(ctx) == 2
+
+    def test_recent_filters_language_pair(self):
+        ctx = TranslationContext(max_pairs=4, token_budget=1000)
+        ctx.add("Hello", "안녕하세요", "en", "ko")
+        ctx.add("你好", "안녕하세요", "zh", "ko")
+        assert ctx.recent("zh", "ko") == [("你好", "안녕하세요")]
+        assert ctx.recent("en", "zh") == []
+
+    def test_token_budget_drops_oldest_first(self):
+        ctx = TranslationContext(max_pairs=8, token_budget=30)
+        ctx.add("old " * 20, "오래된 문장", "en", "ko")
+        ctx.add("Next slide", "다음 슬라이드", "en", "ko")
+        assert ctx.recent("en", "ko") == [("Next slide", "다음 슬라이드")]
+
+    def test_empty_results_are_ignored(self):
+        ctx = TranslationContext(max_pairs=2, token_budget=100)
+        ctx.add("Hello", None, "en", "ko")
+        ctx.add("", "안녕", "en", "ko")
+        assert len(ctx) == 0
+
+    def test_prompt_includes_context_only_when_present(self):
+        ctx = TranslationContext(max_pairs=2, token_budget=1000)
+        bare = _build_translation_prompt("Deploy it", "en", "ko", ctx)
+        ctx.add("We use Lambda", "저희는 Lambda 를 씁니다", "en", "ko")
+        with_context = _build_translation_prompt("Deploy it", "en", "ko", ctx)
+
+        assert bare == _build_translation_prompt("Deploy it", "en", "ko")
+        system, user_text = with_context
+        # 정적 블록은 그대로, 문맥은 뒤따르는 별도 블록.
+        assert system[0] == bare[0][0] and len(bare[0]) == 1
+        assert '"We use Lambda" → "저희는 Lambda 를 씁니다"' in system[1]
+        assert user_text == bare[1] == '원문: "Deploy it"'
+
+    def test_translate_with_llm_sends_room_context(self):
+        client = _bedrock_client()
+        ctx = TranslationContext(max_pairs=2, token_budget=1000)
+        ctx.add("Our service is Bedrock", "우리 서비스는 Bedrock 입니다", "en", "ko")
+
+        translate_with_llm(client, "It streams tokens", "en", "ko", context=ctx)
+
+        body = json.loads(client.invoke_model.call_args.kwargs["body"])
+        prompt = "\n".join(block["text"] for block in body["system"])
+        assert "Our service is Bedrock" in prompt
+
+    def test_contextual_translations_bypass_cache(self):
+        """문맥이 다른 두 룸은 같은 원문이라도 각자의 번역을 받는다."""
+        client = MagicMock()
+        outputs = iter(["배포하세요 (A)", "배포하세요 (B)"])
+        client.invoke_model.side_effect = lambda **kw: {
+            "body": BytesIO(json.dumps({"content": [{"text": next(outputs)}]}).encode())
+        }
+        room_a = TranslationContext(max_pairs=2, token_budget=1000)
+        room_a.add("We use Lambda", "저희는 Lambda 를 씁니다", "en", "ko")
+        room_b = TranslationContext(max_pairs=2, token_budget=1000)
+        room_b.add("We ship firmware", "펌웨어를 배포합니다", "en", "ko")
+
+        first = translate_with_llm(client, "Deploy it", "en", "ko", context=room_a)
+        second = translate_with_llm(client, "Deploy it", "en", "ko", context=room_b)
+
+        assert (first, second) == ("배포하세요 (A)", "배포하세요 (B)")
+        assert client.invoke_model.call_count == 2
+        body = json.loads(client.invoke_model.call_args.kwargs["body"])
+        assert "We ship firmware" in "\n".join(b["text"] for b in body["system"])
+        # 문맥 번역은 문맥 없는 요청의 캐시에도 들어가지 않는다.
+        assert (
+            get_translation_cache().get("Deploy it", "en", "ko", LLM_CACHE_MODEL)
+            is None
+        )
+
+    def test_stream_with_context_ignores_cached_result(self):
+        get_translation_cache().put("Deploy it", "en", "ko", LLM_CACHE_MODEL, "캐시")
+        ctx = TranslationContext(max_pairs=2, token_budget=1000)
+        ctx.add("We use Lambda", "저희는 Lambda 를 씁니다", "en", "ko")
+        client = MagicMock()
+        delta = {"type": "content_block_delta", "delta": {"text": "배포하세요"}}
+        client.invoke_model_with_response_stream.return_value = {
+            "body": [{"chunk": {"bytes": json.dumps(delta).encode()}}]
+        }
+
+        final = list(translate_with_llm_stream(client, "Deploy it", "en", "ko", ctx))
+
+        assert final[-1] == ("배포하세요", True)
+        client.invoke_model_with_response_stream.assert_called_once()
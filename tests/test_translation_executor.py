@@ -0,0 +1,134 @@
+"""
+translation_executor.py 단위 테스트
+FairTranslationExecutor 의 우선순위 / 룸 round-robin / 지표 / 취소 검증
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from translation_executor import (
+    PRIORITY_PRIMARY,
+    PRIORITY_SECONDARY,
+    FairTranslationExecutor,
+)
+
+
+def _blocked_executor():
+    """워커 1개짜리 executor 와, 그 워커를 붙잡아 두는 gate 를 만든다."""
+    executor = FairTranslationExecutor(max_workers=1)
+    gate = threading.Event()
+    started = threading.Event()
+
+    def _block():
+        started.set()
+        gate.wait(5)
+
+    executor.submit("busy", _block)
+    assert started.wait(5)
+    return executor, gate
+
+
+class TestScheduling:
+    def test_primary_runs_before_secondary(self):
+        executor, gate = _blocked_executor()
+        order = []
+        futures = [
+            executor.submit("r1", order.append, "s1", priority=PRIORITY_SECONDARY),
+            executor.submit("r1", order.append, "p1", priority=PRIORITY_PRIMARY),
+            executor.submit("r2", order.append, "s2", priority=PRIORITY_SECONDARY),
+            executor.submit("r2", order.append, "p2", priority=PRIORITY_PRIMARY),
+        ]
+        gate.set()
+        for f in futures:
+            f.result(5)
+        executor.shutdown()
+
+        assert order == ["p1", "p2", "s1", "s2"]
+
+    def test_rooms_are_served_round_robin(self):
+        executor, gate = _blocked_executor()
+        order = []
+        futures = [executor.submit("chatty", order.append, f"c{i}") for i in range(3)]
+        futures.append(executor.submit("quiet", order.append, "q0"))
+        gate.set()
+        for f in futures:
+            f.result(5)
+        executor.shutdown()
+
+        # 말 많은 룸이 먼저 3건을 넣었어도 조용한 룸은 두 번째 차례에 처리된다.
+        assert order == ["c0", "q0", "c1", "c2"]
+
+    def test_unknown_priority_rejected(self):
+        executor = FairTranslationExecutor(max_workers=1)
+        with pytest.raises(ValueError):
+            executor.submit("r1", print, priority=99)
+
+    def test_submit_after_shutdown_rejected(self):
+        executor = FairTranslationExecutor(max_workers=1)
+        executor.shutdown()
+        with pytest.raises(RuntimeError):
+            executor.submit("r1", print)
+
+
+class TestResultsAndStats:
+    def test_exception_propagates_to_future(self):
+        executor = FairTranslationExecutor(max_workers=2)
+
+        def _boom():
+            raise RuntimeError("bedrock down")
+
+        with pytest.raises(RuntimeError, match="bedrock down"):
+            executor.submit("r1", _boom).result(5)
+        executor.shutdown()
+
+    def test_cancelled_item_is_skipped(self):
+        executor, gate = _blocked_executor()
+        ran = []
+        cancelled = executor.submit("r1", ran.append, "x")
+        assert cancelled.cancel()
+        gate.set()
+        executor.submit("r1", ran.append, "y").result(5)
+        executor.shutdown()
+
+        assert ran == ["y"]
+
+    def test_stats_report_queue_depth(self):
+        executor, gate = _blocked_executor()
+        executor.submit("r1", lambda: None)
+        executor.submit("r2", lambda: None, priority=PRIORITY_SECONDARY)
+
+        stats = executor.stats()
+        assert stats["workers"] == 1
+        assert stats["running"] == 1
+        assert stats["queued"] == {"primary": 1, "secondary": 1}
+        assert stats["rooms_waiting"] == 2
+
+        gate.set()
+        executor.shutdown()
+        stats = executor.stats()
+        assert stats["completed"] == 3
+        assert stats["queued"] == {"primary": 0, "secondary": 0}
+        assert stats["max_wait_ms"] >= 0.0
+
+    def test_workers_capped_at_max(self):
+        executor = FairTranslationExecutor(max_workers=2)
+        gate = threading.Event()
+        futures = [executor.submit(f"r{i}", gate.wait, 5) for i in range(5)]
+        assert executor.stats()["workers"] == 2
+        gate.set()
+        for f in futures:
+            f.result(5)
+        executor.shutdown()
+
+
+class TestAsyncRun:
+    def test_run_is_awaitable(self):
+        executor = FairTranslationExecutor(max_workers=1)
+
+        async def _main():
+            return await executor.run("r1", lambda a, b=0: a + b, 2, b=3)
+
+        assert asyncio.run(_main()) == 5
+        executor.shutdown()
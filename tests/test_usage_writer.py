@@ -0,0 +1,197 @@
+"""
+사용량 로그 write-behind writer 단위 테스트
+UsageLogWriter 의 group commit / flush·close 내구성 / 미커밋 사용량 추적 /
+오류 처리와, _record_usage 의 write-behind 경로 검증
+"""
+
+import sqlite3
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from database import DatabaseManager, UsageLog, User
+from usage_writer import UsageLogWriter
+
+
+@pytest.fixture
+def dbm(tmp_path):
+    return DatabaseManager(str(tmp_path / "usage.db"))
+
+
+@pytest.fixture
+def user_id(dbm):
+    return User(dbm).create_user("op", "pw", usage_limit_seconds=3600)
+
+
+def _row(user_id, seconds=3, **extra):
+    return {"user_id": user_id, "duration_seconds": seconds, **extra}
+
+
+class TestUsageLogWriter:
+    def test_rows_are_group_committed(self, dbm, user_id):
+        log = UsageLog(dbm)
+        writer = UsageLogWriter(log, flush_interval=60, batch_rows=3)
+        for _ in range(3):
+            writer.submit(**_row(user_id, room_id="r1"))
+
+        assert writer.flush(timeout=5)
+        stats = writer.stats()
+        assert stats["batches"] == 1
+        assert stats["last_batch_size"] == 3
+        assert stats["backlog"] == 0
+        assert User(dbm).get_remaining_seconds(user_id) == 3600 - 9
+        assert [row["room_id"] for row in log.get_user_logs(user_id)] == ["r1"] * 3
+        writer.close()
+
+    def test_flush_interval_bounds_latency(self, dbm, user_id):
+        writer = UsageLogWriter(UsageLog(dbm), flush_interval=0.01, batch_rows=100)
+        done = threading.Event()
+        original = writer._settle
+
+        def _settle(rows, written):
+            original(rows, written)
+            done.set()
+
+        writer._settle = _settle
+        writer.submit(**_row(user_id))
+        assert done.wait(5)
+        writer.close()
+
+    def test_pending_seconds_until_committed(self, dbm, user_id):
+        writer = UsageLogWriter(UsageLog(dbm), flush_interval=60)
+        writer.submit(**_row(user_id, 5))
+        writer.submit(**_row(user_id, 7))
+        assert writer.pending_seconds(user_id) == 12
+
+        writer.flush(timeout=5)
+        assert writer.pending_seconds(user_id) == 0
+        writer.close()
+
+    def test_submit_returns_increasing_record_ids(self, dbm, user_id):
+        writer = UsageLogWriter(UsageLog(dbm), flush_interval=60)
+        assert writer.submit(**_row(user_id)) == 1
+        assert writer.submit(**_row(user_id)) == 2
+        writer.close()
+
+    def test_snapshot_does_not_see_commit_before_settle(self, dbm, user_id):
+        log = UsageLog(dbm)
+        users = User(dbm)
+        committed = threading.Event()
+        release = threading.Event()
+        original = log.record_utterances
+
+        def _commit_then_pause(rows):
+            original(rows)
+            committed.set()
+            assert release.wait(5)
+
+        log.record_utterances = _commit_then_pause
+        writer = UsageLogWriter(log, flush_interval=0)
+        writer.submit(**_row(user_id, 5))
+        assert committed.wait(5)
+
+        # DB 에는 이미 반영됐지만 pending 은 아직 정리 전 — snapshot 은 기다린다.
+        result = []
+        reader = threading.Thread(
+            target=lambda: result.append(
+                writer.snapshot(user_id, users.get_remaining_seconds)
+            )
+        )
+        reader.start()
+        reader.join(0.1)
+        assert reader.is_alive()
+
+        release.set()
+        reader.join(5)
+        assert result == [(3600 - 5, 0, 1)]
+        writer.close()
+
+    def test_close_writes_backlog(self, dbm, user_id):
+        writer = UsageLogWriter(UsageLog(dbm), flush_interval=60)
+        for _ in range(5):
+            writer.submit(**_row(user_id))
+        assert writer.close()
+
+        assert len(UsageLog(dbm).get_user_logs(user_id)) == 5
+        with pytest.raises(RuntimeError):
+            writer.submit(**_row(user_id))
+
+    def test_integrity_error_drops_only_bad_rows(self, dbm, user_id):
+        writer = UsageLogWriter(UsageLog(dbm), flush_interval=60)
+        writer.submit(**_row(user_id))
+        writer.submit(**_row(9999))  # 없는 사용자 — FK 위반
+        writer.flush(timeout=5)
+
+        stats = writer.stats()
+        assert stats["written_rows"] == 1
+        assert stats["dropped_rows"] == 1
+        assert len(UsageLog(dbm).get_user_logs(user_id)) == 1
+        writer.close()
+
+    def test_transient_error_is_retried(self, dbm, user_id, monkeypatch):
+        monkeypatch.setattr("usage_writer._RETRY_DELAY_SECONDS", 0)
+        log = UsageLog(dbm)
+        calls = {"n": 0}
+        original = log.record_utterances
+
+        def _flaky(rows):
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise sqlite3.OperationalError("database is locked")
+            return original(rows)
+
+        log.record_utterances = _flaky
+        writer = UsageLogWriter(log, flush_interval=60)
+        writer.submit(**_row(user_id))
+
+        assert writer.flush(timeout=5)
+        assert writer.stats()["failed_batches"] == 1
+        assert len(log.get_user_logs(user_id)) == 1
+        writer.close()
+
+
+class TestRecordUsageWriteBehind:
+    def test_record_usage_enqueues_without_waiting(self, monkeypatch):
+        import websocket_handler
+
+        monkeypatch.setenv("USAGE_WRITE_BEHIND", "1")
+        writer = MagicMock()
+        writer.submit.return_value = None
+        log_model = MagicMock()
+        with (
+            patch("websocket_handler.get_usage_writer", return_value=writer),
+            patch("websocket_handler.get_usage_log_model", return_value=log_model),
+            patch("websocket_handler.update_user_session"),
+        ):
+            duration, remaining = websocket_handler._record_usage(
+                current_user={"id": 1, "username": "op", "room_id": "r1"},
+                audio_duration=4,
+                data={"audio_duration_seconds": 4},
+                transcript="hi",
+                translated_text="안녕",
+                used_llm=False,
+                source_lang="en",
+                target_lang="ko",
+            )
+
+        assert (duration, remaining) == (4, None)
+        kwargs = writer.submit.call_args.kwargs
+        assert kwargs["user_id"] == 1
+        assert kwargs["duration_seconds"] == 4
+        assert kwargs["room_id"] == "r1"
+        log_model.record_utterance.assert_not_called()
+
+    def test_remaining_seconds_subtracts_pending_usage(self, monkeypatch):
+        import auth
+
+        monkeypatch.setenv("USAGE_WRITE_BEHIND", "1")
+        user_model = MagicMock()
+        user_model.get_remaining_seconds.return_value = 100
+        writer = MagicMock()
+        writer.snapshot.side_effect = lambda user_id, read: (read(user_id), 7, 1)
+        with (
+            patch("auth.get_user_model", return_value=user_model),
+            patch("auth.get_usage_writer", return_value=writer),
+        ):
+            assert auth.load_remaining_seconds(1) == 93
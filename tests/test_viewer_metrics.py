@@ -437,12 +437,12 @@ class TestBroadcastManagerDBHook:
             def get_viewer_metrics(self, *a, **kw):
                 return None
 
-        from sse_broadcast import BroadcastManager
+        from sse_broadcast import BroadcastManager, ViewerCursor
 
         mgr = BroadcastManager(metrics_repo=_FailingRepo())
-        # register 가 예외 없이 큐를 반환해야 한다.
+        # register 가 예외 없이 cursor 를 반환해야 한다.
         q = await mgr.register_viewer("rm-x", "ko")
-        assert isinstance(q, asyncio.Queue)
+        assert isinstance(q, ViewerCursor)
         # 인메모리 카운트는 정상 갱신.
         m = mgr.get_metrics("rm-x")
         assert m["current"] == 1
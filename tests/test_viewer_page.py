@@ -65,6 +65,13 @@ class TestViewerHtmlMarkup:
         assert "EventSource(" in viewer_html, "EventSource API required"
         assert "/stream/" in viewer_html, "must connect to /stream/{room_id}"
 
+    def test_partial_delta_requires_next_seq(self, viewer_html):
+        """append-delta 는 직전 seq 의 다음 번호일 때만 적용한다 (어긋나면 버림)."""
+        assert "applyPartialDelta(payload.seq, payload.offset, payload.delta)" in (
+            viewer_html
+        )
+        assert "seq !== partialSeq + 1" in viewer_html
+
     def test_language_selector_present(self, viewer_html):
         """드롭다운 마크업 (<select>) 과 식별자가 존재한다."""
         assert "<select" in viewer_html, "<select> for language switching"
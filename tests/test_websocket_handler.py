@@ -219,7 +219,7 @@ class TestRecordUsage:
                 target_lang="ko",
             )
 
-        assert result == 10
+        assert result == (10, 3600 - 10)
 
     def test_zero_audio_duration_estimates_from_transcript(self, mock_db, user_info):
         """audio_duration=0 시 max(1, len(transcript)/5.0)으로 추정"""
@@ -250,7 +250,7 @@ class TestRecordUsage:
             )
 
         expected = max(1, len(transcript) / 5.0)
-        assert result == expected
+        assert result == (expected, 3600 - int(expected))
 
     def test_zero_duration_short_text_uses_minimum_1(self, mock_db, user_info):
         """짧은 텍스트(len<5)에서 audio_duration=0이면 최소 1초 사용"""
@@ -280,7 +280,7 @@ class TestRecordUsage:
                 target_lang="ko",
             )
 
-        assert result == 1
+        assert result == (1, 3600 - 1)
 
 
 # ============================================================
@@ -363,6 +363,49 @@ class TestHandleTranscript:
         assert sent[0]["used_llm"] is True
         assert sent[0]["source_language"] == "en"
         assert sent[0]["target_language"] == "ko"
+        # 남은 시간은 사용량 기록 트랜잭션의 RETURNING 값 (재조회 없음).
+        assert sent[0]["remaining_seconds"] == 3600 - 5
+
+    def test_final_translation_is_recorded_in_room_context(self, mock_db, user_info):
+        """확정 번역은 룸 TranslationContext 에 남아 다음 프롬프트에 쓰인다"""
+        from database import UsageLog, User
+        from room_manager import RoomManager
+        from websocket_handler import _handle_transcript
+
+        room_manager = RoomManager()
+        room = room_manager.create_room("r1")
+        user = {**user_info, "room_id": "r1"}
+        ws = _make_websocket()
+
+        with (
+            patch("websocket_handler._room_manager", room_manager),
+            patch("websocket_handler.check_usage_limit", return_value=True),
+            patch("websocket_handler.detect_language", return_value=("en", "ko")),
+            patch(
+                "websocket_handler._translate_text",
+                return_value=("안녕하세요", False),
+            ),
+            patch("websocket_handler.get_user_model", return_value=User(mock_db)),
+            patch(
+                "websocket_handler.get_usage_log_model",
+                return_value=UsageLog(mock_db),
+            ),
+            patch("websocket_handler.update_user_session"),
+        ):
+            asyncio.run(
+                _handle_transcript(
+                    ws,
+                    {"text": "Hello world", "audio_duration_seconds": 5},
+                    user,
+                    MagicMock(),
+                    MagicMock(),
+                    False,
+                )
+            )
+
+        assert room.translation_context.recent("en", "ko") == [
+            ("Hello world", "안녕하세요")
+        ]
 
     def test_no_user_info_sends_error(self):
         """user_info가 None이면 에러 메시지 전송"""
@@ -1036,6 +1079,12 @@ class TestModuleSingletons:
 class TestViewerStreamingPartials:
     """스트리밍 부분 청크를 오퍼레이터 WS + 뷰어 SSE 로 흘려보내는 경로."""
 
+    @pytest.fixture(autouse=True)
+    def _no_coalescing(self, monkeypatch):
+        # 전달 경로만 본다 — 코얼레싱은 TestPartialCoalescing 에서 따로 검증.
+        monkeypatch.setattr("partial_updates.PARTIAL_MIN_INTERVAL_SECONDS", 0)
+        monkeypatch.setattr("partial_updates.PARTIAL_MIN_CHARS", 0)
+
     def test_stream_llm_translation_forwards_partials_to_on_partial(self):
         """비-최종 청크만 on_partial/WS 로 나가고, 최종 텍스트가 반환된다."""
         from websocket_handler import _stream_llm_translation
@@ -1127,6 +1176,63 @@ class TestViewerStreamingPartials:
         assert "timestamp" in payload
 
 
+class TestPartialCoalescing:
+    """토큰 단위 누적 텍스트가 코얼레싱되고, delta 형식으로 뷰어에 실린다."""
+
+    def test_token_stream_sends_fewer_partials_but_same_final(self, monkeypatch):
+        from websocket_handler import _stream_llm_translation
+
+        monkeypatch.setattr("partial_updates.PARTIAL_MIN_INTERVAL_SECONDS", 60)
+        text = "안녕하세요 여러분 오늘 발표를 시작하겠습니다"
+        chunks = [(text[:i], False) for i in range(1, len(text) + 1)]
+        chunks.append((text, True))
+        viewer = []
+
+        async def on_partial(t):
+            viewer.append(t)
+
+        ws = AsyncMock()
+        with patch(
+            "websocket_handler.translate_with_llm_stream",
+            return_value=iter(chunks),
+        ):
+            result = asyncio.run(
+                _stream_llm_translation(
+                    ws, MagicMock(), "hello", "en", "ko", on_partial=on_partial
+                )
+            )
+
+        assert result == text
+        sent = [json.loads(c.args[0])["text"] for c in ws.send.call_args_list]
+        # 첫 글자는 즉시, 이후는 간격 제한에 걸려 생략된다.
+        assert sent == [text[:1]]
+        assert viewer == sent
+
+    def test_delta_wire_format_for_viewers(self, monkeypatch):
+        from partial_updates import PartialDeltaEncoder
+        from websocket_handler import _publish_partial_to_viewers
+
+        monkeypatch.setattr(
+            "websocket_handler._partial_encoder", PartialDeltaEncoder("delta")
+        )
+        mgr = MagicMock()
+        mgr.has_viewers.return_value = True
+        mgr.publish = AsyncMock()
+
+        async def _run():
+            await _publish_partial_to_viewers("room1", "안녕", "ko")
+            await _publish_partial_to_viewers("room1", "안녕하세요", "ko")
+
+        with patch("websocket_handler._broadcast_manager", mgr):
+            asyncio.run(_run())
+        first, second = (c.args[2] for c in mgr.publish.call_args_list)
+        assert first["text"] == "안녕" and first["partial"] is True
+        assert "text" not in second
+        assert (second["offset"], second["delta"]) == (2, "하세요")
+        # 뷰어는 seq 가 직전 + 1 인 delta 만 적용한다.
+        assert (first["seq"], second["seq"]) == (1, 2)
+
+
 # ============================================================
 # _translate_secondary (lines 624-632)
 # ============================================================
@@ -1183,6 +1289,78 @@ class TestTranslateSecondary:
         assert result is None
 
 
+# ============================================================
+# _publish_to_viewers: batched multi-target secondary translation
+# ============================================================
+class TestMultiTargetSecondary:
+    """Bedrock 사용 가능 시 추가 언어를 멀티 타깃 번역 한 번으로 묶는다."""
+
+    @staticmethod
+    def _capture_multi_fn(bedrock_available):
+        from websocket_handler import _publish_to_viewers
+
+        room_manager = MagicMock()
+        room_manager._repo.get_by_id.return_value = {"id": "room1"}
+        broadcast = AsyncMock()
+        with (
+            patch("websocket_handler._room_manager", room_manager),
+            patch("websocket_handler.broadcast_translation_for_room", broadcast),
+        ):
+            asyncio.run(
+                _publish_to_viewers(
+                    "room1",
+                    primary_translated="안녕",
+                    source_text="hi",
+                    source_lang="en",
+                    target_lang="ko",
+                    translate_client=MagicMock(),
+                    bedrock_client=MagicMock(),
+                    bedrock_available=bedrock_available,
+                )
+            )
+        return broadcast.call_args.kwargs["translate_multi_fn"]
+
+    def test_no_batch_when_bedrock_unavailable(self):
+        assert self._capture_multi_fn(bedrock_available=False) is None
+
+    def test_missing_languages_are_left_to_batch_fallback(self):
+        multi_fn = self._capture_multi_fn(bedrock_available=True)
+
+        async def _collect():
+            return [item async for item in multi_fn("hi", "en", ["zh", "vi"])]
+
+        with (
+            patch(
+                "websocket_handler.translate_with_llm_multi_stream",
+                return_value=iter([("zh", "你好")]),
+            ),
+            patch("websocket_handler._translate_secondary") as mock_secondary,
+        ):
+            results = asyncio.run(_collect())
+
+        # 빠진 vi 는 _translate_and_publish_batch 가 병렬로 폴백한다.
+        assert results == [("zh", "你好")]
+        mock_secondary.assert_not_called()
+
+    def test_batch_failure_yields_nothing(self):
+        multi_fn = self._capture_multi_fn(bedrock_available=True)
+
+        async def _collect():
+            return [item async for item in multi_fn("hi", "en", ["zh", "vi"])]
+
+        with (
+            patch(
+                "websocket_handler.translate_with_llm_multi_stream",
+                side_effect=RuntimeError("bedrock down"),
+            ),
+            patch("websocket_handler._translate_secondary") as mock_secondary,
+        ):
+            results = asyncio.run(_collect())
+
+        assert results == []
+        mock_secondary.assert_not_called()
+
+
 # ============================================================
 # language_update inside handle_openai_websocket (lines 727-744)
 # ============================================================
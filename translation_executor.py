@@ -0,0 +1,216 @@
+"""
+번역 전용 스레드 executor 모듈
+블로킹 Bedrock / AWS Translate 호출을 기본 executor 와 분리해 실행한다.
+
+설계 요약
+---------
+- asyncio 기본 executor (min(32, cpu+4) 스레드) 는 ``asyncio.to_thread`` 를
+  쓰는 다른 모든 작업과 공유된다. 여러 룸에서 transcript 가 몰리면 번역이
+  기본 executor 를 고갈시키므로, 크기를 따로 정할 수 있는 전용 풀을 둔다
+  (``TRANSLATION_EXECUTOR_WORKERS``, 기본 16).
+- 대기열은 (우선순위, room_id) 단위로 나뉜다. 워커는 primary(오퍼레이터
+  메인 언어) 작업을 먼저 꺼내고, 같은 우선순위 안에서는 룸을 round-robin
+  으로 돌며 한 건씩 꺼낸다 — 말 많은 룸 하나가 다른 룸 자막을 밀어내지 않는다.
+- 대기 깊이 / 대기 시간 지표를 ``stats()`` 로 노출한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any
+
+# 전용 번역 워커 스레드 수.
+TRANSLATION_EXECUTOR_WORKERS = int(os.getenv("TRANSLATION_EXECUTOR_WORKERS", "16"))
+
+# 우선순위 — 값이 작을수록 먼저 처리한다.
+PRIORITY_PRIMARY = 0
+PRIORITY_SECONDARY = 1
+_PRIORITIES: tuple[int, ...] = (PRIORITY_PRIMARY, PRIORITY_SECONDARY)
+_PRIORITY_NAMES = {PRIORITY_PRIMARY: "primary", PRIORITY_SECONDARY: "secondary"}
+
+# room_id 가 없는 작업(기본 룸 등)이 공유하는 대기열 키.
+_NO_ROOM = "__no_room__"
+
+
+class _WorkItem:
+    __slots__ = ("future", "fn", "args", "kwargs", "enqueued_at")
+
+    def __init__(self, future: Future, fn: Callable, args: tuple, kwargs: dict):
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.enqueued_at = time.monotonic()
+
+
+class FairTranslationExecutor:
+    """룸 단위 공정 스케줄링 + 우선순위를 갖는 고정 크기 스레드 풀.
+
+    ``submit`` 은 ``concurrent.futures.Future`` 를, ``run`` 은 이벤트 루프에서
+    await 할 수 있는 awaitable 을 돌려준다. 워커 스레드는 첫 submit 때
+    필요한 만큼만 띄운다 (daemon — 프로세스 종료를 막지 않는다).
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self._max_workers = max(1, max_workers or TRANSLATION_EXECUTOR_WORKERS)
+        self._cond = threading.Condition()
+        # priority -> OrderedDict[room_id, deque[_WorkItem]] (round-robin 순서)
+        self._queues: dict[int, OrderedDict[str, deque[_WorkItem]]] = {
+            p: OrderedDict() for p in _PRIORITIES
+        }
+        self._queued: dict[int, int] = dict.fromkeys(_PRIORITIES, 0)
+        self._workers: list[threading.Thread] = []
+        self._idle = 0
+        self._running = 0
+        self._completed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._shutdown = False
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+    def submit(
+        self,
+        room_id: str | None,
+        fn: Callable[..., Any],
+        *args: Any,
+        priority: int = PRIORITY_PRIMARY,
+        **kwargs: Any,
+    ) -> Future:
+        """작업을 (priority, room_id) 대기열에 넣고 Future 를 반환한다."""
+        if priority not in self._queues:
+            raise ValueError(f"Unknown priority: {priority!r}")
+        future: Future = Future()
+        item = _WorkItem(future, fn, args, kwargs)
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("translation executor is shut down")
+            rooms = self._queues[priority]
+            rooms.setdefault(room_id or _NO_ROOM, deque()).append(item)
+            self._queued[priority] += 1
+            # 대기 작업 수만큼 idle 워커가 없으면 (상한까지) 워커를 늘린다.
+            if (
+                self._idle < sum(self._queued.values())
+                and len(self._workers) < self._max_workers
+            ):
+                self._spawn_worker_locked()
+            self._cond.notify()
+        return future
+
+    def run(
+        self,
+        room_id: str | None,
+        fn: Callable[..., Any],
+        *args: Any,
+        priority: int = PRIORITY_PRIMARY,
+        **kwargs: Any,
+    ) -> asyncio.Future:
+        """``submit`` 의 asyncio 버전 — 현재 이벤트 루프에서 await 한다.
+
+        await 하던 코루틴이 취소되면 아직 대기 중인 작업도 취소된다.
+        """
+        return asyncio.wrap_future(
+            self.submit(room_id, fn, *args, priority=priority, **kwargs)
+        )
+
+    # ------------------------------------------------------------------
+    # Metrics / lifecycle
+    # ------------------------------------------------------------------
+    def stats(self) -> dict[str, Any]:
+        """대기 깊이 / 대기 시간 / 처리량 스냅샷."""
+        with self._cond:
+            done = self._completed
+            return {
+                "workers": len(self._workers),
+                "max_workers": self._max_workers,
+                "running": self._running,
+                "queued": {_PRIORITY_NAMES[p]: self._queued[p] for p in _PRIORITIES},
+                "rooms_waiting": len(
+                    {room for p in _PRIORITIES for room in self._queues[p]}
+                ),
+                "completed": done,
+                "avg_wait_ms": (self._total_wait / done * 1000.0) if done else 0.0,
+                "max_wait_ms": self._max_wait * 1000.0,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """새 작업을 거부하고, 대기 중인 작업을 처리한 뒤 워커를 종료한다."""
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+            workers = list(self._workers)
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _spawn_worker_locked(self) -> None:
+        worker = threading.Thread(
+            target=self._worker_loop,
+            name=f"translate-worker-{len(self._workers)}",
+            daemon=True,
+        )
+        self._workers.append(worker)
+        worker.start()
+
+    def _next_item_locked(self) -> _WorkItem | None:
+        for priority in _PRIORITIES:
+            rooms = self._queues[priority]
+            if not rooms:
+                continue
+            room_id, items = next(iter(rooms.items()))
+            item = items.popleft()
+            if items:
+                # 이 룸은 아직 남은 작업이 있다 — 맨 뒤로 보내 다른 룸 차례.
+                rooms.move_to_end(room_id)
+            else:
+                del rooms[room_id]
+            self._queued[priority] -= 1
+            return item
+        return None
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                item = self._next_item_locked()
+                while item is None:
+                    if self._shutdown:
+                        return
+                    self._idle += 1
+                    self._cond.wait()
+                    self._idle -= 1
+                    item = self._next_item_locked()
+                wait = time.monotonic() - item.enqueued_at
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+                self._running += 1
+
+            try:
+                if item.future.set_running_or_notify_cancel():
+                    try:
+                        result = item.fn(*item.args, **item.kwargs)
+                    except BaseException as e:  # noqa: BLE001 — Future 로 전달
+                        item.future.set_exception(e)
+                    else:
+                        item.future.set_result(result)
+            finally:
+                with self._cond:
+                    self._running -= 1
+                    self._completed += 1
+
+
+_translation_executor = FairTranslationExecutor()
+
+
+def get_translation_executor() -> FairTranslationExecutor:
+    """프로세스 전역 번역 executor 싱글턴을 반환한다."""
+    return _translation_executor
@@ -0,0 +1,300 @@
+"""
+사용량 로그 write-behind writer (group commit)
+
+transcript 마다 ``_record_usage`` 가 이벤트 루프 스레드에서 SQLite 커밋을
+기다리면, 그동안 같은 루프의 다른 오퍼레이터 연결이 모두 멈춘다. 이
+모듈은 사용량 기록을 메모리 큐에 넣고 즉시 돌아오며, 백그라운드 스레드가
+모아서 한 트랜잭션으로 쓴다.
+
+설계 요약
+---------
+- :meth:`UsageLogWriter.submit` 은 lock 아래 append 만 한다 (디스크 대기
+  없음). 큐는 ``USAGE_WRITER_FLUSH_MS`` 가 지나거나 ``USAGE_WRITER_BATCH_ROWS``
+  건이 쌓이면 ``UsageLog.record_utterances`` 로 group commit 된다 (fsync 1회).
+- 아직 커밋되지 않은 사용량은 :meth:`pending_seconds` 로 조회할 수 있다 —
+  남은 시간 표시는 DB 값에서 이를 빼서 계산한다. 배치 커밋과 pending 정리는
+  commit lock 으로 묶여 있고, :meth:`snapshot` 은 그 lock 아래에서 DB 를
+  읽으므로 커밋된 사용량을 두 번 빼지 않는다.
+- :meth:`submit` 은 단조 증가하는 기록 번호를 돌려준다 — quota ledger 가
+  어떤 사용량이 이미 적재 값에 반영됐는지 가리는 데 쓴다.
+- 일시적 오류(database is locked 등)는 배치를 큐 앞에 되돌려 다음 주기에
+  재시도한다. 무결성 오류(삭제된 사용자 등)는 행 단위로 다시 써서 문제 행만
+  버린다.
+- graceful shutdown 시 :meth:`close` 가 큐를 모두 비운 뒤 스레드를 멈춘다.
+  realtime_service 종료 경로와 프로세스 종료(atexit) 양쪽에서 호출된다.
+- 큐 깊이 / 가장 오래된 항목 나이 / 배치 지표를 :meth:`stats` 로 노출한다.
+- ``USAGE_WRITE_BEHIND=0`` 이면 기존처럼 transcript 마다 동기 기록한다.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+# 배치를 모으는 최대 시간(ms) / 최대 행 수.
+USAGE_WRITER_FLUSH_MS = int(os.getenv("USAGE_WRITER_FLUSH_MS", "200"))
+USAGE_WRITER_BATCH_ROWS = int(os.getenv("USAGE_WRITER_BATCH_ROWS", "100"))
+
+# 종료 시 큐를 비우기 위해 기다리는 최대 시간(초).
+_CLOSE_TIMEOUT_SECONDS = 10.0
+
+# 일시적 오류 후 재시도까지 기다리는 시간(초).
+_RETRY_DELAY_SECONDS = 0.5
+
+
+def use_write_behind() -> bool:
+    """사용량 기록을 write-behind 로 처리할지 (``USAGE_WRITE_BEHIND``, 기본 on).
+
+    함수로 읽어야 load_dotenv() 이후 값을 가져올 수 있다.
+    """
+    return os.getenv("USAGE_WRITE_BEHIND", "1").lower() in ("1", "true", "yes")
+
+
+class UsageLogWriter:
+    """사용량 로그를 모아 백그라운드 스레드에서 group commit 한다 (thread-safe).
+
+    ``usage_log_model`` 은 ``record_utterances`` / ``record_utterance`` 를
+    제공하는 UsageLog 이다. 스레드는 첫 submit 때 띄운다 (daemon).
+    """
+
+    def __init__(
+        self,
+        usage_log_model: Any,
+        flush_interval: float | None = None,
+        batch_rows: int | None = None,
+    ) -> None:
+        self._model = usage_log_model
+        self._flush_interval = (
+            USAGE_WRITER_FLUSH_MS / 1000 if flush_interval is None else flush_interval
+        )
+        self._batch_rows = USAGE_WRITER_BATCH_ROWS if batch_rows is None else batch_rows
+        # (enqueued_at, row)
+        self._queue: deque[tuple[float, dict[str, Any]]] = deque()
+        self._pending: dict[int, int] = {}
+        self._last_id = 0
+        self._in_flight = 0
+        # 배치 커밋 ~ pending 정리 구간 (snapshot 과 상호 배제).
+        self._commit_lock = threading.Lock()
+        self._flush_waiters = 0
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self.written_rows = 0
+        self.batches = 0
+        self.failed_batches = 0
+        self.dropped_rows = 0
+        self.max_backlog = 0
+        self.last_batch_size = 0
+
+    # ------------------------------------------------------------------
+    # 생산자 쪽 (이벤트 루프)
+    # ------------------------------------------------------------------
+    def submit(self, **row: Any) -> int:
+        """발화 하나를 큐에 넣고 기록 번호를 돌려준다.
+
+        키는 ``UsageLog.record_utterance`` 인자와 같다.
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("usage writer is closed")
+            self._last_id += 1
+            self._queue.append((time.monotonic(), row))
+            user_id = row["user_id"]
+            self._pending[user_id] = (
+                self._pending.get(user_id, 0) + row["duration_seconds"]
+            )
+            self.max_backlog = max(self.max_backlog, len(self._queue))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="usage-writer", daemon=True
+                )
+                self._thread.start()
+            if len(self._queue) >= self._batch_rows:
+                self._cond.notify()
+            return self._last_id
+
+    def pending_seconds(self, user_id: int) -> int:
+        """아직 커밋되지 않은 ``user_id`` 의 사용량(초)."""
+        with self._cond:
+            return self._pending.get(user_id, 0)
+
+    def snapshot(
+        self, user_id: int, read_committed: Callable[[int], int | None]
+    ) -> tuple[int | None, int, int]:
+        """커밋된 값과 미커밋 사용량을 같은 시점으로 읽는다.
+
+        ``read_committed(user_id)`` (DB 조회) 를 commit lock 아래에서 부른다 —
+        배치가 커밋 중이면 pending 정리까지 끝난 뒤에 읽는다.
+        ``(read_committed 결과, 미커밋 사용량(초), 마지막 기록 번호)`` 를 반환한다.
+        """
+        with self._commit_lock:
+            committed = read_committed(user_id)
+            with self._cond:
+                return committed, self._pending.get(user_id, 0), self._last_id
+
+    # ------------------------------------------------------------------
+    # 소비자 쪽 (writer 스레드)
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._queue and not self._closed:
+                    # 첫 항목이 들어온 뒤 flush 간격만큼 더 모은다.
+                    deadline = self._queue[0][0] + self._flush_interval
+                    while (
+                        len(self._queue) < self._batch_rows
+                        and not self._closed
+                        and not self._flush_waiters
+                        and (remaining := deadline - time.monotonic()) > 0
+                    ):
+                        self._cond.wait(remaining)
+                if not self._queue:
+                    if self._closed:
+                        self._cond.notify_all()
+                        return
+                    continue
+                count = min(len(self._queue), self._batch_rows)
+                batch = [self._queue.popleft() for _ in range(count)]
+                self._in_flight = count
+            if not self._write(batch):
+                time.sleep(_RETRY_DELAY_SECONDS)
+
+    def _write(self, batch: list[tuple[float, dict[str, Any]]]) -> bool:
+        with self._commit_lock:
+            return self._commit(batch)
+
+    def _commit(self, batch: list[tuple[float, dict[str, Any]]]) -> bool:
+        rows = [row for _, row in batch]
+        try:
+            self._model.record_utterances(rows)
+        except sqlite3.IntegrityError as e:
+            print(f"[UsageWriter] 배치 무결성 오류 — 행 단위로 재시도: {e!r}")
+            written = self._write_rows_individually(rows)
+        except Exception as e:
+            # 일시적 오류 — 순서를 지켜 큐 앞에 되돌리고 다음 주기에 재시도.
+            print(f"[UsageWriter] ❌ 배치 기록 실패 ({len(rows)}건): {e!r}")
+            with self._cond:
+                self.failed_batches += 1
+                self._queue.extendleft(reversed(batch))
+                self._in_flight = 0
+                self._cond.notify_all()
+            return False
+        else:
+            written = len(rows)
+        self._settle(rows, written)
+        return True
+
+    def _write_rows_individually(self, rows: list[dict[str, Any]]) -> int:
+        written = 0
+        for row in rows:
+            try:
+                recorded = self._model.record_utterance(**row) is not None
+            except Exception as e:
+                print(f"[UsageWriter] ❌ 행 기록 실패 (user={row['user_id']}): {e!r}")
+                recorded = False
+            if recorded:
+                written += 1
+            else:
+                print(f"[UsageWriter] 사용량 기록 버림 (user={row['user_id']})")
+                with self._cond:
+                    self.dropped_rows += 1
+        return written
+
+    def _settle(self, rows: list[dict[str, Any]], written: int) -> None:
+        with self._cond:
+            for row in rows:
+                user_id = row["user_id"]
+                left = self._pending.get(user_id, 0) - row["duration_seconds"]
+                if left > 0:
+                    self._pending[user_id] = left
+                else:
+                    self._pending.pop(user_id, None)
+            self.written_rows += written
+            self.batches += 1
+            self.last_batch_size = len(rows)
+            self._in_flight = 0
+            self._cond.notify_all()
+
+    # ------------------------------------------------------------------
+    # 종료 / 지표
+    # ------------------------------------------------------------------
+    def flush(self, timeout: float | None = None) -> bool:
+        """큐가 모두 커밋될 때까지 기다린다. 시간 안에 비면 True."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            # flush 대기자가 있으면 writer 는 배치를 더 모으지 않고 바로 쓴다.
+            self._flush_waiters += 1
+            self._cond.notify_all()
+            try:
+                while (self._queue or self._in_flight) and self._thread is not None:
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+                return not self._queue
+            finally:
+                self._flush_waiters -= 1
+
+    def close(self, timeout: float = _CLOSE_TIMEOUT_SECONDS) -> bool:
+        """남은 큐를 모두 쓰고 writer 스레드를 멈춘다 (여러 번 불러도 된다)."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            if thread.is_alive():
+                print(f"[UsageWriter] ⚠️ 종료 시 미기록 {len(self._queue)}건")
+                return False
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """큐 깊이 / 가장 오래된 항목 나이 / 배치 카운터 스냅샷."""
+        with self._cond:
+            oldest = self._queue[0][0] if self._queue else None
+            return {
+                "backlog": len(self._queue) + self._in_flight,
+                "oldest_age_seconds": (
+                    round(time.monotonic() - oldest, 3) if oldest is not None else 0.0
+                ),
+                "max_backlog": self.max_backlog,
+                "written_rows": self.written_rows,
+                "batches": self.batches,
+                "last_batch_size": self.last_batch_size,
+                "failed_batches": self.failed_batches,
+                "dropped_rows": self.dropped_rows,
+            }
+
+
+_usage_writer: UsageLogWriter | None = None
+_usage_writer_lock = threading.Lock()
+
+
+def get_usage_writer() -> UsageLogWriter:
+    """프로세스 전역 UsageLogWriter 싱글턴 (첫 호출 시 생성, 종료 시 flush)."""
+    global _usage_writer
+    with _usage_writer_lock:
+        if _usage_writer is None:
+            from database import get_usage_log_model
+
+            _usage_writer = UsageLogWriter(get_usage_log_model())
+            atexit.register(_usage_writer.close)
+        return _usage_writer
+
+
+def close_usage_writer() -> None:
+    """생성된 writer 가 있으면 남은 큐를 쓰고 닫는다 (graceful shutdown)."""
+    with _usage_writer_lock:
+        writer = _usage_writer
+    if writer is not None:
+        writer.close()
@@ -4,16 +4,30 @@ OpenAI Realtime API 통합, 번역 처리, 사용량 추적
 """
 
 import asyncio
-import json
 import os
 import socket
 import time
 
-import boto3
 import websockets
 
-from auth import check_usage_limit, update_user_session
+import fastpath
+from auth import (
+    check_usage_limit,
+    get_ledger_remaining_seconds,
+    load_remaining_snapshot,
+    update_user_session,
+)
+from aws_clients import get_client_pool
+from bedrock_stream import (
+    BEDROCK_ASYNC_STREAMING,
+    close_async_bedrock_clients,
+    get_async_bedrock_client,
+)
+from broadcast_hub import HubPublisher, use_hub_backend
 from database import get_usage_log_model, get_user_model
+from partial_updates import PartialCoalescer, PartialDeltaEncoder
+from quota_ledger import get_quota_ledger
+from room_cache import get_room_cache
 from room_manager import DEFAULT_ROOM_ID, RoomManager
 from services import (
     create_openai_session,
@@ -21,16 +35,36 @@ from services import (
     get_aws_region,
     get_aws_secret_access_key,
 )
+from speculative_translation import (
+    SpeculativeTranslator,
+    join_sentences,
+    pipeline_sentences,
+    translate_sentences_pipelined,
+)
 from sse_broadcast import BroadcastManager, broadcast_translation_for_room
 from translation import (
+    AWS_TRANSLATE_CACHE_MODEL,
     detect_language,
+    get_translation_cache,
     translate_with_llm,
+    translate_with_llm_multi_stream,
     translate_with_llm_stream,
+    translate_with_llm_stream_async,
+)
+from translation_executor import (
+    PRIORITY_PRIMARY,
+    PRIORITY_SECONDARY,
+    get_translation_executor,
 )
+from usage_writer import get_usage_writer, use_write_behind
 
 # Per-connection rate limit: max messages per minute (sliding window)
 WS_RATE_LIMIT_PER_MINUTE = int(os.getenv("WS_RATE_LIMIT_PER_MINUTE", "30"))
 
+# transcript_delta 전용 창 — 클라이언트가 발화 중 250ms 마다 보내므로
+# transcript 와 별도로 센다 (같은 창이면 델타가 최종 transcript 를 막는다).
+WS_DELTA_RATE_LIMIT_PER_MINUTE = int(os.getenv("WS_DELTA_RATE_LIMIT_PER_MINUTE", "300"))
+
 # Module-level RoomManager singleton.
 # Tests substitute this via `patch("websocket_handler._room_manager", ...)`.
 _room_manager: RoomManager = RoomManager()
@@ -43,7 +77,17 @@ _room_manager: RoomManager = RoomManager()
 # ISSUE-33: the metrics_repo (database.Room) is attached lazily by app.py
 # at startup via attach_broadcast_metrics_repo() so tests that import this
 # module without a DB still work.
-_broadcast_manager: BroadcastManager = BroadcastManager()
+#
+# SSE_BROADCAST_BACKEND=unix: SSE runs in separate worker processes and this
+# is a HubPublisher (same publish / has_viewers / get_metrics surface) that
+# fans captions out over a Unix domain socket (broadcast_hub).
+_broadcast_manager: BroadcastManager | HubPublisher = (
+    HubPublisher() if use_hub_backend() else BroadcastManager()
+)
+
+# 뷰어 SSE 부분 payload 인코더 — (room_id, lang) 채널별로 마지막 부분
+# 텍스트를 기억한다 (PARTIAL_WIRE_FORMAT=delta 일 때 append-delta).
+_partial_encoder = PartialDeltaEncoder()
 
 
 def get_room_manager() -> RoomManager:
@@ -51,11 +95,17 @@ def get_room_manager() -> RoomManager:
     return _room_manager
 
 
-def get_broadcast_manager() -> BroadcastManager:
+def get_broadcast_manager() -> BroadcastManager | HubPublisher:
     """Return the module-level BroadcastManager singleton (ISSUE-30)."""
     return _broadcast_manager
 
 
+def _room_context(room_id):
+    """룸의 번역 문맥 (TranslationContext). 룸이 없으면 None."""
+    room = _room_manager.get_room(room_id) if room_id else None
+    return room.translation_context if room is not None else None
+
+
 def attach_broadcast_metrics_repo(metrics_repo: object) -> None:
     """Wire a metrics_repo (database.Room) into the singleton BroadcastManager.
 
@@ -98,13 +148,13 @@ async def _authenticate_client(websocket):
     """
     try:
         first_message = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-        data = json.loads(first_message)
+        data = fastpath.loads(first_message)
         if data.get("type") == "auth":
             user_info = data.get("user")
             if not user_info or "id" not in user_info:
                 print("[Auth] 인증 실패: 사용자 정보 누락")
                 await websocket.send(
-                    json.dumps(
+                    fastpath.dumps(
                         {
                             "type": "auth_error",
                             "message": "사용자 정보가 누락되었습니다.",
@@ -120,7 +170,7 @@ async def _authenticate_client(websocket):
             if db_user is None:
                 print(f"[Auth] 인증 실패: 존재하지 않는 사용자 ID {user_info['id']}")
                 await websocket.send(
-                    json.dumps(
+                    fastpath.dumps(
                         {"type": "auth_error", "message": "인증에 실패했습니다."}
                     )
                 )
@@ -130,7 +180,7 @@ async def _authenticate_client(websocket):
             if not db_user["is_active"]:
                 print(f"[Auth] 인증 실패: 비활성 사용자 {db_user['username']}")
                 await websocket.send(
-                    json.dumps(
+                    fastpath.dumps(
                         {
                             "type": "auth_error",
                             "message": "비활성화된 계정입니다. 관리자에게 문의하세요.",
@@ -147,7 +197,7 @@ async def _authenticate_client(websocket):
                     f"(claimed={claimed_username}, db={db_user['username']})"
                 )
                 await websocket.send(
-                    json.dumps(
+                    fastpath.dumps(
                         {"type": "auth_error", "message": "인증에 실패했습니다."}
                     )
                 )
@@ -188,7 +238,7 @@ async def _authenticate_client(websocket):
                         f"(user={validated_user['username']})"
                     )
                     await websocket.send(
-                        json.dumps(
+                        fastpath.dumps(
                             {
                                 "type": "auth_error",
                                 "message": "요청한 룸을 찾을 수 없습니다.",
@@ -209,7 +259,7 @@ async def _authenticate_client(websocket):
                 # Treat as unknown.
                 print(f"[Auth] 인증 실패: 룸 등록 실패 (room={resolved_room_id})")
                 await websocket.send(
-                    json.dumps(
+                    fastpath.dumps(
                         {
                             "type": "auth_error",
                             "message": "요청한 룸을 찾을 수 없습니다.",
@@ -220,12 +270,18 @@ async def _authenticate_client(websocket):
 
             validated_user["room_id"] = resolved_room_id
 
+            # 연결 시점의 남은 시간을 quota ledger 에 올려 둔다 — 이후
+            # transcript 마다의 한도 확인은 DB 를 읽지 않는다.
+            get_quota_ledger().prime(
+                validated_user["id"], *load_remaining_snapshot(validated_user["id"])
+            )
+
             print(
                 f"[Auth] 사용자 인증 성공: {validated_user['username']} "
                 f"(room={resolved_room_id})"
             )
             await websocket.send(
-                json.dumps(
+                fastpath.dumps(
                     {
                         "type": "auth_success",
                         "message": "인증 완료",
@@ -242,27 +298,25 @@ async def _authenticate_client(websocket):
 
 
 def _init_translation_clients():
-    """번역용 AWS 클라이언트 초기화"""
-    access_key = get_aws_access_key_id()
-    secret_key = get_aws_secret_access_key()
-    region = get_aws_region()
-
-    translate_client = boto3.client(
-        "translate",
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        region_name=region,
-    )
+    """번역용 AWS 클라이언트 조회 (프로세스 전역 풀에서 재사용).
+
+    클라이언트는 (region, 자격 증명) 키로 한 번만 생성되고 이후 연결은
+    캐시된 인스턴스를 받는다 — 오퍼레이터 재접속 시 botocore 모델 로딩
+    지연이 없어진다.
+    """
+    pool = get_client_pool()
+    credentials = {
+        "region": get_aws_region(),
+        "access_key": get_aws_access_key_id(),
+        "secret_key": get_aws_secret_access_key(),
+    }
+
+    translate_client = pool.get("translate", **credentials)
 
     bedrock_client = None
     bedrock_available = False
     try:
-        bedrock_client = boto3.client(
-            "bedrock-runtime",
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            region_name=region,
-        )
+        bedrock_client = pool.get("bedrock-runtime", **credentials)
         bedrock_available = True
         print("  🤖 Bedrock LLM 준비 완료")
     except Exception:
@@ -271,15 +325,30 @@ def _init_translation_clients():
     return translate_client, bedrock_client, bedrock_available
 
 
+def _warm_up_translation_clients():
+    """서버 시작 시 클라이언트 풀을 미리 채운다 (best-effort).
+
+    첫 오퍼레이터 연결이 클라이언트 생성 비용을 치르지 않도록 한다. 실패해도
+    서버 기동은 계속되고, 연결 시점에 ``_init_translation_clients`` 가 다시
+    시도한다.
+    """
+    try:
+        _init_translation_clients()
+    except Exception as e:
+        print(f"[AWS] 클라이언트 워밍업 실패: {e!r}")
+
+
 async def _handle_session_request(websocket):
     """OpenAI 세션 요청 처리"""
     try:
         session = await create_openai_session()
-        await websocket.send(json.dumps({"type": "openai_session", "session": session}))
+        await websocket.send(
+            fastpath.dumps({"type": "openai_session", "session": session})
+        )
         print("[OpenAI] ✅ 세션 생성 완료")
     except Exception as e:
         await websocket.send(
-            json.dumps(
+            fastpath.dumps(
                 {
                     "type": "error",
                     "message": f"OpenAI 세션 생성 실패: {e!s}",
@@ -296,8 +365,12 @@ def _translate_text(
     translate_client,
     bedrock_client,
     bedrock_available,
+    context=None,
 ):
-    """텍스트 번역 (LLM 우선, AWS Translate 폴백)"""
+    """텍스트 번역 (LLM 우선, AWS Translate 폴백)
+
+    ``context`` 는 룸의 TranslationContext — LLM 프롬프트에만 쓰인다.
+    """
     translated_text = None
     used_llm = False
 
@@ -308,6 +381,7 @@ def _translate_text(
                 transcript,
                 source_lang,
                 target_lang,
+                context=context,
             )
             if translated_text:
                 used_llm = True
@@ -315,6 +389,11 @@ def _translate_text(
         except Exception:
             pass
 
+    if not translated_text:
+        translated_text = get_translation_cache().get(
+            transcript, source_lang, target_lang, AWS_TRANSLATE_CACHE_MODEL
+        )
+
     if not translated_text:
         try:
             response = translate_client.translate_text(
@@ -323,9 +402,19 @@ def _translate_text(
                 TargetLanguageCode=target_lang,
             )
             translated_text = response["TranslatedText"]
+            get_client_pool().report_success(translate_client)
+            get_translation_cache().put(
+                transcript,
+                source_lang,
+                target_lang,
+                AWS_TRANSLATE_CACHE_MODEL,
+                translated_text,
+            )
             print("[Translate] ✅ AWS Translate 완료")
         except Exception as e:
             print(f"[Translate] ❌ 번역 실패: {e}")
+            # 연결 계층 오류가 누적되면 다음 연결에서 클라이언트를 재생성한다.
+            get_client_pool().report_failure(translate_client, e)
             translated_text = transcript
 
     return translated_text, used_llm
@@ -347,21 +436,31 @@ def _record_usage(
     클라이언트가 transcript payload 에 보낸 room_id 는 무시하고, 인증 시점
     에 server-side 에서 결정된 ``current_user["room_id"]`` 만 사용한다 —
     이 분기로 클라이언트가 다른 룸의 로그를 위조할 수 없다.
+
+    사용량 누적과 로그 INSERT 는 ``UsageLog.record_utterance`` 한 트랜잭션
+    으로 처리한다. write-behind(``USAGE_WRITE_BEHIND``, 기본) 이면 usage
+    writer 큐에 넣고 바로 돌아온다 — 이벤트 루프가 커밋을 기다리지 않는다.
+    기록한 사용량은 quota ledger 에도 반영한다 (동기 기록은 DB 값으로
+    prime, write-behind 는 charge). ``(audio_duration, remaining_seconds)``
+    를 반환하며, ledger 에 사용자가 없거나 기록에 실패하면
+    remaining_seconds 는 None 이다.
     """
+    remaining_seconds = None
     try:
-        user_model = get_user_model()
-        usage_log_model = get_usage_log_model()
-
         if audio_duration <= 0:
             audio_duration = max(1, len(transcript) / 5.0)
             print(f"[Usage] 📏 텍스트 기반 추정: {audio_duration:.1f}초")
 
-        user_model.add_usage(current_user["id"], int(audio_duration))
-
-        usage_log_model.record_usage(
+        write_behind = use_write_behind()
+        record = (
+            get_usage_writer().submit
+            if write_behind
+            else get_usage_log_model().record_utterance
+        )
+        recorded = record(
             user_id=current_user["id"],
-            action="transcribe",
             duration_seconds=int(audio_duration),
+            action="transcribe",
             source_language=source_lang,
             target_language=target_lang,
             metadata={
@@ -375,6 +474,16 @@ def _record_usage(
             room_id=current_user.get("room_id"),
         )
 
+        ledger = get_quota_ledger()
+        if write_behind:
+            # recorded 는 writer 의 기록 번호 — 이미 적재된 기록은 다시 빼지 않는다.
+            remaining_seconds = ledger.charge(
+                current_user["id"], int(audio_duration), record_id=recorded
+            )
+        elif recorded is not None:
+            remaining_seconds = recorded
+            ledger.prime(current_user["id"], remaining_seconds)
+
         update_user_session(current_user["id"])
 
         print(
@@ -382,17 +491,24 @@ def _record_usage(
             f"User: {current_user['username']}, "
             f"Duration: {audio_duration}초"
         )
-        return audio_duration
+        return audio_duration, remaining_seconds
 
     except Exception as e:
         print(f"[Usage] ❌ 사용량 기록 실패: {e}")
-        return audio_duration
+        return audio_duration, remaining_seconds
 
 
 async def _stream_llm_translation(
-    websocket, bedrock_client, transcript, source_lang, target_lang, on_partial=None
+    websocket,
+    bedrock_client,
+    transcript,
+    source_lang,
+    target_lang,
+    on_partial=None,
+    room_id=None,
+    prefix="",
 ):
-    """Bedrock 스트리밍 번역을 스레드에서 돌리며 부분 결과를 오퍼레이터 WS 로
+    """Bedrock 스트리밍 번역을 돌리며 부분 결과를 오퍼레이터 WS 로
     ``translation_partial`` 로 흘려보낸다 (#114 — 발화 후 첫 글자까지의 체감
     지연 단축).
 
@@ -401,42 +517,34 @@ async def _stream_llm_translation(
     WS 전송과 독립적인 best-effort 경로다 — 콜백 예외는 삼켜서 최종 번역/폴백에
     영향을 주지 않는다.
 
-    반환: 최종 번역 텍스트(성공) 또는 None(실패 → 호출자가 폴백).
-    블로킹 boto3 스트림은 executor 스레드에서 돌리고, 청크는 asyncio.Queue
-    로 받아 이벤트 루프를 막지 않고 순차 전송한다.
-    """
-    loop = asyncio.get_running_loop()
-    q: asyncio.Queue = asyncio.Queue()
+    ``prefix`` 는 이미 확정된 앞쪽 번역(추측 번역 재사용분)이다. 주어지면
+    부분 결과는 ``prefix + 누적 텍스트`` 로 보내 화면이 되돌아가지 않게 한다.
+    반환값에는 prefix 를 붙이지 않는다.
 
-    def _worker():
-        try:
-            for cumulative, done in translate_with_llm_stream(
-                bedrock_client, transcript, source_lang, target_lang
-            ):
-                loop.call_soon_threadsafe(q.put_nowait, ("chunk", cumulative, done))
-        except Exception as e:  # noqa: BLE001 — 폴백 트리거용
-            loop.call_soon_threadsafe(q.put_nowait, ("error", repr(e), True))
-        finally:
-            loop.call_soon_threadsafe(q.put_nowait, ("end", None, True))
+    토큰마다 오는 누적 텍스트는 ``PartialCoalescer`` 가 최소 간격/글자 증가
+    기준으로 골라낸다 — 오퍼레이터 WS 와 ``on_partial`` 모두 고른 조각만
+    받는다 (최종 텍스트는 항상 반환값으로 전달된다).
 
-    fut = loop.run_in_executor(None, _worker)
+    반환: 최종 번역 텍스트(성공) 또는 None(실패 → 호출자가 폴백).
+    청크 공급원은 ``_llm_stream_chunks`` 가 고른다 — 네이티브 async 클라이언트
+    또는 전용 executor 스레드의 boto3 스트림.
+    """
     final_text = None
-    errored = False
-    while True:
-        kind, payload, done = await q.get()
-        if kind == "end":
-            break
-        if kind == "error":
-            print(f"[Translate] 스트리밍 실패, 폴백: {payload}")
-            errored = True
-            continue
-        # kind == "chunk"
-        if done:
-            final_text = payload
-        else:
+    coalescer = PartialCoalescer()
+    try:
+        async for payload, done in _llm_stream_chunks(
+            bedrock_client, transcript, source_lang, target_lang, room_id
+        ):
+            if done:
+                final_text = payload
+                continue
+            if prefix:
+                payload = join_sentences([prefix, payload], target_lang)
+            if not coalescer.offer(payload):
+                continue
             try:
                 await websocket.send(
-                    json.dumps({"type": "translation_partial", "text": payload})
+                    fastpath.dumps({"type": "translation_partial", "text": payload})
                 )
             except Exception as send_err:
                 print(f"[Translate] 부분 번역 전송 실패: {send_err!r}")
@@ -446,8 +554,124 @@ async def _stream_llm_translation(
                     await on_partial(payload)
                 except Exception as cb_err:
                     print(f"[Translate] 뷰어 부분 전송 실패: {cb_err!r}")
-    await fut
-    return None if errored else final_text
+    except Exception as e:  # noqa: BLE001 — 폴백 트리거용
+        print(f"[Translate] 스트리밍 실패, 폴백: {e!r}")
+        return None
+    return final_text
+
+
+def _get_async_bedrock_client():
+    """네이티브 async 스트리밍이 켜져 있으면 AsyncBedrockClient, 아니면 None."""
+    if not BEDROCK_ASYNC_STREAMING:
+        return None
+    return get_async_bedrock_client(
+        region=get_aws_region(),
+        access_key=get_aws_access_key_id(),
+        secret_key=get_aws_secret_access_key(),
+    )
+
+
+async def _llm_stream_chunks(
+    bedrock_client, transcript, source_lang, target_lang, room_id=None
+):
+    """``(cumulative_text, done)`` 를 흘려보내는 async 스트림. 실패 시 예외.
+
+    ``BEDROCK_ASYNC_STREAMING`` 이면 aiohttp 기반 클라이언트로 이벤트 루프에서
+    직접 스트리밍한다 (스레드 점유 없음). 아니면 블로킹 boto3 스트림을 전용
+    번역 executor 에서 ``room_id`` 의 primary 우선순위로 돌리고, 청크는
+    asyncio.Queue 로 받아 이벤트 루프를 막지 않는다. 프롬프트에는 ``room_id``
+    룸의 직전 발화 문맥(TranslationContext)이 실린다.
+    """
+    context = _room_context(room_id)
+    async_client = _get_async_bedrock_client()
+    if async_client is not None:
+        async for item in translate_with_llm_stream_async(
+            async_client, transcript, source_lang, target_lang, context=context
+        ):
+            yield item
+        return
+
+    loop = asyncio.get_running_loop()
+    q: asyncio.Queue = asyncio.Queue()
+
+    def _worker():
+        try:
+            for cumulative, done in translate_with_llm_stream(
+                bedrock_client, transcript, source_lang, target_lang, context=context
+            ):
+                loop.call_soon_threadsafe(q.put_nowait, ("chunk", cumulative, done))
+        except Exception as e:  # noqa: BLE001 — 소비 측에서 다시 올린다
+            get_client_pool().report_failure(bedrock_client, e)
+            loop.call_soon_threadsafe(q.put_nowait, ("error", e, True))
+        else:
+            # 연속 실패 카운터 초기화 — 드문 연결 오류가 누적돼 교체되지 않게.
+            get_client_pool().report_success(bedrock_client)
+        finally:
+            loop.call_soon_threadsafe(q.put_nowait, ("end", None, True))
+
+    fut = get_translation_executor().run(room_id, _worker, priority=PRIORITY_PRIMARY)
+    error = None
+    try:
+        while True:
+            kind, payload, done = await q.get()
+            if kind == "end":
+                break
+            if kind == "error":
+                error = payload
+                continue
+            yield payload, done
+    finally:
+        await fut
+    if error is not None:
+        raise error
+
+
+def _resolve_languages(text, language_settings):
+    """연결 언어 설정으로 (source_lang, target_lang, mismatch) 를 정한다.
+
+    ``mismatch`` 는 설정된 input_lang 과 실제 감지 언어가 다를 때 감지된
+    언어 코드, 일치하면 None (ISSUE-34).
+    """
+    # Use connection-level language settings if available (ISSUE-2)
+    lang = language_settings or {}
+    input_lang = lang.get("input_lang", "auto")
+    output_lang = lang.get("output_lang")
+
+    if input_lang == "auto" or not input_lang:
+        # Fall back to auto-detection (ISSUE-4)
+        source_lang, target_lang = detect_language(
+            text, output_lang=output_lang or "ko"
+        )
+        return source_lang, target_lang, None
+
+    # Verify actual language matches the configured input_lang (ISSUE-34)
+    detected_lang, _ = detect_language(text)
+    if detected_lang != input_lang:
+        return None, None, detected_lang
+    return input_lang, output_lang or "ko", None
+
+
+def _handle_transcript_delta(data, user_info, language_settings, speculative):
+    """진행 중 전사(``transcript_delta``) 처리 — 안정된 문장을 미리 번역한다.
+
+    ``text`` 는 같은 ``item_id`` 의 누적 전사다. 번역 결과는 최종
+    ``transcript`` 처리 시 ``_handle_transcript`` 가 재사용한다. 응답은
+    보내지 않는다 (부분 번역은 ``translation_partial`` 로 흘러간다).
+
+    델타 자체는 과금되지 않으므로 사용량이 남지 않은 사용자의 델타는 번역
+    하지 않는다 — 한도 초과 안내는 최종 ``transcript`` 가 보낸다.
+    """
+    item_id = data.get("item_id")
+    text = data.get("text", "")
+    if speculative is None or not item_id or not text or not user_info:
+        return
+    if not check_usage_limit(1, user_info):
+        speculative.discard(item_id)
+        return
+    source_lang, target_lang, mismatch = _resolve_languages(text, language_settings)
+    if mismatch is not None:
+        return
+    speculative.on_delta(item_id, text, source_lang, target_lang)
 
 
 async def _handle_transcript(
@@ -458,8 +682,13 @@ async def _handle_transcript(
     bedrock_client,
     bedrock_available,
     language_settings=None,
+    speculative=None,
 ):
-    """트랜스크립트 메시지 처리 (번역 + 사용량)"""
+    """트랜스크립트 메시지 처리 (번역 + 사용량)
+
+    ``speculative`` (연결 단위 SpeculativeTranslator) 가 주어지면 같은
+    ``item_id`` 의 ``transcript_delta`` 로 미리 번역해 둔 문장을 재사용한다.
+    """
     transcript = data.get("text", "")
     audio_duration = data.get("audio_duration_seconds", 0)
 
@@ -472,7 +701,7 @@ async def _handle_transcript(
     current_user = user_info
     if not current_user:
         await websocket.send(
-            json.dumps(
+            fastpath.dumps(
                 {
                     "type": "error",
                     "message": (
@@ -486,10 +715,9 @@ async def _handle_transcript(
         return
 
     if not check_usage_limit(audio_duration, current_user):
-        user_model = get_user_model()
-        remaining = user_model.get_remaining_seconds(current_user["id"])
+        remaining = get_ledger_remaining_seconds(current_user["id"])
         await websocket.send(
-            json.dumps(
+            fastpath.dumps(
                 {
                     "type": "usage_exceeded",
                     "message": (f"사용량이 초과되었습니다. 남은 시간: {remaining}초"),
@@ -504,44 +732,71 @@ async def _handle_transcript(
         )
         return
 
-    # Use connection-level language settings if available (ISSUE-2)
-    lang = language_settings or {}
-    input_lang = lang.get("input_lang", "auto")
-    output_lang = lang.get("output_lang")
+    source_lang, target_lang, mismatch = _resolve_languages(
+        transcript, language_settings
+    )
+    if mismatch is not None:
+        input_lang = (language_settings or {}).get("input_lang")
+        await websocket.send(
+            fastpath.dumps(
+                {
+                    "type": "language_mismatch",
+                    "expected": input_lang,
+                    "detected": mismatch,
+                    "text": transcript[:100],
+                }
+            )
+        )
+        print(f"[Lang] Language mismatch: expected={input_lang}, detected={mismatch}")
+        if speculative is not None:
+            speculative.discard(data.get("item_id"))
+        return
 
-    if input_lang == "auto" or not input_lang:
-        # Fall back to auto-detection (ISSUE-4)
-        source_lang, target_lang = detect_language(
-            transcript, output_lang=output_lang or "ko"
+    # 진행 중 전사로 미리 번역해 둔 앞쪽 문장이 최종 transcript 와 일치하면
+    # 재사용하고, 나머지 원문만 새로 번역한다.
+    prefix = ""
+    text_to_translate = transcript
+    speculative_llm = False
+    if speculative is not None:
+        reconciled = await speculative.reconcile(
+            data.get("item_id"), transcript, source_lang, target_lang
         )
-    else:
-        # Verify actual language matches the configured input_lang (ISSUE-34)
-        detected_lang, _ = detect_language(transcript)
-        if detected_lang != input_lang:
-            await websocket.send(
-                json.dumps(
-                    {
-                        "type": "language_mismatch",
-                        "expected": input_lang,
-                        "detected": detected_lang,
-                        "text": transcript[:100],
-                    }
-                )
-            )
-            print(
-                f"[Lang] Language mismatch: "
-                f"expected={input_lang}, detected={detected_lang}"
-            )
-            return
-        source_lang = input_lang
-        target_lang = output_lang or "ko"
+        if reconciled.translated:
+            prefix = join_sentences(reconciled.translated, target_lang)
+            text_to_translate = reconciled.remainder
+            speculative_llm = reconciled.used_llm
+            print(f"[Speculative] 추측 번역 재사용: {len(reconciled.translated)}문장")
+
+    # 긴 발화는 문장 단위로 동시 번역하고 원문 순서대로 흘려보낸다 — 첫 자막
+    # 까지의 시간이 문단 전체가 아니라 첫 문장 번역 시간으로 묶인다.
+    sentences = pipeline_sentences(text_to_translate, source_lang)
+    if sentences:
+        room_id = current_user.get("room_id")
+
+        async def _pipeline_prefix(cumulative_text):
+            await _send_partial(websocket, room_id, cumulative_text, target_lang)
+
+        piped = await translate_sentences_pipelined(
+            sentences,
+            source_lang,
+            target_lang,
+            _sentence_translator(
+                room_id, translate_client, bedrock_client, bedrock_available
+            ),
+            _pipeline_prefix,
+            prefix=prefix,
+        )
+        if piped.translated:
+            prefix = join_sentences([prefix, *piped.translated], target_lang)
+            text_to_translate = piped.remainder
+            speculative_llm = speculative_llm or piped.used_llm
 
     # #114: Bedrock LLM 번역을 스트리밍으로 받아 오퍼레이터 화면에 부분 결과를
     # 즉시 흘려보낸다(체감 지연 단축). 스트리밍이 실패/빈 결과면 LLM 재시도
     # 없이 Amazon Translate 로 폴백한다(bedrock_available=False 로 호출).
     translated_text = None
     used_llm = False
-    if bedrock_available:
+    if text_to_translate and bedrock_available:
         # #116: 스트리밍 부분 청크를 뷰어 SSE 메인 채널로도 흘려보낸다. 채널은
         # 최종 broadcast 와 동일한 target_lang(=primary_output_lang) 을 쓴다.
         stream_room_id = current_user.get("room_id")
@@ -554,23 +809,37 @@ async def _handle_transcript(
         translated_text = await _stream_llm_translation(
             websocket,
             bedrock_client,
-            transcript,
+            text_to_translate,
             source_lang,
             target_lang,
             on_partial=_viewer_partial if stream_room_id else None,
+            room_id=stream_room_id,
+            prefix=prefix,
         )
         used_llm = bool(translated_text)
-    if not translated_text:
-        translated_text, used_llm = _translate_text(
-            transcript,
+    if text_to_translate and not translated_text:
+        # AWS Translate 폴백도 블로킹 boto3 호출이다 — 이벤트 루프 대신 전용
+        # executor 에서 primary 우선순위로 실행한다.
+        translated_text, used_llm = await get_translation_executor().run(
+            current_user.get("room_id"),
+            _translate_text,
+            text_to_translate,
             source_lang,
             target_lang,
             translate_client,
             bedrock_client,
             bedrock_available=False,
         )
+    if prefix:
+        translated_text = join_sentences([prefix, translated_text or ""], target_lang)
+        used_llm = used_llm or speculative_llm
+
+    # 다음 발화 프롬프트가 참고할 룸 문맥에 확정 번역을 남긴다.
+    context = _room_context(current_user.get("room_id"))
+    if context is not None:
+        context.add(transcript, translated_text, source_lang, target_lang)
 
-    audio_duration = _record_usage(
+    audio_duration, remaining_seconds = _record_usage(
         current_user,
         audio_duration,
         data,
@@ -580,12 +849,14 @@ async def _handle_transcript(
         source_lang,
         target_lang,
     )
-
-    user_model = get_user_model()
-    remaining_seconds = user_model.get_remaining_seconds(current_user["id"])
+    if remaining_seconds is None:
+        # ledger 미적재 또는 기록 실패 — 남은 시간은 스레드에서 따로 조회한다.
+        remaining_seconds = await asyncio.to_thread(
+            get_ledger_remaining_seconds, current_user["id"]
+        )
 
     await websocket.send(
-        json.dumps(
+        fastpath.dumps(
             {
                 "type": "transcription_result",
                 "original_text": transcript,
@@ -626,6 +897,8 @@ async def _publish_partial_to_viewers(room_id, text, lang):
     - best-effort: 실패해도 오퍼레이터 자막/최종 broadcast 에 영향 없음(RL-006).
     - payload 에 ``partial: True`` 를 실어 뷰어가 타자기 스무딩만 갱신하고
       확정하지 않게 한다. 최종 broadcast payload 는 이 플래그가 없어 확정 신호.
+    - ``PARTIAL_WIRE_FORMAT=delta`` 이면 ``text`` 대신 직전 부분 대비
+      ``offset``/``delta`` 와 순번 ``seq`` 만 싣는다 (``_partial_encoder``).
     """
     if not room_id or not text:
         return
@@ -636,7 +909,7 @@ async def _publish_partial_to_viewers(room_id, text, lang):
             room_id,
             lang,
             {
-                "text": text,
+                **_partial_encoder.encode((room_id, lang), text),
                 "lang": lang,
                 "partial": True,
                 "timestamp": time.time(),
@@ -668,12 +941,15 @@ async def _publish_to_viewers(
     """
     if not room_id:
         return
+    # 발화 확정 — 다음 발화의 첫 부분 결과는 전체 텍스트로 시작한다.
+    _partial_encoder.reset((room_id, target_lang))
     repo = getattr(_room_manager, "_repo", None)
     if repo is None:
         # 메모리 전용 모드 (테스트/기본 룸) — DB 메타데이터가 없어 스킵.
         return
     try:
-        room_row = repo.get_by_id(room_id)
+        # transcript 마다 SQLite 를 읽지 않도록 룸 캐시를 거친다.
+        room_row = get_room_cache().get(room_id, repo.get_by_id)
     except Exception as e:
         print(f"[SSE] 룸 메타 조회 실패: {e!r}")
         return
@@ -692,8 +968,10 @@ async def _publish_to_viewers(
     async def _translate_fn(text, src, dst):
         """Bedrock LLM → AWS Translate fallback (메인 경로와 동일 정책)."""
         # _translate_text 는 동기 함수다 (boto3 호출). 이벤트 루프에서
-        # 직접 호출하면 짧은 시간이지만 블로킹된다 — to_thread 로 격리.
-        return await asyncio.to_thread(
+        # 직접 호출하면 블로킹된다 — 전용 executor 의 secondary 우선순위로
+        # 돌려 메인 언어 번역보다 뒤에 처리되게 한다.
+        return await get_translation_executor().run(
+            room_id,
             _translate_secondary,
             text,
             src,
@@ -701,8 +979,21 @@ async def _publish_to_viewers(
             translate_client,
             bedrock_client,
             bedrock_available,
+            priority=PRIORITY_SECONDARY,
         )
 
+    async def _translate_multi_fn(text, src, langs):
+        """추가 언어 전부를 멀티 타깃 LLM 호출 한 번으로 번역한다.
+
+        LLM 이 내놓은 언어만 흘려보낸다. 빠진 언어(또는 호출 실패 시 전부)는
+        ``_translate_and_publish_batch`` 가 ``_translate_fn`` 으로 한 번에
+        병렬 폴백한다 — 여기서 다시 폴백하면 언어별 순차 호출이 겹친다.
+        """
+        async for lang, translated in _stream_llm_multi_translation(
+            bedrock_client, text, src, langs, room_id=room_id
+        ):
+            yield lang, translated
+
     try:
         await broadcast_translation_for_room(
             _broadcast_manager,
@@ -711,12 +1002,54 @@ async def _publish_to_viewers(
             source_text=source_text,
             source_lang=source_lang,
             translate_fn=_translate_fn,
+            translate_multi_fn=_translate_multi_fn if bedrock_available else None,
         )
     except Exception as e:
         # publish 자체는 절대 raise 해서는 안 되지만, 방어적으로 잡는다.
         print(f"[SSE] publish 실패 (room={room_id}): {e!r}")
 
 
+async def _stream_llm_multi_translation(
+    bedrock_client, text, source_lang, langs, room_id=None
+):
+    """멀티 타깃 Bedrock 스트리밍을 스레드에서 돌리며 (lang, text) 를 흘려보낸다.
+
+    ``_stream_llm_translation`` 과 같은 스레드 + asyncio.Queue 브리지 패턴
+    (전용 번역 executor, secondary 우선순위).
+    Bedrock 실패는 로그만 남기고 조용히 끝낸다 — 호출자가 yield 되지 않은
+    언어를 폴백한다.
+    """
+    loop = asyncio.get_running_loop()
+    q: asyncio.Queue = asyncio.Queue()
+
+    def _worker():
+        try:
+            for lang, translated in translate_with_llm_multi_stream(
+                bedrock_client, text, source_lang, langs
+            ):
+                loop.call_soon_threadsafe(q.put_nowait, ("item", lang, translated))
+        except Exception as e:  # noqa: BLE001 — 폴백 트리거용
+            get_client_pool().report_failure(bedrock_client, e)
+            loop.call_soon_threadsafe(q.put_nowait, ("error", None, repr(e)))
+        else:
+            get_client_pool().report_success(bedrock_client)
+        finally:
+            loop.call_soon_threadsafe(q.put_nowait, ("end", None, None))
+
+    fut = get_translation_executor().run(room_id, _worker, priority=PRIORITY_SECONDARY)
+    try:
+        while True:
+            kind, lang, payload = await q.get()
+            if kind == "end":
+                break
+            if kind == "error":
+                print(f"[Translate] 멀티 타깃 번역 실패, 언어별 폴백: {payload}")
+                continue
+            yield lang, payload
+    finally:
+        await fut
+
+
 def _translate_secondary(
     text, source_lang, target_lang, translate_client, bedrock_client, bedrock_available
 ):
@@ -766,6 +1099,56 @@ def _check_rate_limit(message_timestamps, limit=None):
     return True
 
 
+def _build_speculative_translator(
+    websocket, room_id, translate_client, bedrock_client, bedrock_available
+):
+    """연결 단위 추측 번역기를 만든다.
+
+    문장 번역은 최종 번역과 같은 정책(Bedrock → AWS Translate)으로 전용
+    executor 에서 돌고, 앞에서부터 연속으로 끝난 번역은 오퍼레이터 WS 와 뷰어
+    SSE 메인 채널에 ``translation_partial`` 로 바로 흘려보낸다.
+    """
+
+    async def _prefix_ready(item_id, text, target_lang):
+        await _send_partial(websocket, room_id, text, target_lang)
+
+    return SpeculativeTranslator(
+        _sentence_translator(
+            room_id, translate_client, bedrock_client, bedrock_available
+        ),
+        _prefix_ready,
+    )
+
+
+def _sentence_translator(room_id, translate_client, bedrock_client, bedrock_available):
+    """문장 하나를 번역하는 async 콜백 — ``(text, used_llm)`` 을 돌려준다.
+
+    최종 번역과 같은 정책(Bedrock → AWS Translate)을 전용 executor 의
+    primary 우선순위로 실행한다.
+    """
+
+    async def _translate_sentence(sentence, source_lang, target_lang):
+        return await get_translation_executor().run(
+            room_id,
+            _translate_text,
+            sentence,
+            source_lang,
+            target_lang,
+            translate_client,
+            bedrock_client,
+            bedrock_available,
+            context=_room_context(room_id),
+        )
+
+    return _translate_sentence
+
+
+async def _send_partial(websocket, room_id, text, lang):
+    """누적 부분 번역을 오퍼레이터 WS 와 뷰어 SSE 메인 채널로 보낸다."""
+    await websocket.send(fastpath.dumps({"type": "translation_partial", "text": text}))
+    await _publish_partial_to_viewers(room_id, text, lang)
+
+
 async def handle_openai_websocket(websocket):
     """OpenAI Realtime API와 통합된 WebSocket 핸들러"""
     import collections as _collections
@@ -790,6 +1173,8 @@ async def handle_openai_websocket(websocket):
 
     # Per-connection sliding window for rate limiting
     message_timestamps = _collections.deque()
+    delta_timestamps = _collections.deque()
+    speculative = None
 
     try:
         (
@@ -797,9 +1182,16 @@ async def handle_openai_websocket(websocket):
             bedrock_client,
             bedrock_available,
         ) = _init_translation_clients()
+        speculative = _build_speculative_translator(
+            websocket,
+            user_info.get("room_id"),
+            translate_client,
+            bedrock_client,
+            bedrock_available,
+        )
 
         await websocket.send(
-            json.dumps(
+            fastpath.dumps(
                 {
                     "type": "connection",
                     "status": "connected",
@@ -810,15 +1202,25 @@ async def handle_openai_websocket(websocket):
 
         async for message in websocket:
             try:
-                data = json.loads(message)
+                data = fastpath.loads(message)
 
                 msg_type = data.get("type")
 
-                # Rate limit transcript messages
-                if msg_type == "transcript":
+                # Rate limit transcript / transcript_delta messages
+                if msg_type == "transcript_delta":
+                    if not _check_rate_limit(
+                        delta_timestamps, WS_DELTA_RATE_LIMIT_PER_MINUTE
+                    ):
+                        # 델타에는 응답하지 않는다 — 조용히 버린다.
+                        print(
+                            "[RateLimit] Delta rate limit exceeded for "
+                            f"{websocket.remote_address}"
+                        )
+                        continue
+                elif msg_type == "transcript":
                     if not _check_rate_limit(message_timestamps):
                         await websocket.send(
-                            json.dumps(
+                            fastpath.dumps(
                                 {
                                     "type": "error",
                                     "message": "rate_limit_exceeded",
@@ -845,7 +1247,7 @@ async def handle_openai_websocket(websocket):
                         language_settings["output_lang"],
                     )
                     await websocket.send(
-                        json.dumps(
+                        fastpath.dumps(
                             {
                                 "type": "language_updated",
                                 "input_lang": language_settings["input_lang"],
@@ -868,11 +1270,17 @@ async def handle_openai_websocket(websocket):
                         bedrock_client,
                         bedrock_available,
                         language_settings=language_settings,
+                        speculative=speculative,
+                    )
+
+                elif msg_type == "transcript_delta":
+                    _handle_transcript_delta(
+                        data, user_info, language_settings, speculative
                     )
 
-            except json.JSONDecodeError:
+            except fastpath.JSONDecodeError:
                 await websocket.send(
-                    json.dumps(
+                    fastpath.dumps(
                         {
                             "type": "error",
                             "message": "Invalid JSON format",
@@ -884,7 +1292,7 @@ async def handle_openai_websocket(websocket):
                 # message to the client.
                 print(f"[WebSocket] 메시지 처리 오류: {e!r}")
                 await websocket.send(
-                    json.dumps(
+                    fastpath.dumps(
                         {
                             "type": "error",
                             "message": "메시지 처리 중 오류가 발생했습니다.",
@@ -895,6 +1303,8 @@ async def handle_openai_websocket(websocket):
     except Exception as e:
         print(f"[WebSocket] 연결 오류: {e!r}")
     finally:
+        if speculative is not None:
+            speculative.close()
         # Unregister from the room (no-op if user_info is None / unset).
         try:
             if user_info and user_info.get("room_id"):
@@ -910,6 +1320,49 @@ async def handle_openai_websocket(websocket):
 _WS_SERVER_STARTED = False
 
 
+async def serve_websocket(host: str, port: int):
+    """WebSocket 서버를 현재 이벤트 루프에 띄우고 서버 객체를 반환한다.
+
+    Streamlit daemon thread (``start_websocket_server``) 와 독립 서비스
+    (``realtime_service``) 가 공유하는 기동 절차 — 바인딩, broadcast hub,
+    룸 저장소 복원, 번역 클라이언트 예열. 포트가 이미 사용 중이면 OSError.
+    """
+    global _WS_SERVER_STARTED, _room_manager
+    server = await websockets.serve(handle_openai_websocket, host, port)
+    _WS_SERVER_STARTED = True
+
+    if isinstance(_broadcast_manager, HubPublisher):
+        try:
+            await _broadcast_manager.start()
+        except OSError as e:
+            print(f"[Hub] SSE broadcast hub 시작 실패: {e!r}")
+
+    # ISSUE-26: attach the persistent Room repository, hydrate
+    # waiting/active/inactive rooms from DB, and start the periodic
+    # stale-room cleanup. Best-effort: any failure here only
+    # downgrades to in-memory mode — server continues to start.
+    # 실제 서버가 된 스레드만 수행한다 — 세션마다 _room_manager 를
+    # 갈아치우면 구동 중인 서버의 룸 상태가 오염된다 (#84).
+    try:
+        from database import get_room_model
+
+        repo = get_room_model()
+        _room_manager = RoomManager(room_repository=repo)
+        loaded = _room_manager.hydrate_from_db()
+        if loaded:
+            print(f"[Room] DB 복원: {loaded}개 룸")
+    except Exception as e:
+        print(f"[Room] 영속 저장소 연결 실패 — 메모리 전용 모드: {e!r}")
+
+    # 첫 오퍼레이터 연결 전에 boto3 클라이언트를 만들어 둔다.
+    await asyncio.to_thread(_warm_up_translation_clients)
+
+    print(f"[WebSocket] 서버 시작 완료 (OpenAI 모드): ws://{host}:{port}")
+    # 룸 auto-timeout 정리 루프는 #86 에서 제거 — 룸 종료는
+    # admin 강제 종료(force_close)로만 수행한다.
+    return server
+
+
 def start_websocket_server(port_ref):
     """WebSocket 서버 시작 (WS_PORT 고정, 프로세스 단위 싱글턴)
 
@@ -921,7 +1374,6 @@ def start_websocket_server(port_ref):
     Args:
         port_ref: 포트를 저장할 dict ({"port": None})
     """
-    global _WS_SERVER_STARTED
     ws_port = int(os.getenv("WS_PORT", "8765"))
     port_ref["port"] = ws_port
 
@@ -930,17 +1382,12 @@ def start_websocket_server(port_ref):
         return
 
     try:
-        loop = asyncio.new_event_loop()
+        loop = fastpath.new_event_loop()
         asyncio.set_event_loop(loop)
 
         async def run_server():
-            global _WS_SERVER_STARTED, _room_manager
             try:
-                server = await websockets.serve(
-                    handle_openai_websocket,
-                    "0.0.0.0",
-                    ws_port,
-                )
+                server = await serve_websocket("0.0.0.0", ws_port)
             except OSError:
                 # 다른 세션 스레드가 먼저 바인딩함 — 그 서버를 재사용.
                 print(
@@ -948,29 +1395,11 @@ def start_websocket_server(port_ref):
                     f"ws://0.0.0.0:{ws_port}"
                 )
                 return
-            _WS_SERVER_STARTED = True
-
-            # ISSUE-26: attach the persistent Room repository, hydrate
-            # waiting/active/inactive rooms from DB, and start the periodic
-            # stale-room cleanup. Best-effort: any failure here only
-            # downgrades to in-memory mode — server continues to start.
-            # 실제 서버가 된 스레드만 수행한다 — 세션마다 _room_manager 를
-            # 갈아치우면 구동 중인 서버의 룸 상태가 오염된다 (#84).
             try:
-                from database import get_room_model
-
-                repo = get_room_model()
-                _room_manager = RoomManager(room_repository=repo)
-                loaded = _room_manager.hydrate_from_db()
-                if loaded:
-                    print(f"[Room] DB 복원: {loaded}개 룸")
-            except Exception as e:
-                print(f"[Room] 영속 저장소 연결 실패 — 메모리 전용 모드: {e!r}")
-
-            print(f"[WebSocket] 서버 시작 완료 (OpenAI 모드): ws://0.0.0.0:{ws_port}")
-            # 룸 auto-timeout 정리 루프는 #86 에서 제거 — 룸 종료는
-            # admin 강제 종료(force_close)로만 수행한다.
-            await server.wait_closed()
+                await server.wait_closed()
+            finally:
+                # 루프가 닫히기 전에 async Bedrock 세션의 커넥터를 정리한다.
+                await close_async_bedrock_clients()
 
         loop.run_until_complete(run_server())
     except Exception as e: